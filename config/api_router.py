@@ -4,4 +4,6 @@ from django.urls import path
 app_name = "api"
 urlpatterns = [
     path("v1/registration/", include("gdg_registration_backend.apps.gdg_registration.urls")),
+    path("v1/notifications/", include("gdg_registration_backend.apps.gdg_notifications.urls")),
+    path("v1/jobs/", include("gdg_registration_backend.apps.gdg_jobs.urls")),
 ]
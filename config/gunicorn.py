@@ -0,0 +1,8 @@
+"""Gunicorn server hooks, loaded by compose/production/django/start."""
+
+from prometheus_client import multiprocess
+
+
+def child_exit(server, worker):
+    # Drop the gauges of a worker that exited, its counters keep adding up
+    multiprocess.mark_process_dead(worker.pid)
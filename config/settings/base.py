@@ -51,6 +51,10 @@ LOCALE_PATHS = [str(BASE_DIR / "locale")]
 # https://docs.djangoproject.com/en/dev/ref/settings/#databases
 DATABASES = {"default": env.db("DATABASE_URL")}
 DATABASES["default"]["ATOMIC_REQUESTS"] = True
+# Optional read replica for organizer reads, see gdg_registration_backend/replicas.py
+if env("DATABASE_REPLICA_URL", default=""):
+    DATABASES["replica"] = env.db("DATABASE_REPLICA_URL")
+DATABASE_ROUTERS = ["gdg_registration_backend.replicas.ReplicaRouter"]
 # https://docs.djangoproject.com/en/stable/ref/settings/#std:setting-DEFAULT_AUTO_FIELD
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -92,6 +96,9 @@ LOCAL_APPS = [
     "gdg_registration_backend.apps.gdg_registration",
     "gdg_registration_backend.apps.gdg_participants",
     "gdg_registration_backend.apps.gdg_events",
+    "gdg_registration_backend.apps.gdg_notifications",
+    "gdg_registration_backend.apps.gdg_jobs",
+    "gdg_registration_backend.apps.gdg_profiling",
     # Your stuff: custom apps go here
 ]
 # https://docs.djangoproject.com/en/dev/ref/settings/#installed-apps
@@ -140,9 +147,16 @@ AUTH_PASSWORD_VALIDATORS = [
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#middleware
 MIDDLEWARE = [
+    "gdg_registration_backend.logs.RequestLogMiddleware",
+    "gdg_registration_backend.metrics.MetricsMiddleware",
+    "gdg_registration_backend.apps.gdg_profiling.profiler.ProfilingMiddleware",
+    # Outside the query stats, which would otherwise count its own writes
+    "gdg_registration_backend.apps.gdg_profiling.slow_queries.SlowQueryMiddleware",
+    "gdg_registration_backend.db.queries.QueryStatsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "gdg_registration_backend.replicas.PrimaryPinMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -253,15 +267,26 @@ DJANGO_ADMIN_FORCE_ALLAUTH = env.bool("DJANGO_ADMIN_FORCE_ALLAUTH", default=Fals
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
+    'filters': {
+        'request_context': {'()': 'gdg_registration_backend.logs.RequestContextFilter'},
+        # Share of DEBUG records kept, e.g. of the SQL logged when DEBUG is on
+        'sample_debug': {
+            '()': 'gdg_registration_backend.logs.SamplingFilter',
+            'rate': env.float('LOG_DEBUG_SAMPLE_RATE', default=1.0),
+        },
+    },
     'formatters': {
         'verbose': {
-            'format': '{levelname} {asctime} {module} {message}',
+            'format': '{levelname} {asctime} {module} {request_id} {message}',
             'style': '{',
         },
         'simple': {
             'format': '{levelname} {message}',
             'style': '{',
         },
+        'json': {
+            '()': 'gdg_registration_backend.logs.JsonFormatter',
+        },
     },
     'handlers': {
         'console': {
@@ -273,14 +298,22 @@ LOGGING = {
             'level': 'ERROR',
             'class': 'logging.FileHandler',
             'filename': 'app_errors.log',
-            'formatter': 'verbose',
+            'formatter': 'json',
+        },
+        # Loggers only write to this queue, a background thread feeds the
+        # handlers above, see gdg_registration_backend/logs.py
+        'queue': {
+            '()': 'gdg_registration_backend.logs.ListenerQueueHandler',
+            'handlers': ['cfg://handlers.console', 'cfg://handlers.file'],
+            'filters': ['request_context', 'sample_debug'],
         },
     },
+    'root': {'level': 'INFO', 'handlers': ['queue']},
     'loggers': {
         'django': {
-            'handlers': ['console', 'file'],
+            'handlers': ['queue'],
             'level': 'DEBUG',
-            'propagate': True,
+            'propagate': False,
         },
     },
 }
@@ -336,3 +369,33 @@ SPECTACULAR_SETTINGS = {
 }
 # Your stuff...
 # ------------------------------------------------------------------------------
+# Background jobs are queued in Redis when set, in the database otherwise
+JOBS_REDIS_URL = env("REDIS_URL", default="")
+# Seconds a running job may go without reporting progress before workers take
+# its worker for dead and fail it
+JOBS_HEARTBEAT_TIMEOUT = env.int("JOBS_HEARTBEAT_TIMEOUT", default=600)
+# Live registration feed fan-out goes through Redis pub/sub when set, stays in
+# the process otherwise
+FEED_REDIS_URL = env("REDIS_URL", default="")
+# Seconds a client reads from the primary after a write, replica lag included
+REPLICA_PIN_SECONDS = env.int("REPLICA_PIN_SECONDS", default=5)
+# Per-request query count, DB time and Server-Timing headers, with a warning
+# for views over their query_budget, see gdg_registration_backend/db/queries.py
+QUERY_STATS = env.bool("DJANGO_QUERY_STATS", default=False)
+# Bearer token Prometheus sends to scrape /metrics, which is off without it
+# outside DEBUG, see gdg_registration_backend/metrics.py
+METRICS_TOKEN = env("METRICS_TOKEN", default="")
+# Share of requests run under cProfile, on top of those sent with a staff
+# X-Profile-Token, see gdg_registration_backend/apps/gdg_profiling/profiler.py
+PROFILING_SAMPLE_RATE = env.float("PROFILING_SAMPLE_RATE", default=0.0)
+# Seconds a profiling token is valid for
+PROFILING_TOKEN_MAX_AGE = env.int("PROFILING_TOKEN_MAX_AGE", default=3600)
+# Profiles kept, the oldest are deleted beyond that
+PROFILING_KEEP = env.int("PROFILING_KEEP", default=200)
+# Event list entries cached per registration version, in each process and in
+# the default cache, see gdg_registration_backend/apps/gdg_registration/fragments.py
+FRAGMENT_CACHE_LOCAL_SIZE = env.int("FRAGMENT_CACHE_LOCAL_SIZE", default=10000)
+FRAGMENT_CACHE_TIMEOUT = env.int("FRAGMENT_CACHE_TIMEOUT", default=24 * 3600)
+# Milliseconds from which a query is logged, explained and added to the admin's
+# slow queries, 0 turns it off, see gdg_registration_backend/apps/gdg_profiling/slow_queries.py
+SLOW_QUERY_MS = env.float("SLOW_QUERY_MS", default=0.0)
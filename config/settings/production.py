@@ -14,7 +14,23 @@ ALLOWED_HOSTS = env.list("DJANGO_ALLOWED_HOSTS", default=["devfest.gdgkolachi.co
 
 # DATABASES
 # ------------------------------------------------------------------------------
-DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)
+# Each worker process borrows connections from a pool per database instead of
+# holding one per thread, see gdg_registration_backend/db/postgresql_pool
+for database in DATABASES.values():
+    if env.bool("DATABASE_POOL", default=True):
+        database["ENGINE"] = "gdg_registration_backend.db.postgresql_pool"
+        database["CONN_MAX_AGE"] = 0
+        database["CONN_HEALTH_CHECKS"] = True
+        database.setdefault("OPTIONS", {})["pool"] = {
+            "min_size": env.int("DATABASE_POOL_MIN_SIZE", default=2),
+            "max_size": env.int("DATABASE_POOL_MAX_SIZE", default=10),
+            # Seconds a request waits for a free connection before failing
+            "timeout": env.float("DATABASE_POOL_TIMEOUT", default=10),
+            "max_idle": env.float("DATABASE_POOL_MAX_IDLE", default=300),
+            "max_lifetime": env.float("DATABASE_POOL_MAX_LIFETIME", default=3600),
+        }
+    else:
+        database["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)
 
 # CACHES
 # ------------------------------------------------------------------------------
@@ -110,18 +126,22 @@ ANYMAIL = {}
 # https://docs.djangoproject.com/en/dev/ref/settings/#logging
 # See https://docs.djangoproject.com/en/dev/topics/logging for
 # more details on how to customize your logging configuration.
-# A sample logging configuration. The only tangible logging
-# performed by this configuration is to send an email to
-# the site admins on every HTTP 500 error when DEBUG=False.
+# Records go to stdout as JSON lines. Errors of django.request also email the
+# site admins when DEBUG=False.
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
-    "filters": {"require_debug_false": {"()": "django.utils.log.RequireDebugFalse"}},
-    "formatters": {
-        "verbose": {
-            "format": "%(levelname)s %(asctime)s %(module)s %(process)d %(thread)d %(message)s",
+    "filters": {
+        "require_debug_false": {"()": "django.utils.log.RequireDebugFalse"},
+        "request_context": {"()": "gdg_registration_backend.logs.RequestContextFilter"},
+        "sample_debug": {
+            "()": "gdg_registration_backend.logs.SamplingFilter",
+            "rate": env.float("LOG_DEBUG_SAMPLE_RATE", default=0.01),
         },
     },
+    "formatters": {
+        "json": {"()": "gdg_registration_backend.logs.JsonFormatter"},
+    },
     "handlers": {
         "mail_admins": {
             "level": "ERROR",
@@ -131,19 +151,31 @@ LOGGING = {
         "console": {
             "level": "DEBUG",
             "class": "logging.StreamHandler",
-            "formatter": "verbose",
+            "formatter": "json",
+        },
+        # Loggers only write to these queues, background threads feed the
+        # handlers above, see gdg_registration_backend/logs.py
+        "queue": {
+            "()": "gdg_registration_backend.logs.ListenerQueueHandler",
+            "handlers": ["cfg://handlers.console"],
+            "filters": ["request_context", "sample_debug"],
+        },
+        "mail_queue": {
+            "()": "gdg_registration_backend.logs.ListenerQueueHandler",
+            "handlers": ["cfg://handlers.mail_admins"],
+            "filters": ["request_context"],
         },
     },
-    "root": {"level": "INFO", "handlers": ["console"]},
+    "root": {"level": env("DJANGO_LOG_LEVEL", default="INFO"), "handlers": ["queue"]},
     "loggers": {
         "django.request": {
-            "handlers": ["mail_admins"],
+            "handlers": ["mail_queue"],
             "level": "ERROR",
             "propagate": True,
         },
         "django.security.DisallowedHost": {
             "level": "ERROR",
-            "handlers": ["console", "mail_admins"],
+            "handlers": ["mail_queue"],
             "propagate": True,
         },
     },
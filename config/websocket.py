@@ -1,13 +1,79 @@
-async def websocket_application(scope, receive, send):
+"""
+Websocket endpoint for organizer dashboards.
+
+Besides ``ping``, clients send JSON commands to follow the live feed of an
+event and receive every message published to it:
+
+    {"action": "subscribe", "event_type": "HACKATHON"}
+    {"action": "unsubscribe", "event_type": "HACKATHON"}
+"""
+
+import asyncio
+import contextlib
+import json
+
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_registration.feed import event_channel
+from gdg_registration_backend.apps.gdg_registration.feed import get_broker
+
+
+async def send_json(send, data):
+    await send({"type": "websocket.send", "text": json.dumps(data)})
+
+
+async def forward_feed(subscriber, send):
     while True:
-        event = await receive()
+        await send_json(send, await subscriber.get())
+
+
+async def handle_command(text, broker, subscriber, send):
+    try:
+        command = json.loads(text)
+        action = command["action"]
+        event_type = command["event_type"]
+    except (ValueError, TypeError, KeyError):
+        await send_json(send, {"type": "error", "error": "Invalid command."})
+        return
+
+    if event_type not in EventTypes._value2member_map_:
+        await send_json(send, {"type": "error", "error": "Invalid event type."})
+        return
+
+    if action == "subscribe":
+        await broker.subscribe(subscriber, event_channel(event_type))
+        await send_json(send, {"type": "subscribed", "event_type": event_type})
+    elif action == "unsubscribe":
+        broker.unsubscribe(subscriber, event_channel(event_type))
+        await send_json(send, {"type": "unsubscribed", "event_type": event_type})
+    else:
+        await send_json(send, {"type": "error", "error": f"Unknown action: {action}"})
+
+
+async def websocket_application(scope, receive, send):
+    broker = get_broker()
+    subscriber = broker.subscriber()
+    forwarder = None
+
+    try:
+        while True:
+            event = await receive()
 
-        if event["type"] == "websocket.connect":
-            await send({"type": "websocket.accept"})
+            if event["type"] == "websocket.connect":
+                await send({"type": "websocket.accept"})
+                forwarder = asyncio.create_task(forward_feed(subscriber, send))
 
-        if event["type"] == "websocket.disconnect":
-            break
+            if event["type"] == "websocket.disconnect":
+                break
 
-        if event["type"] == "websocket.receive":
-            if event["text"] == "ping":
-                await send({"type": "websocket.send", "text": "pong!"})
+            if event["type"] == "websocket.receive":
+                text = event.get("text")
+                if text == "ping":
+                    await send({"type": "websocket.send", "text": "pong!"})
+                elif text:
+                    await handle_command(text, broker, subscriber, send)
+    finally:
+        broker.close(subscriber)
+        if forwarder:
+            forwarder.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await forwarder
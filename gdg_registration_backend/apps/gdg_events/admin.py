@@ -4,7 +4,7 @@ from .models import  Event
 # Register Event model
 @admin.register(Event)
 class EventAdmin(admin.ModelAdmin):
-    list_display = ('name', 'event_type', 'description')
+    list_display = ('name', 'event_type', 'capacity', 'description')
     search_fields = ('name', 'event_type')
     list_filter = ('event_type',)
 
@@ -6,6 +6,8 @@ class Event(models.Model):
     name = models.CharField(max_length=255)
     event_type = models.CharField(max_length=50, choices=[(tag.name, tag.value) for tag in EventTypes])
     description = models.TextField(null=True)
+    # Number of seats available; None means the event is not capped and has no waitlist.
+    capacity = models.PositiveIntegerField(null=True, blank=True)
 
     class Meta:
         constraints = [
@@ -0,0 +1,27 @@
+from django.contrib import admin
+
+from .models import Job
+from .runner import cancel_job
+
+
+# Register Job model
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ('task', 'status', 'progress_display', 'message', 'created_by', 'worker', 'created_at', 'finished_at')
+    search_fields = ('task',)
+    list_filter = ('status', 'task')
+    readonly_fields = ('progress_done', 'progress_total', 'message', 'result', 'error', 'cancel_requested', 'worker', 'started_at', 'finished_at')
+    actions = ('cancel_jobs',)
+
+    @admin.display(description='progress')
+    def progress_display(self, obj):
+        return "-" if obj.progress is None else f"{obj.progress:.1%}"
+
+    @admin.action(description='Cancel selected jobs')
+    def cancel_jobs(self, request, queryset):
+        for job_id in queryset.values_list('id', flat=True):
+            try:
+                cancel_job(job_id)
+            except ValueError:
+                # Finished jobs are left as they are
+                pass
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class GdgJobsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'gdg_registration_backend.apps.gdg_jobs'
+
+    def ready(self):
+        # Register the tasks declared in every app's tasks.py
+        autodiscover_modules("tasks")
@@ -0,0 +1,72 @@
+"""
+Queue backends carrying job ids from ``enqueue_job`` to the workers.
+
+``RedisQueue`` wakes a worker as soon as a job is queued with ``BRPOP``.
+``DatabaseQueue`` polls the job table and needs nothing but the database, so
+local runs and tests work without Redis. Either way the ``Job`` row stays the
+source of truth: workers claim a job with a conditional UPDATE, so an id that
+is delivered twice runs once.
+"""
+
+import functools
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from gdg_registration_backend.apps.gdg_jobs.enums import JobStatus
+from gdg_registration_backend.apps.gdg_jobs.models import Job
+
+REDIS_QUEUE_KEY = "gdg:jobs:queue"
+
+
+class DatabaseQueue:
+    def push(self, job_id: int) -> None:
+        # The QUEUED row is the queue entry
+        pass
+
+    def pop(self, timeout: float, older_than: float = 0) -> int | None:
+        """Oldest queued job id, waiting up to ``timeout`` seconds for one."""
+        deadline = time.monotonic() + timeout
+        while True:
+            queued = Job.objects.filter(status=JobStatus.QUEUED.value)
+            if older_than:
+                queued = queued.filter(created_at__lte=timezone.now() - timedelta(seconds=older_than))
+            job_id = queued.order_by("created_at", "id").values_list("id", flat=True).first()
+            if job_id is not None or time.monotonic() >= deadline:
+                return job_id
+            time.sleep(min(1.0, max(0.0, deadline - time.monotonic())))
+
+
+class RedisQueue:
+    # Queued jobs whose push was lost (Redis down at enqueue time) are picked up
+    # from the database once they are this many seconds old
+    sweep_after = 60
+
+    def __init__(self, url: str, key: str = REDIS_QUEUE_KEY):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.key = key
+        self.fallback = DatabaseQueue()
+
+    def push(self, job_id: int) -> None:
+        self.client.lpush(self.key, job_id)
+
+    def pop(self, timeout: float) -> int | None:
+        item = self.client.brpop([self.key], timeout=max(1, int(timeout)))
+        if item:
+            return int(item[1])
+        return self.fallback.pop(0, older_than=self.sweep_after)
+
+
+@functools.cache
+def _redis_queue(url: str) -> RedisQueue:
+    return RedisQueue(url)
+
+
+def get_queue() -> DatabaseQueue | RedisQueue:
+    """Redis when ``JOBS_REDIS_URL`` is set, the database otherwise."""
+    url = getattr(settings, "JOBS_REDIS_URL", "")
+    return _redis_queue(url) if url else DatabaseQueue()
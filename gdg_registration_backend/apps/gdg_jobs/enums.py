@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class JobStatus(Enum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+
+    @classmethod
+    def finished_statuses(cls):
+        return [cls.SUCCEEDED.value, cls.FAILED.value, cls.CANCELLED.value]
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from gdg_registration_backend.apps.gdg_jobs.runner import work
+from gdg_registration_backend.apps.gdg_jobs.runner import worker_name
+
+
+class Command(BaseCommand):
+    help = "Run queued background jobs until interrupted, or once with --once."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval", type=float, default=5.0,
+            help="Seconds to wait for a job before polling again.",
+        )
+        parser.add_argument("--once", action="store_true", help="Run the queued jobs and exit.")
+
+    def handle(self, *args, **options):
+        worker = worker_name()
+        self.stdout.write(f"Worker {worker} waiting for jobs")
+        ran = work(once=options["once"], interval=options["interval"], worker=worker)
+        self.stdout.write(self.style.SUCCESS(f"Ran {ran} jobs"))
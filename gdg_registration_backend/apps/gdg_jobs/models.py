@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.db import models
+
+from gdg_registration_backend.apps.gdg_jobs.enums import JobStatus
+
+
+class Job(models.Model):
+    """
+    A long-running operation run by a ``run_jobs`` worker instead of inside the
+    request that asked for it. The row is the source of truth for the status,
+    progress and result; the queue backend only carries job ids.
+    """
+
+    # Name the task was registered under, e.g. "registration.status_participants"
+    task = models.CharField(max_length=255)
+    kwargs = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=[(tag.name, tag.value) for tag in JobStatus], default=JobStatus.QUEUED.value)
+    progress_done = models.PositiveIntegerField(default=0)
+    progress_total = models.PositiveIntegerField(null=True, blank=True)
+    message = models.CharField(max_length=255, blank=True, default="")
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(null=True, blank=True)
+    # Set on running jobs, the task stops at its next progress checkpoint
+    cancel_requested = models.BooleanField(default=False)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL, related_name="+"
+    )
+    # host:pid of the worker running the job
+    worker = models.CharField(max_length=255, blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "created_at"], name="job_queue"),
+        ]
+
+    def __str__(self):
+        return f"{self.task} #{self.pk} ({self.status})"
+
+    @property
+    def progress(self) -> float | None:
+        """Share of the work done, between 0 and 1, or None while unknown."""
+        if self.status == JobStatus.SUCCEEDED.value:
+            return 1.0
+        if not self.progress_total:
+            return None
+        return min(1.0, self.progress_done / self.progress_total)
@@ -0,0 +1,59 @@
+"""
+Task registry and the context handed to running tasks.
+
+Tasks are plain functions registered with ``@task("app.name")`` in an app's
+``tasks.py``. They receive a ``JobContext`` followed by the job's JSON kwargs
+and return a JSON-serialisable result.
+"""
+
+from collections.abc import Callable
+
+from django.utils import timezone
+
+from gdg_registration_backend.apps.gdg_jobs.enums import JobStatus
+from gdg_registration_backend.apps.gdg_jobs.models import Job
+
+TASKS: dict[str, Callable] = {}
+
+
+class JobCancelled(Exception):
+    """Raised at a progress checkpoint of a job whose cancellation was requested."""
+
+
+def task(name: str):
+    def register(func):
+        if name in TASKS and TASKS[name] is not func:
+            msg = f"Task {name} is already registered."
+            raise ValueError(msg)
+        TASKS[name] = func
+        return func
+
+    return register
+
+
+class JobContext:
+    def __init__(self, job: Job):
+        self.job = job
+
+    @property
+    def actor(self):
+        """The user who queued the job, recorded as the actor of its changes."""
+        return self.job.created_by
+
+    def progress(self, done: int, total: int | None = None, message: str = "") -> None:
+        """
+        Publish progress and stop the task with ``JobCancelled`` if it was
+        cancelled meanwhile, or failed as lost. Tasks call it between units of
+        work that are safe to stop after, at least every
+        ``JOBS_HEARTBEAT_TIMEOUT`` seconds: ``updated_at`` is the heartbeat.
+        """
+        fields = {"progress_done": done, "message": message[:255], "updated_at": timezone.now()}
+        if total is not None:
+            fields["progress_total"] = total
+        if not Job.objects.filter(pk=self.job.pk, status=JobStatus.RUNNING.value).update(**fields):
+            raise JobCancelled
+        self.check_cancelled()
+
+    def check_cancelled(self) -> None:
+        if Job.objects.filter(pk=self.job.pk, cancel_requested=True).exists():
+            raise JobCancelled
@@ -0,0 +1,159 @@
+"""
+Queues, runs and cancels jobs.
+
+``enqueue_job`` writes the ``Job`` row in the caller's transaction and pushes
+its id to the queue once that transaction commits, so a worker never picks up
+a job whose request was rolled back. Tasks run outside any surrounding
+transaction: each unit of work commits on its own, which is what lets progress
+and cancellation be seen while the job runs.
+
+``JobContext.progress`` doubles as the job's heartbeat. Workers periodically
+fail the RUNNING jobs that have not reported progress for
+``JOBS_HEARTBEAT_TIMEOUT`` seconds, whose worker died mid-task. They are not
+queued again, since the task may already have applied part of its work.
+"""
+
+import logging
+import os
+import socket
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connections
+from django.db import transaction
+from django.utils import timezone
+
+from gdg_registration_backend.apps.gdg_jobs.backends import get_queue
+from gdg_registration_backend.apps.gdg_jobs.enums import JobStatus
+from gdg_registration_backend.apps.gdg_jobs.models import Job
+from gdg_registration_backend.apps.gdg_jobs.registry import TASKS
+from gdg_registration_backend.apps.gdg_jobs.registry import JobCancelled
+from gdg_registration_backend.apps.gdg_jobs.registry import JobContext
+
+logger = logging.getLogger(__name__)
+
+# Seconds between two sweeps for lost jobs by a worker
+LOST_JOB_SWEEP_INTERVAL = 60
+
+
+def _push(job_id: int) -> None:
+    try:
+        get_queue().push(job_id)
+    except Exception:
+        # The job stays QUEUED and is found by the workers' database sweep
+        logger.exception("Could not push job %s to the queue", job_id)
+
+
+def enqueue_job(task_name: str, actor=None, **kwargs) -> Job:
+    if task_name not in TASKS:
+        raise ValueError(f"Unknown task: {task_name}")
+
+    job = Job.objects.create(task=task_name, kwargs=kwargs, created_by=actor)
+    transaction.on_commit(lambda: _push(job.id))
+    return job
+
+
+def cancel_job(job_id: int) -> Job:
+    """
+    Cancel a queued job outright, or ask a running one to stop at its next
+    progress checkpoint.
+    """
+    job = Job.objects.filter(pk=job_id).first()
+    if not job:
+        raise ValueError("Job not found.")
+
+    now = timezone.now()
+    Job.objects.filter(pk=job_id, status=JobStatus.QUEUED.value).update(
+        status=JobStatus.CANCELLED.value, cancel_requested=True, finished_at=now, updated_at=now,
+    )
+    Job.objects.filter(pk=job_id, status=JobStatus.RUNNING.value).update(
+        cancel_requested=True, updated_at=now,
+    )
+    job.refresh_from_db()
+    if job.status in (JobStatus.SUCCEEDED.value, JobStatus.FAILED.value):
+        raise ValueError(f"Job already {job.status.lower()}.")
+    return job
+
+
+def worker_name() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _finish(job: Job, status: str, **fields) -> None:
+    now = timezone.now()
+    # A job failed as lost meanwhile keeps that status
+    Job.objects.filter(pk=job.pk, status=JobStatus.RUNNING.value).update(
+        status=status, finished_at=now, updated_at=now, **fields
+    )
+
+
+def fail_lost_jobs() -> int:
+    """Fail the RUNNING jobs without a heartbeat for ``JOBS_HEARTBEAT_TIMEOUT`` seconds."""
+    now = timezone.now()
+    timeout = settings.JOBS_HEARTBEAT_TIMEOUT
+    lost = Job.objects.filter(
+        status=JobStatus.RUNNING.value, updated_at__lt=now - timedelta(seconds=timeout)
+    ).update(
+        status=JobStatus.FAILED.value,
+        error=f"Worker lost: no progress for {timeout} seconds",
+        finished_at=now,
+        updated_at=now,
+    )
+    if lost:
+        logger.warning("Failed %s running jobs whose worker was lost", lost)
+    return lost
+
+
+def run_job(job_id: int, worker: str = "") -> Job | None:
+    """Claim and run one job, returns None when another worker claimed it first."""
+    now = timezone.now()
+    claimed = Job.objects.filter(pk=job_id, status=JobStatus.QUEUED.value).update(
+        status=JobStatus.RUNNING.value, started_at=now, updated_at=now, worker=worker,
+    )
+    if not claimed:
+        return None
+
+    job = Job.objects.select_related("created_by").get(pk=job_id)
+    func = TASKS.get(job.task)
+    try:
+        if func is None:
+            raise LookupError(f"Unknown task: {job.task}")
+        result = func(JobContext(job), **job.kwargs)
+    except JobCancelled:
+        _finish(job, JobStatus.CANCELLED.value)
+    except Exception as e:
+        logger.exception("Job %s (%s) failed", job.pk, job.task)
+        _finish(job, JobStatus.FAILED.value, error=f"{type(e).__name__}: {e}")
+    else:
+        _finish(job, JobStatus.SUCCEEDED.value, result=result)
+
+    job.refresh_from_db()
+    return job
+
+
+def work(once: bool = False, interval: float = 5.0, worker: str = "") -> int:
+    """
+    Run queued jobs until interrupted, or until the queue is empty with
+    ``once``. Returns the number of jobs run.
+    """
+    queue = get_queue()
+    worker = worker or worker_name()
+    ran = 0
+    next_sweep = 0.0
+    while True:
+        if time.monotonic() >= next_sweep:
+            fail_lost_jobs()
+            next_sweep = time.monotonic() + LOST_JOB_SWEEP_INTERVAL
+        job_id = queue.pop(0 if once else interval)
+        if job_id is None:
+            if once:
+                return ran
+            continue
+        # Drop connections the database closed while the worker was idle, the
+        # way Django does between requests
+        for conn in connections.all(initialized_only=True):
+            if not conn.in_atomic_block:
+                conn.close_if_unusable_or_obsolete()
+        if run_job(job_id, worker):
+            ran += 1
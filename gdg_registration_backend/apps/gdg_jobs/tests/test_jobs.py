@@ -0,0 +1,203 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from gdg_registration_backend.apps.gdg_jobs import backends
+from gdg_registration_backend.apps.gdg_jobs.enums import JobStatus
+from gdg_registration_backend.apps.gdg_jobs.models import Job
+from gdg_registration_backend.apps.gdg_jobs.registry import task
+from gdg_registration_backend.apps.gdg_jobs.runner import cancel_job
+from gdg_registration_backend.apps.gdg_jobs.runner import enqueue_job
+from gdg_registration_backend.apps.gdg_jobs.runner import fail_lost_jobs
+from gdg_registration_backend.apps.gdg_jobs.runner import run_job
+from gdg_registration_backend.apps.gdg_jobs.runner import work
+
+pytestmark = pytest.mark.django_db
+
+
+@task("tests.count")
+def count(context, to):
+    for done in range(1, to + 1):
+        context.progress(done, to)
+    return {"counted": to}
+
+
+@task("tests.fail")
+def fail(context):
+    raise RuntimeError("boom")
+
+
+@task("tests.cancel_midway")
+def cancel_midway(context, to):
+    for done in range(1, to + 1):
+        if done == 3:
+            cancel_job(context.job.pk)
+        context.progress(done, to)
+    return {"counted": to}
+
+
+@task("tests.outlive_heartbeat")
+def outlive_heartbeat(context):
+    # Another worker takes this one for dead before its first checkpoint
+    Job.objects.filter(pk=context.job.pk).update(updated_at=timezone.now() - timedelta(hours=1))
+    fail_lost_jobs()
+    context.progress(1, 2)
+    return {"counted": 2}
+
+
+class FakeRedis:
+    def __init__(self):
+        self.items = []
+
+    def lpush(self, key, value):
+        self.items.insert(0, str(value).encode())
+
+    def brpop(self, keys, timeout):
+        return (keys[0], self.items.pop()) if self.items else None
+
+
+class TestRunner:
+    def test_runs_queued_jobs(self, user):
+        job = enqueue_job("tests.count", actor=user, to=4)
+
+        assert work(once=True) == 1
+
+        job.refresh_from_db()
+        assert job.status == JobStatus.SUCCEEDED.value
+        assert job.result == {"counted": 4}
+        assert (job.progress_done, job.progress_total, job.progress) == (4, 4, 1)
+        assert job.created_by == user
+        assert job.started_at <= job.finished_at
+
+    def test_failure_is_recorded(self):
+        job = enqueue_job("tests.fail")
+
+        work(once=True)
+
+        job.refresh_from_db()
+        assert job.status == JobStatus.FAILED.value
+        assert job.error == "RuntimeError: boom"
+
+    def test_unknown_task(self):
+        with pytest.raises(ValueError, match="Unknown task"):
+            enqueue_job("tests.missing")
+
+    def test_job_runs_once(self):
+        job = enqueue_job("tests.count", to=1)
+
+        assert run_job(job.id)
+        assert run_job(job.id) is None
+
+
+class TestLostJobs:
+    def test_running_job_without_heartbeat_is_failed(self, settings):
+        settings.JOBS_HEARTBEAT_TIMEOUT = 60
+        now = timezone.now()
+        lost = Job.objects.create(task="tests.count", status=JobStatus.RUNNING.value)
+        alive = Job.objects.create(task="tests.count", status=JobStatus.RUNNING.value)
+        Job.objects.filter(pk=lost.pk).update(updated_at=now - timedelta(seconds=61))
+        Job.objects.filter(pk=alive.pk).update(updated_at=now - timedelta(seconds=59))
+
+        assert work(once=True) == 0
+
+        lost.refresh_from_db()
+        alive.refresh_from_db()
+        assert (lost.status, alive.status) == (JobStatus.FAILED.value, JobStatus.RUNNING.value)
+        assert lost.error == "Worker lost: no progress for 60 seconds"
+        assert lost.finished_at
+
+    def test_job_failed_as_lost_stops_at_next_checkpoint(self):
+        job = enqueue_job("tests.outlive_heartbeat")
+
+        work(once=True)
+
+        job.refresh_from_db()
+        assert job.status == JobStatus.FAILED.value
+        assert job.progress_done == 0
+        assert job.result is None
+
+
+class TestCancellation:
+    def test_cancel_queued_job(self):
+        job = enqueue_job("tests.count", to=2)
+
+        cancel_job(job.id)
+
+        assert work(once=True) == 0
+        job.refresh_from_db()
+        assert job.status == JobStatus.CANCELLED.value
+        assert job.progress_done == 0
+
+    def test_running_job_stops_at_next_checkpoint(self):
+        job = enqueue_job("tests.cancel_midway", to=10)
+
+        work(once=True)
+
+        job.refresh_from_db()
+        assert job.status == JobStatus.CANCELLED.value
+        assert job.progress_done == 3
+        assert job.result is None
+
+    def test_finished_job_cannot_be_cancelled(self):
+        job = enqueue_job("tests.count", to=1)
+        work(once=True)
+
+        with pytest.raises(ValueError, match="already succeeded"):
+            cancel_job(job.id)
+
+
+def test_redis_queue_pushes_on_commit(settings, django_capture_on_commit_callbacks):
+    settings.JOBS_REDIS_URL = "redis://localhost:6379/0"
+    queue = backends.get_queue()
+    queue.client = FakeRedis()
+    try:
+        with django_capture_on_commit_callbacks(execute=True):
+            job = enqueue_job("tests.count", to=1)
+            # Nothing is pushed before the transaction commits
+            assert not queue.client.items
+
+        assert queue.pop(1) == job.id
+        assert queue.pop(1) is None
+    finally:
+        backends._redis_queue.cache_clear()  # noqa: SLF001
+
+
+class TestJobAPI:
+    def test_status(self, admin_client):
+        job = enqueue_job("tests.count", to=3)
+        work(once=True)
+
+        response = admin_client.get(reverse("api:job_status", args=[job.id]))
+
+        assert response.status_code == 200
+        assert response.json()["status"] == JobStatus.SUCCEEDED.value
+        assert response.json()["result"] == {"counted": 3}
+
+    def test_cancel(self, admin_client):
+        job = enqueue_job("tests.count", to=3)
+
+        response = admin_client.post(reverse("api:job_cancel", args=[job.id]))
+
+        assert response.status_code == 200
+        assert response.json()["status"] == JobStatus.CANCELLED.value
+
+    def test_cancel_finished_job(self, admin_client):
+        job = enqueue_job("tests.count", to=1)
+        work(once=True)
+
+        response = admin_client.post(reverse("api:job_cancel", args=[job.id]))
+
+        assert response.status_code == 409
+
+    def test_unknown_job(self, admin_client):
+        assert admin_client.get(reverse("api:job_status", args=[0])).status_code == 404
+        assert Job.objects.count() == 0
+
+    def test_requires_staff(self, client):
+        job = enqueue_job("tests.count", to=1)
+
+        assert client.get(reverse("api:job_status", args=[job.id])).status_code in (401, 403)
+        assert client.post(reverse("api:job_cancel", args=[job.id])).status_code in (401, 403)
+        assert Job.objects.get(pk=job.id).status == JobStatus.QUEUED.value
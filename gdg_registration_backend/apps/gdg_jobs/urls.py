@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import CancelJobAPI, JobStatusAPI
+
+urlpatterns = [
+    path('<int:job_id>/', JobStatusAPI.as_view(), name='job_status'),
+    path('<int:job_id>/cancel/', CancelJobAPI.as_view(), name='job_cancel'),
+]
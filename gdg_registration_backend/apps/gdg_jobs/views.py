@@ -0,0 +1,57 @@
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from gdg_registration_backend.db.enums import TransactionPolicy
+from gdg_registration_backend.db.transactions import TransactionPolicyMixin
+
+from .models import Job
+from .runner import cancel_job
+
+
+def job_data(job: Job) -> dict:
+    return {
+        "id": job.id,
+        "task": job.task,
+        "status": job.status,
+        "progress": None if job.progress is None else round(job.progress, 4),
+        "progress_done": job.progress_done,
+        "progress_total": job.progress_total,
+        "message": job.message,
+        "result": job.result,
+        "error": job.error,
+        "cancel_requested": job.cancel_requested,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+    }
+
+
+class JobStatusAPI(TransactionPolicyMixin, APIView):
+    transaction_policy = TransactionPolicy.READ_ONLY
+    # Results and errors of organizer tasks, staff only
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, job_id):
+        job = Job.objects.filter(pk=job_id).first()
+        if not job:
+            return Response({"error": "Job not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        return Response(job_data(job), status=status.HTTP_200_OK)
+
+
+class CancelJobAPI(TransactionPolicyMixin, APIView):
+    transaction_policy = TransactionPolicy.SERVICE
+    permission_classes = [IsAdminUser]
+
+    def post(self, request, job_id):
+        if not Job.objects.filter(pk=job_id).exists():
+            return Response({"error": "Job not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        try:
+            job = cancel_job(job_id)
+            return Response(job_data(job), status=status.HTTP_200_OK)
+
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_409_CONFLICT)
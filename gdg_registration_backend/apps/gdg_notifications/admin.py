@@ -0,0 +1,47 @@
+from django.contrib import admin
+
+from gdg_registration_backend.apps.gdg_jobs.runner import enqueue_job
+
+from .models import Campaign, CampaignFailure, OutboxEmail
+
+
+# Register OutboxEmail model
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    list_display = ('recipient', 'template', 'status', 'attempts', 'next_attempt_at', 'sent_at')
+    search_fields = ('recipient', 'template')
+    list_filter = ('status', 'template')
+    readonly_fields = ('created_at', 'sent_at', 'last_error')
+
+
+class CampaignFailureInline(admin.TabularInline):
+    model = CampaignFailure
+    fields = ('registration', 'error', 'attempts', 'updated_at')
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+
+
+# Register Campaign model
+@admin.register(Campaign)
+class CampaignAdmin(admin.ModelAdmin):
+    list_display = ('name', 'template', 'event', 'status', 'total_recipients', 'sent_count', 'failed_count', 'progress_display', 'throughput_display')
+    search_fields = ('name',)
+    list_filter = ('status',)
+    readonly_fields = ('cursor', 'total_recipients', 'sent_count', 'failed_count', 'last_error', 'started_at', 'finished_at')
+    inlines = (CampaignFailureInline,)
+    actions = ('send_in_background',)
+
+    @admin.display(description='progress')
+    def progress_display(self, obj):
+        return f"{obj.progress:.1%}"
+
+    @admin.display(description='msg/s')
+    def throughput_display(self, obj):
+        return f"{obj.throughput:.1f}"
+
+    @admin.action(description='Send selected campaigns in the background')
+    def send_in_background(self, request, queryset):
+        for campaign_id in queryset.values_list('id', flat=True):
+            job = enqueue_job('notifications.run_campaign', actor=request.user, campaign_id=campaign_id)
+            self.message_user(request, f"Campaign {campaign_id} queued as job {job.id}")
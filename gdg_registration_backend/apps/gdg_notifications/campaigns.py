@@ -0,0 +1,248 @@
+"""
+Runs bulk email campaigns.
+
+Templates are compiled once per run and rendered per recipient. Recipients are
+fetched in chunks by keyset pagination on the registration id, sent over one
+reused connection at no more than ``rate_limit`` messages per second. After
+each chunk the cursor, the counters and a ``CampaignFailure`` row for every
+message that failed are checkpointed in one transaction.
+
+A run first retries the failures recorded by earlier runs, deleting the row of
+each one that is now sent, then carries on from the cursor.
+
+Only one run sends a campaign at a time: ``start_campaign`` claims it with a
+conditional UPDATE and a fresh ``run_token``, and the checkpoints of a run
+that lost its claim are not applied.
+"""
+
+import time
+import uuid
+from collections.abc import Callable
+from datetime import timedelta
+
+from django.core.mail import EmailMessage
+from django.core.mail import get_connection
+from django.db import transaction
+from django.db.models import F
+from django.db.models import Q
+from django.db.models import QuerySet
+from django.template.loader import get_template
+from django.utils import timezone
+
+from gdg_registration_backend.apps.gdg_notifications.enums import CampaignStatus
+from gdg_registration_backend.apps.gdg_notifications.models import Campaign
+from gdg_registration_backend.apps.gdg_notifications.models import CampaignFailure
+from gdg_registration_backend.apps.gdg_registration.models import EventRegistration
+
+# Seconds without a checkpoint after which a RUNNING campaign is taken to be
+# abandoned, e.g. by a killed worker, and may be claimed by another run
+RUN_LEASE_SECONDS = 300
+# Seconds between renewals of the claim while a chunk is being sent, so a slow
+# chunk is not taken for an abandoned run
+RUN_RENEW_SECONDS = 30
+
+
+def recipients(campaign: Campaign) -> QuerySet[EventRegistration]:
+    registrations = EventRegistration.objects.filter(**campaign.filters)
+    if campaign.event_id:
+        registrations = registrations.filter(event_id=campaign.event_id)
+    if campaign.statuses:
+        registrations = registrations.filter(participant_status__in=campaign.statuses)
+    return registrations
+
+
+def recipient_context(registration: EventRegistration) -> dict:
+    participant = registration.participant
+    return {
+        "name": participant.name,
+        "email_address": participant.email_address,
+        "status": registration.participant_status,
+        "event_name": registration.event.name,
+        "event_type": registration.event.event_type,
+        "registration_id": registration.id,
+        "team_name": registration.team_name,
+        "workshop_participation": registration.workshop_participation,
+    }
+
+
+def start_campaign(campaign: Campaign) -> Campaign:
+    """
+    Claim the campaign for a run, counting the recipients on its first start.
+    Raises ValueError when it is finished or another run holds it.
+    """
+    if campaign.status in (CampaignStatus.COMPLETED.value, CampaignStatus.CANCELLED.value):
+        raise ValueError(f"Campaign is already {campaign.status.lower()}.")
+    if campaign.rate_limit and 1 / campaign.rate_limit > RUN_RENEW_SECONDS:
+        raise ValueError(f"Rate limit is too low, send at least one message every {RUN_RENEW_SECONDS} seconds.")
+
+    now = timezone.now()
+    updates = {"status": CampaignStatus.RUNNING.value, "run_token": uuid.uuid4().hex, "updated_at": now}
+    if campaign.status == CampaignStatus.DRAFT.value:
+        claimable = Q(status=CampaignStatus.DRAFT.value)
+        updates["total_recipients"] = recipients(campaign).count()
+        updates["started_at"] = now
+    else:
+        stale = now - timedelta(seconds=RUN_LEASE_SECONDS)
+        claimable = Q(status=CampaignStatus.PAUSED.value) | Q(status=CampaignStatus.RUNNING.value, updated_at__lt=stale)
+
+    claimed = Campaign.objects.filter(claimable, pk=campaign.pk).update(**updates)
+    campaign.refresh_from_db()
+    if not claimed:
+        raise ValueError(f"Campaign is already {campaign.status.lower()}.")
+    return campaign
+
+
+def checkpoint(
+    campaign: Campaign,
+    sent: list[int],
+    failed: dict[int, str],
+    cursor: int | None = None,
+    retried: dict[int, CampaignFailure] | None = None,
+) -> bool:
+    """
+    Record a chunk: the ids of the registrations ``sent`` and the errors of
+    those that ``failed``, either walked up to ``cursor`` or ``retried`` from
+    their failure rows. False when the run no longer holds the campaign.
+    """
+    now = timezone.now()
+    updates = {"sent_count": F("sent_count") + len(sent), "updated_at": now}
+    if retried is None:
+        updates["cursor"] = cursor
+        updates["failed_count"] = F("failed_count") + len(failed)
+    else:
+        # A failure that is now sent was already counted as failed
+        updates["failed_count"] = F("failed_count") - len(sent)
+    if failed:
+        updates["last_error"] = list(failed.values())[-1]
+
+    with transaction.atomic():
+        if not Campaign.objects.filter(pk=campaign.pk, run_token=campaign.run_token).update(**updates):
+            return False
+        if retried is None:
+            CampaignFailure.objects.bulk_create(
+                [CampaignFailure(campaign=campaign, registration_id=pk, error=error) for pk, error in failed.items()],
+                ignore_conflicts=True,
+            )
+        else:
+            CampaignFailure.objects.filter(campaign=campaign, registration_id__in=sent).delete()
+            still_failing = [retried[pk] for pk in failed]
+            for failure in still_failing:
+                failure.error = failed[failure.registration_id]
+                failure.attempts += 1
+                failure.updated_at = now
+            CampaignFailure.objects.bulk_update(still_failing, ["error", "attempts", "updated_at"])
+    return True
+
+
+def renew_claim(campaign: Campaign) -> bool:
+    """Push back the lease of the run, False when it no longer holds the campaign."""
+    return bool(
+        Campaign.objects.filter(pk=campaign.pk, run_token=campaign.run_token).update(updated_at=timezone.now())
+    )
+
+
+def run_campaign(
+    campaign: Campaign,
+    on_progress: Callable[[Campaign], None] | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Campaign:
+    """
+    Send the campaign from its checkpoint until every recipient is handled,
+    the campaign is cancelled from elsewhere or another run claims it.
+    """
+    campaign = start_campaign(campaign)
+    try:
+        send_from_checkpoint(campaign, on_progress, sleep)
+    except BaseException:
+        # Let the next run resume at once instead of waiting out the lease
+        Campaign.objects.filter(
+            pk=campaign.pk, run_token=campaign.run_token, status=CampaignStatus.RUNNING.value
+        ).update(status=CampaignStatus.PAUSED.value, updated_at=timezone.now())
+        raise
+    campaign.refresh_from_db()
+    return campaign
+
+
+def send_from_checkpoint(
+    campaign: Campaign,
+    on_progress: Callable[[Campaign], None] | None,
+    sleep: Callable[[float], None],
+) -> None:
+    subject_template = get_template(f"{campaign.template}_subject.txt")
+    body_template = get_template(f"{campaign.template}_body.txt")
+    queryset = recipients(campaign).select_related("participant", "event").order_by("id")
+    failures = campaign.failures.select_related("registration__participant", "registration__event").order_by(
+        "registration_id"
+    )
+
+    connection = get_connection()
+    connection.open()
+    throttle_started, throttled_sent = time.monotonic(), 0
+    renewed_at = time.monotonic()
+
+    def send_chunk(chunk: list[EventRegistration]) -> tuple[list[int], dict[int, str]]:
+        """Send a chunk, cut short when another run claims the campaign meanwhile."""
+        nonlocal throttled_sent, renewed_at
+        sent, failed = [], {}
+        for registration in chunk:
+            if campaign.rate_limit:
+                # Hold the average rate since the run started under the limit
+                wait = throttled_sent / campaign.rate_limit - (time.monotonic() - throttle_started)
+                if wait > 0:
+                    sleep(wait)
+            if time.monotonic() - renewed_at >= RUN_RENEW_SECONDS:
+                if not renew_claim(campaign):
+                    break
+                renewed_at = time.monotonic()
+            context = recipient_context(registration)
+            message = EmailMessage(
+                subject=" ".join(subject_template.render(context).split()),
+                body=body_template.render(context),
+                to=[registration.participant.email_address],
+                connection=connection,
+            )
+            try:
+                message.send()
+                sent.append(registration.id)
+            except Exception as e:  # noqa: BLE001
+                failed[registration.id] = f"{registration.participant.email_address}: {type(e).__name__}: {e}"
+            throttled_sent += 1
+        return sent, failed
+
+    def checkpointed(claimed: bool) -> bool:
+        """Report progress, False once the campaign is cancelled or claimed by another run."""
+        if not claimed:
+            return False
+        campaign.refresh_from_db()
+        if on_progress:
+            on_progress(campaign)
+        return campaign.status != CampaignStatus.CANCELLED.value
+
+    try:
+        # Failures of earlier runs first, a failure of this run waits for the next one
+        retried_up_to = 0
+        while True:
+            chunk = failures.filter(registration_id__gt=retried_up_to)[: campaign.chunk_size]
+            retried = {failure.registration_id: failure for failure in chunk}
+            if not retried:
+                break
+            retried_up_to = max(retried)
+            sent, failed = send_chunk([failure.registration for failure in retried.values()])
+            if not checkpointed(checkpoint(campaign, sent, failed, retried=retried)):
+                return
+
+        while True:
+            chunk = list(queryset.filter(id__gt=campaign.cursor)[: campaign.chunk_size])
+            if not chunk:
+                break
+            sent, failed = send_chunk(chunk)
+            # A crash from here on resumes after the chunk
+            if not checkpointed(checkpoint(campaign, sent, failed, cursor=chunk[-1].id)):
+                return
+    finally:
+        connection.close()
+
+    now = timezone.now()
+    Campaign.objects.filter(pk=campaign.pk, run_token=campaign.run_token, status=CampaignStatus.RUNNING.value).update(
+        status=CampaignStatus.COMPLETED.value, finished_at=now, updated_at=now
+    )
@@ -0,0 +1,145 @@
+"""
+Delivers queued outbox emails in batches.
+
+Each batch is claimed with ``SELECT ... FOR UPDATE SKIP LOCKED`` so several
+dispatchers can run side by side, split over a bounded pool of threads that
+each reuse one mail connection for their share, and the outcome is written
+back with one UPDATE for the sent rows and one bulk UPDATE for the failures.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.core.mail import EmailMessage
+from django.core.mail import get_connection
+from django.db import transaction
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from gdg_registration_backend.apps.gdg_notifications.enums import OutboxStatus
+from gdg_registration_backend.apps.gdg_notifications.models import OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 5
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_MAX_SECONDS = 3600
+# How long a claimed row stays with one dispatcher before another may retry it
+LEASE_SECONDS = 300
+
+
+@dataclass
+class DispatchResult:
+    claimed: int = 0
+    sent: int = 0
+    # Failed and scheduled for another attempt
+    retried: int = 0
+    # Failed MAX_ATTEMPTS times, marked FAILED
+    failed: int = 0
+
+
+def backoff(attempts: int) -> timedelta:
+    """Exponential delay before retry number ``attempts``."""
+    return timedelta(seconds=min(BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), BACKOFF_MAX_SECONDS))
+
+
+def claim_batch(batch_size: int) -> list[OutboxEmail]:
+    now = timezone.now()
+    with transaction.atomic():
+        rows = list(
+            OutboxEmail.objects.select_for_update(skip_locked=True)
+            .filter(
+                status__in=[OutboxStatus.PENDING.value, OutboxStatus.SENDING.value],
+                next_attempt_at__lte=now,
+            )
+            .order_by("next_attempt_at")[:batch_size]
+        )
+        OutboxEmail.objects.filter(id__in=[row.id for row in rows]).update(
+            status=OutboxStatus.SENDING.value,
+            next_attempt_at=now + timedelta(seconds=LEASE_SECONDS),
+        )
+    return rows
+
+
+def build_message(row: OutboxEmail) -> EmailMessage:
+    subject = render_to_string(f"{row.template}_subject.txt", row.context)
+    body = render_to_string(f"{row.template}_body.txt", row.context)
+    # Header values cannot contain newlines
+    return EmailMessage(subject=" ".join(subject.split()), body=body, to=[row.recipient])
+
+
+def send_rows(rows: list[OutboxEmail]) -> dict[int, str | None]:
+    """Send ``rows`` over one connection, returns the error per row id or None."""
+    results: dict[int, str | None] = {}
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as e:  # noqa: BLE001
+        return {row.id: f"{type(e).__name__}: {e}" for row in rows}
+
+    try:
+        for row in rows:
+            try:
+                message = build_message(row)
+                message.connection = connection
+                if not connection.send_messages([message]):
+                    results[row.id] = "Message was not accepted"
+                    continue
+                results[row.id] = None
+            except Exception as e:  # noqa: BLE001
+                results[row.id] = f"{type(e).__name__}: {e}"
+    finally:
+        connection.close()
+    return results
+
+
+def record_results(rows: list[OutboxEmail], results: dict[int, str | None]) -> DispatchResult:
+    now = timezone.now()
+    result = DispatchResult(claimed=len(rows))
+
+    sent_ids = [row.id for row in rows if results.get(row.id) is None]
+    OutboxEmail.objects.filter(id__in=sent_ids).update(
+        status=OutboxStatus.SENT.value, sent_at=now, last_error=None
+    )
+    result.sent = len(sent_ids)
+
+    failed_rows = [row for row in rows if results.get(row.id) is not None]
+    for row in failed_rows:
+        row.attempts += 1
+        row.last_error = results[row.id]
+        if row.attempts >= MAX_ATTEMPTS:
+            row.status = OutboxStatus.FAILED.value
+            result.failed += 1
+        else:
+            row.status = OutboxStatus.PENDING.value
+            row.next_attempt_at = now + backoff(row.attempts)
+            result.retried += 1
+    OutboxEmail.objects.bulk_update(
+        failed_rows, ["attempts", "last_error", "status", "next_attempt_at"]
+    )
+    return result
+
+
+def dispatch_batch(batch_size: int = 100, max_workers: int = 4) -> DispatchResult:
+    """Claim up to ``batch_size`` due emails, send them and record the outcome."""
+    rows = claim_batch(batch_size)
+    if not rows:
+        return DispatchResult()
+
+    # Round-robin the batch over the workers, one connection each
+    workers = max(1, min(max_workers, len(rows)))
+    slices = [rows[index::workers] for index in range(workers)]
+    results: dict[int, str | None] = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for slice_results in executor.map(send_rows, slices):
+            results.update(slice_results)
+
+    result = record_results(rows, results)
+    if result.retried or result.failed:
+        logger.warning(
+            "Outbox batch: %s sent, %s retried, %s failed",
+            result.sent, result.retried, result.failed,
+        )
+    return result
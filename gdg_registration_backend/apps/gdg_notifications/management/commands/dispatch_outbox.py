@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from gdg_registration_backend.apps.gdg_notifications.dispatcher import dispatch_batch
+
+
+class Command(BaseCommand):
+    help = "Deliver queued outbox emails until interrupted, or once with --once."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument("--workers", type=int, default=4, help="Parallel mail connections.")
+        parser.add_argument(
+            "--interval", type=float, default=5.0,
+            help="Seconds to sleep when the outbox is empty.",
+        )
+        parser.add_argument("--once", action="store_true", help="Drain the outbox and exit.")
+
+    def handle(self, *args, **options):
+        while True:
+            result = dispatch_batch(options["batch_size"], options["workers"])
+            if result.claimed:
+                self.stdout.write(
+                    f"Sent {result.sent}, retrying {result.retried}, failed {result.failed}"
+                )
+                continue
+            if options["once"]:
+                return
+            time.sleep(options["interval"])
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from gdg_registration_backend.apps.gdg_notifications.campaigns import run_campaign
+from gdg_registration_backend.apps.gdg_notifications.models import Campaign
+
+
+class Command(BaseCommand):
+    help = "Send an email campaign, resuming from its last checkpoint."
+
+    def add_arguments(self, parser):
+        parser.add_argument("campaign_id", type=int)
+
+    def handle(self, *args, **options):
+        campaign = Campaign.objects.filter(pk=options["campaign_id"]).first()
+        if not campaign:
+            msg = f"Campaign {options['campaign_id']} not found."
+            raise CommandError(msg)
+
+        def report(campaign):
+            self.stdout.write(
+                f"{campaign.progress:6.1%}  sent {campaign.sent_count}  "
+                f"failed {campaign.failed_count}  {campaign.throughput:.1f} msg/s"
+            )
+
+        try:
+            campaign = run_campaign(campaign, on_progress=report)
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+        self.stdout.write(self.style.SUCCESS(f"Campaign {campaign.status.lower()}"))
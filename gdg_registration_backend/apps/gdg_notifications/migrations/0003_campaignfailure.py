@@ -0,0 +1,31 @@
+# Generated by Django 5.0.9 on 2026-10-19 01:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gdg_notifications', '0002_campaign'),
+        ('gdg_registration', '0008_eventregistration_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CampaignFailure',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('error', models.TextField()),
+                ('attempts', models.PositiveIntegerField(default=1)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('campaign', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='failures', to='gdg_notifications.campaign')),
+                ('registration', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='gdg_registration.eventregistration')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='campaignfailure',
+            constraint=models.UniqueConstraint(fields=('campaign', 'registration'), name='campaign_failure_unique'),
+        ),
+    ]
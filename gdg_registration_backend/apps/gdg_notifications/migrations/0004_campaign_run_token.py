@@ -0,0 +1,23 @@
+# Generated by Django 5.0.9 on 2026-10-19 01:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gdg_notifications', '0003_campaignfailure'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='campaign',
+            name='run_token',
+            field=models.CharField(blank=True, default='', max_length=32),
+        ),
+        migrations.AlterField(
+            model_name='campaign',
+            name='status',
+            field=models.CharField(choices=[('DRAFT', 'DRAFT'), ('RUNNING', 'RUNNING'), ('PAUSED', 'PAUSED'), ('COMPLETED', 'COMPLETED'), ('CANCELLED', 'CANCELLED')], default='DRAFT', max_length=20),
+        ),
+    ]
@@ -0,0 +1,111 @@
+from django.db import models
+from django.utils import timezone
+
+from gdg_registration_backend.apps.gdg_events.models import Event
+from gdg_registration_backend.apps.gdg_notifications.enums import CampaignStatus
+from gdg_registration_backend.apps.gdg_notifications.enums import OutboxStatus
+from gdg_registration_backend.apps.gdg_participants.models import Participant
+from gdg_registration_backend.apps.gdg_registration.models import EventRegistration
+
+
+class OutboxEmail(models.Model):
+    """
+    An email written in the same transaction as the change it announces and
+    delivered later by the outbox dispatcher.
+    """
+
+    recipient = models.EmailField()
+    # Base name of the ``<template>_subject.txt`` / ``<template>_body.txt`` pair
+    template = models.CharField(max_length=255)
+    context = models.JSONField(default=dict)
+    participant = models.ForeignKey(Participant, null=True, on_delete=models.DO_NOTHING)
+    event = models.ForeignKey(Event, null=True, on_delete=models.DO_NOTHING)
+    status = models.CharField(max_length=20, choices=[(tag.name, tag.value) for tag in OutboxStatus], default=OutboxStatus.PENDING.value)
+    attempts = models.PositiveIntegerField(default=0)
+    # When the row may be picked up next: the retry time for PENDING rows and the
+    # lease expiry for SENDING rows, so rows of a crashed dispatcher are retried
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"], name="outbox_due"),
+        ]
+
+    def __str__(self):
+        return f"{self.template} -> {self.recipient} ({self.status})"
+
+
+class Campaign(models.Model):
+    """
+    A bulk mailing to every registration matching ``event``, ``statuses`` and
+    ``filters``. Recipients are walked in registration id order and ``cursor``
+    is checkpointed after every chunk, together with a ``CampaignFailure`` for
+    each recipient that could not be mailed, so an interrupted run resumes
+    where it stopped and retries the failures. Only one run at a time holds
+    the campaign, see ``campaigns.start_campaign``.
+    """
+
+    name = models.CharField(max_length=255)
+    # Base name of the ``<template>_subject.txt`` / ``<template>_body.txt`` pair
+    template = models.CharField(max_length=255)
+    event = models.ForeignKey(Event, null=True, blank=True, on_delete=models.DO_NOTHING)
+    # Participant statuses to include, empty for everyone
+    statuses = models.JSONField(default=list, blank=True)
+    # Extra EventRegistration lookups, e.g. {"participant__participant_type": "STUDENT"}
+    filters = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=[(tag.name, tag.value) for tag in CampaignStatus], default=CampaignStatus.DRAFT.value)
+    chunk_size = models.PositiveIntegerField(default=100)
+    # Messages per second, 0 for no throttling
+    rate_limit = models.FloatField(default=10)
+    # Id of the last EventRegistration handled
+    cursor = models.BigIntegerField(default=0)
+    # Set by the run that claimed the campaign, its checkpoints only apply while it holds the claim
+    run_token = models.CharField(max_length=32, blank=True, default="")
+    total_recipients = models.PositiveIntegerField(default=0)
+    sent_count = models.PositiveIntegerField(default=0)
+    failed_count = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return self.name
+
+    @property
+    def progress(self) -> float:
+        """Share of recipients handled, between 0 and 1."""
+        if not self.total_recipients:
+            return 1.0 if self.status == CampaignStatus.COMPLETED.value else 0.0
+        return min(1.0, (self.sent_count + self.failed_count) / self.total_recipients)
+
+    @property
+    def throughput(self) -> float:
+        """Messages sent per second since the campaign started."""
+        if not self.started_at:
+            return 0.0
+        elapsed = ((self.finished_at or timezone.now()) - self.started_at).total_seconds()
+        return self.sent_count / elapsed if elapsed > 0 else 0.0
+
+
+class CampaignFailure(models.Model):
+    """A campaign recipient whose message failed, retried by the next run."""
+
+    campaign = models.ForeignKey(Campaign, on_delete=models.CASCADE, related_name="failures")
+    registration = models.ForeignKey(EventRegistration, on_delete=models.CASCADE, related_name="+")
+    error = models.TextField()
+    attempts = models.PositiveIntegerField(default=1)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["campaign", "registration"], name="campaign_failure_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.campaign} -> {self.registration_id} ({self.attempts} attempts)"
@@ -0,0 +1,38 @@
+"""Writes outbox rows for the emails that announce participant status changes."""
+
+from gdg_registration_backend.apps.gdg_events.models import Event
+from gdg_registration_backend.apps.gdg_notifications.models import OutboxEmail
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
+
+STATUS_TEMPLATES = {
+    ParticipantStatus.SHORTLISTED.value: "gdg_notifications/emails/status_shortlisted",
+    ParticipantStatus.CONFIRMED.value: "gdg_notifications/emails/status_confirmed",
+    ParticipantStatus.REJECTED.value: "gdg_notifications/emails/status_rejected",
+}
+
+
+def enqueue_status_emails(event: Event, participant_status: str, recipients: list) -> None:
+    """
+    Queue one email per ``(participant_id, name, email_address)`` recipient with
+    a single INSERT. Call it inside the transaction that changes the status, so
+    the emails are only sent if the change commits.
+    """
+    template = STATUS_TEMPLATES.get(participant_status)
+    if not template or not recipients:
+        return
+
+    OutboxEmail.objects.bulk_create(
+        OutboxEmail(
+            recipient=email_address,
+            template=template,
+            context={
+                "name": name,
+                "event_name": event.name,
+                "event_type": event.event_type,
+                "status": participant_status,
+            },
+            participant_id=participant_id,
+            event=event,
+        )
+        for participant_id, name, email_address in recipients
+    )
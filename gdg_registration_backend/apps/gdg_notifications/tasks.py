@@ -0,0 +1,22 @@
+from gdg_registration_backend.apps.gdg_jobs.registry import JobContext
+from gdg_registration_backend.apps.gdg_jobs.registry import task
+from gdg_registration_backend.apps.gdg_notifications.campaigns import run_campaign
+from gdg_registration_backend.apps.gdg_notifications.models import Campaign
+
+
+@task("notifications.run_campaign")
+def send_campaign(context: JobContext, campaign_id: int) -> dict:
+    campaign = Campaign.objects.filter(pk=campaign_id).first()
+    if not campaign:
+        raise ValueError("Campaign not found.")
+
+    def report(campaign):
+        # A cancelled job leaves the campaign PAUSED, ready to be resumed
+        context.progress(
+            campaign.sent_count + campaign.failed_count,
+            campaign.total_recipients,
+            f"{campaign.sent_count} sent, {campaign.failed_count} failed",
+        )
+
+    campaign = run_campaign(campaign, on_progress=report)
+    return {"status": campaign.status, "sent": campaign.sent_count, "failed": campaign.failed_count}
@@ -0,0 +1,278 @@
+from datetime import timedelta
+
+import pytest
+from django.core import mail
+from django.urls import reverse
+
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_notifications import campaigns
+from gdg_registration_backend.apps.gdg_notifications.campaigns import RUN_LEASE_SECONDS
+from gdg_registration_backend.apps.gdg_notifications.campaigns import run_campaign
+from gdg_registration_backend.apps.gdg_notifications.campaigns import start_campaign
+from gdg_registration_backend.apps.gdg_notifications.enums import CampaignStatus
+from gdg_registration_backend.apps.gdg_notifications.models import Campaign
+from gdg_registration_backend.apps.gdg_notifications.models import CampaignFailure
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
+from gdg_registration_backend.apps.gdg_registration.tests.factories import EventFactory
+from gdg_registration_backend.apps.gdg_registration.tests.factories import (
+    EventRegistrationFactory,
+)
+
+pytestmark = pytest.mark.django_db
+
+CONFIRMED = ParticipantStatus.CONFIRMED.value
+
+
+class Crash(Exception):
+    pass
+
+
+@pytest.fixture
+def failing_addresses(monkeypatch):
+    """Addresses the mail server rejects, emptied to let them through."""
+    addresses = set()
+    send = campaigns.EmailMessage.send
+
+    def flaky_send(message, *args, **kwargs):
+        if message.to[0] in addresses:
+            raise ConnectionError("Mailbox unavailable")
+        return send(message, *args, **kwargs)
+
+    monkeypatch.setattr(campaigns.EmailMessage, "send", flaky_send)
+    return addresses
+
+
+@pytest.fixture
+def confirmed_registrations():
+    event = EventFactory()
+    EventRegistrationFactory(event=event)  # Still pending, not a recipient
+    return EventRegistrationFactory.create_batch(
+        7, event=event, participant_status=CONFIRMED,
+    )
+
+
+def make_campaign(**kwargs):
+    defaults = {
+        "name": "Logistics",
+        "template": "gdg_notifications/emails/campaign_logistics",
+        "event": EventFactory(),
+        "statuses": [CONFIRMED],
+        "chunk_size": 3,
+        "rate_limit": 0,
+    }
+    return Campaign.objects.create(**{**defaults, **kwargs})
+
+
+class TestRunCampaign:
+    def test_mails_matching_recipients(self, confirmed_registrations):
+        campaign = run_campaign(make_campaign())
+
+        assert campaign.status == CampaignStatus.COMPLETED.value
+        assert (campaign.total_recipients, campaign.sent_count) == (7, 7)
+        assert campaign.progress == 1
+        assert sorted(message.to[0] for message in mail.outbox) == sorted(
+            r.participant.email_address for r in confirmed_registrations
+        )
+        first = confirmed_registrations[0]
+        message = next(m for m in mail.outbox if m.to == [first.participant.email_address])
+        assert first.participant.name in message.body
+        assert str(first.id) in message.body
+
+    def test_resumes_from_checkpoint_without_remailing(self, confirmed_registrations):
+        campaign = make_campaign()
+
+        def crash_after_first_chunk(campaign):
+            raise Crash
+
+        with pytest.raises(Crash):
+            run_campaign(campaign, on_progress=crash_after_first_chunk)
+        campaign.refresh_from_db()
+        assert campaign.status == CampaignStatus.PAUSED.value
+        assert campaign.sent_count == 3
+
+        run_campaign(campaign)
+
+        recipients = [message.to[0] for message in mail.outbox]
+        assert len(recipients) == len(set(recipients)) == 7
+        campaign.refresh_from_db()
+        assert campaign.sent_count == 7
+        assert campaign.total_recipients == 7
+
+    def test_records_failed_recipients(self, confirmed_registrations, failing_addresses):
+        failing = confirmed_registrations[1]
+        failing_addresses.add(failing.participant.email_address)
+
+        campaign = run_campaign(make_campaign())
+
+        assert (campaign.sent_count, campaign.failed_count) == (6, 1)
+        assert "Mailbox unavailable" in campaign.last_error
+        [failure] = campaign.failures.all()
+        assert (failure.registration_id, failure.attempts) == (failing.id, 1)
+
+    def test_resume_retries_failed_recipients(self, confirmed_registrations, failing_addresses):
+        failing = confirmed_registrations[1]
+        failing_addresses.add(failing.participant.email_address)
+        campaign = make_campaign()
+
+        def crash_after_first_chunk(campaign):
+            raise Crash
+
+        with pytest.raises(Crash):
+            run_campaign(campaign, on_progress=crash_after_first_chunk)
+        assert CampaignFailure.objects.filter(campaign=campaign, registration=failing).exists()
+
+        failing_addresses.clear()
+        campaign.refresh_from_db()
+        campaign = run_campaign(campaign)
+
+        recipients = [message.to[0] for message in mail.outbox]
+        assert len(recipients) == len(set(recipients)) == 7
+        assert (campaign.sent_count, campaign.failed_count) == (7, 0)
+        assert not campaign.failures.exists()
+
+    def test_failing_retry_counts_attempts(self, confirmed_registrations, failing_addresses):
+        failing = confirmed_registrations[0]
+        failing_addresses.add(failing.participant.email_address)
+        campaign = make_campaign()
+
+        def crash_after_first_chunk(campaign):
+            raise Crash
+
+        with pytest.raises(Crash):
+            run_campaign(campaign, on_progress=crash_after_first_chunk)
+        campaign.refresh_from_db()
+        campaign = run_campaign(campaign)
+
+        assert (campaign.sent_count, campaign.failed_count) == (6, 1)
+        assert campaign.failures.get().attempts == 2
+
+    def test_compiles_templates_once(self, confirmed_registrations, monkeypatch):
+        loaded = []
+        get_template = campaigns.get_template
+
+        def counting_get_template(name):
+            loaded.append(name)
+            return get_template(name)
+
+        monkeypatch.setattr(campaigns, "get_template", counting_get_template)
+
+        run_campaign(make_campaign())
+
+        assert len(loaded) == 2
+
+    def test_throttles_to_rate_limit(self, confirmed_registrations):
+        waits = []
+
+        run_campaign(make_campaign(rate_limit=10), sleep=waits.append)
+
+        # Seven messages at 10/s: the last one waits until ~0.6s into the run
+        assert max(waits) == pytest.approx(0.6, abs=0.05)
+
+    def test_stops_when_cancelled(self, confirmed_registrations):
+        def cancel(campaign):
+            Campaign.objects.filter(pk=campaign.pk).update(status=CampaignStatus.CANCELLED.value)
+            campaign.refresh_from_db()
+
+        campaign = run_campaign(make_campaign(), on_progress=cancel)
+
+        assert campaign.status == CampaignStatus.CANCELLED.value
+        assert len(mail.outbox) == 3
+
+    def test_completed_campaign_cannot_rerun(self, confirmed_registrations):
+        campaign = run_campaign(make_campaign())
+
+        with pytest.raises(ValueError, match="already completed"):
+            run_campaign(campaign)
+
+    def test_running_campaign_cannot_be_started_again(self, confirmed_registrations):
+        campaign = make_campaign()
+        start_campaign(campaign)
+
+        with pytest.raises(ValueError, match="already running"):
+            run_campaign(Campaign.objects.get(pk=campaign.pk))
+        assert mail.outbox == []
+
+    def test_abandoned_run_is_taken_over(self, confirmed_registrations):
+        campaign = start_campaign(make_campaign())
+        # The worker running it was killed and stopped checkpointing
+        stale = campaign.updated_at - timedelta(seconds=RUN_LEASE_SECONDS + 1)
+        Campaign.objects.filter(pk=campaign.pk).update(updated_at=stale)
+
+        campaign = run_campaign(campaign)
+
+        assert campaign.status == CampaignStatus.COMPLETED.value
+        assert campaign.sent_count == 7
+
+    def test_run_stops_when_claimed_elsewhere(self, confirmed_registrations):
+        def taken_over(campaign):
+            Campaign.objects.filter(pk=campaign.pk).update(run_token="other run")
+
+        campaign = run_campaign(make_campaign(), on_progress=taken_over)
+
+        assert campaign.status == CampaignStatus.RUNNING.value
+        assert (campaign.sent_count, len(mail.outbox)) == (3, 6)
+
+    def test_renews_claim_while_sending_a_chunk(self, confirmed_registrations, monkeypatch):
+        leases = []
+        send = campaigns.EmailMessage.send
+
+        def leased_send(message, *args, **kwargs):
+            leases.append(Campaign.objects.values_list("updated_at", flat=True).get())
+            return send(message, *args, **kwargs)
+
+        monkeypatch.setattr(campaigns, "RUN_RENEW_SECONDS", 0)
+        monkeypatch.setattr(campaigns.EmailMessage, "send", leased_send)
+        run_campaign(make_campaign(chunk_size=7))
+
+        assert leases == sorted(set(leases))
+        assert len(leases) == 7
+
+    def test_chunk_stops_when_claimed_elsewhere(self, confirmed_registrations, monkeypatch):
+        send = campaigns.EmailMessage.send
+
+        def taken_over_send(message, *args, **kwargs):
+            if len(mail.outbox) == 1:
+                Campaign.objects.update(run_token="other run")
+            return send(message, *args, **kwargs)
+
+        monkeypatch.setattr(campaigns, "RUN_RENEW_SECONDS", 0)
+        monkeypatch.setattr(campaigns.EmailMessage, "send", taken_over_send)
+        campaign = run_campaign(make_campaign(chunk_size=7))
+
+        assert (campaign.sent_count, len(mail.outbox)) == (0, 2)
+
+    def test_rate_limit_must_keep_the_claim(self, confirmed_registrations):
+        with pytest.raises(ValueError, match="Rate limit is too low"):
+            run_campaign(make_campaign(rate_limit=0.01))
+        assert mail.outbox == []
+
+    def test_extra_filters(self, confirmed_registrations):
+        hackathon = EventFactory(event_type=EventTypes.HACKATHON.value)
+        EventRegistrationFactory(event=hackathon, team_name="Null Pointers")
+
+        campaign = run_campaign(
+            make_campaign(event=None, statuses=[], filters={"team_name": "Null Pointers"}),
+        )
+
+        assert campaign.sent_count == 1
+        assert "Null Pointers" in mail.outbox[0].body
+
+
+def test_progress_api(admin_client, confirmed_registrations):
+    campaign = run_campaign(make_campaign())
+
+    response = admin_client.get(reverse("api:campaign_progress", args=[campaign.id]))
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["progress"] == 1
+    assert data["sent"] == 7
+    assert data["status"] == CampaignStatus.COMPLETED.value
+
+
+def test_progress_api_requires_staff(client):
+    campaign = make_campaign()
+
+    response = client.get(reverse("api:campaign_progress", args=[campaign.id]))
+
+    assert response.status_code in (401, 403)
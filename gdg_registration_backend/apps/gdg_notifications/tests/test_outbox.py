@@ -0,0 +1,133 @@
+from datetime import timedelta
+
+import pytest
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.db import transaction
+from django.utils import timezone
+
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_notifications import dispatcher
+from gdg_registration_backend.apps.gdg_notifications.dispatcher import MAX_ATTEMPTS
+from gdg_registration_backend.apps.gdg_notifications.dispatcher import dispatch_batch
+from gdg_registration_backend.apps.gdg_notifications.enums import OutboxStatus
+from gdg_registration_backend.apps.gdg_notifications.models import OutboxEmail
+from gdg_registration_backend.apps.gdg_participants.data_class_model import ShortlistDTO
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
+from gdg_registration_backend.apps.gdg_registration.service import RegistrationService
+from gdg_registration_backend.apps.gdg_registration.tests.factories import (
+    EventRegistrationFactory,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+class FailingBackend(EmailBackend):
+    def send_messages(self, messages):
+        msg = "SMTP server said no"
+        raise ConnectionError(msg)
+
+
+def shortlist(registrations):
+    RegistrationService.shortlist_participants(
+        ShortlistDTO(participants=[r.participant_id for r in registrations]),
+        EventTypes.WORKSHOP.value,
+    )
+
+
+class TestEnqueue:
+    def test_status_change_queues_emails_without_sending(self):
+        registrations = EventRegistrationFactory.create_batch(3)
+
+        shortlist(registrations)
+
+        assert mail.outbox == []
+        assert sorted(OutboxEmail.objects.values_list("recipient", flat=True)) == sorted(
+            r.participant.email_address for r in registrations
+        )
+        assert set(OutboxEmail.objects.values_list("status", flat=True)) == {
+            OutboxStatus.PENDING.value,
+        }
+
+    def test_rolled_back_change_queues_nothing(self):
+        registration = EventRegistrationFactory()
+
+        with pytest.raises(RuntimeError), transaction.atomic():
+            shortlist([registration])
+            raise RuntimeError
+
+        assert not OutboxEmail.objects.exists()
+
+    def test_statuses_without_template_queue_nothing(self):
+        registration = EventRegistrationFactory()
+
+        RegistrationService.status_participants(
+            ShortlistDTO(participants=[registration.participant_id]),
+            EventTypes.WORKSHOP.value,
+            ParticipantStatus.ATTENDED.value,
+        )
+
+        assert not OutboxEmail.objects.exists()
+
+
+class TestDispatch:
+    def test_sends_and_marks_rows_sent(self):
+        registrations = EventRegistrationFactory.create_batch(5)
+        shortlist(registrations)
+
+        result = dispatch_batch(batch_size=10, max_workers=2)
+
+        assert (result.claimed, result.sent) == (5, 5)
+        assert len(mail.outbox) == 5
+        message = mail.outbox[0]
+        assert "shortlisted" in message.subject
+        assert "\n" not in message.subject
+        assert not OutboxEmail.objects.exclude(status=OutboxStatus.SENT.value).exists()
+        assert dispatch_batch().claimed == 0
+
+    def test_one_connection_per_worker(self, monkeypatch):
+        shortlist(EventRegistrationFactory.create_batch(6))
+        connections = []
+        get_connection = dispatcher.get_connection
+
+        def counting_get_connection():
+            connection = get_connection()
+            connections.append(connection)
+            return connection
+
+        monkeypatch.setattr(dispatcher, "get_connection", counting_get_connection)
+
+        dispatch_batch(batch_size=10, max_workers=3)
+
+        assert len(connections) == 3
+        assert len(mail.outbox) == 6
+
+    def test_failures_back_off_then_give_up(self, settings):
+        settings.EMAIL_BACKEND = f"{__name__}.FailingBackend"
+        shortlist([EventRegistrationFactory()])
+
+        result = dispatch_batch()
+
+        row = OutboxEmail.objects.get()
+        assert result.retried == 1
+        assert row.status == OutboxStatus.PENDING.value
+        assert row.attempts == 1
+        assert "SMTP server said no" in row.last_error
+        assert row.next_attempt_at > timezone.now()
+        # Not due yet
+        assert dispatch_batch().claimed == 0
+
+        OutboxEmail.objects.update(attempts=MAX_ATTEMPTS - 1, next_attempt_at=timezone.now())
+        result = dispatch_batch()
+
+        assert result.failed == 1
+        assert OutboxEmail.objects.get().status == OutboxStatus.FAILED.value
+
+    def test_expired_lease_is_reclaimed(self):
+        shortlist([EventRegistrationFactory()])
+        OutboxEmail.objects.update(
+            status=OutboxStatus.SENDING.value,
+            next_attempt_at=timezone.now() - timedelta(seconds=1),
+        )
+
+        assert dispatch_batch().sent == 1
@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import CampaignProgressAPI
+
+urlpatterns = [
+    path('campaigns/<int:campaign_id>/progress/', CampaignProgressAPI.as_view(), name='campaign_progress'),
+]
@@ -0,0 +1,37 @@
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from gdg_registration_backend.db.enums import TransactionPolicy
+from gdg_registration_backend.db.transactions import TransactionPolicyMixin
+
+from .models import Campaign
+
+
+class CampaignProgressAPI(TransactionPolicyMixin, APIView):
+    transaction_policy = TransactionPolicy.READ_ONLY
+    # The last error names the recipient it failed for, staff only
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, campaign_id):
+        campaign = Campaign.objects.filter(pk=campaign_id).first()
+        if not campaign:
+            return Response({"error": "Campaign not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        return Response(
+            {
+                "id": campaign.id,
+                "name": campaign.name,
+                "status": campaign.status,
+                "total_recipients": campaign.total_recipients,
+                "sent": campaign.sent_count,
+                "failed": campaign.failed_count,
+                "progress": round(campaign.progress, 4),
+                "throughput": round(campaign.throughput, 2),
+                "last_error": campaign.last_error,
+                "started_at": campaign.started_at,
+                "finished_at": campaign.finished_at,
+            },
+            status=status.HTTP_200_OK,
+        )
@@ -5,6 +5,8 @@ from .models import Participant
 # Register Participant model
 @admin.register(Participant)
 class ParticipantAdmin(admin.ModelAdmin):
-    list_display = ('name', 'email_address', 'phone_number', 'cnic', 'participant_type', 'organization', 'participant_status')
+    list_display = ('name', 'email_address', 'phone_number', 'cnic', 'participant_type', 'organization')
     search_fields = ('name', 'email_address', 'cnic', 'phone_number')
-    list_filter = ('participant_type', 'participant_status')
\ No newline at end of file
+    list_filter = ('participant_type',)
+    # Bumped on save, see VersionedModel
+    readonly_fields = ('version',)
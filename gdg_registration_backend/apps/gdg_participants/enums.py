@@ -25,3 +25,13 @@ class ParticipantStatus(Enum):
             bool: True if the status is valid, False otherwise.
         """
         return status in cls._value2member_map_
+
+    @classmethod
+    def seat_holding_statuses(cls):
+        """
+        Statuses that occupy a seat at an event.
+
+        Returns:
+            list: Status values counted against an event's capacity.
+        """
+        return [cls.SHORTLISTED.value, cls.CONFIRMED.value, cls.ATTENDED.value]
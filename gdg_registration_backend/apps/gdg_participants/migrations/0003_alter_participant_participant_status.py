@@ -0,0 +1,18 @@
+# Generated by Django 5.0.9 on 2026-10-18 23:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gdg_participants', '0002_participant_job_role'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='participant',
+            name='participant_status',
+            field=models.CharField(choices=[('PENDING', 'PENDING'), ('SHORTLISTED', 'SHORTLISTED'), ('CONFIRMED', 'CONFIRMED'), ('REJECTED', 'REJECTED'), ('ATTENDED', 'ATTENDED')], default='PENDING', max_length=20),
+        ),
+    ]
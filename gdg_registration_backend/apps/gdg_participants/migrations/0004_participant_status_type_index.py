@@ -0,0 +1,17 @@
+# Generated by Django 5.0.9 on 2026-10-19 00:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gdg_participants', '0003_alter_participant_participant_status'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='participant',
+            index=models.Index(fields=['participant_status', 'participant_type'], name='participant_status_type'),
+        ),
+    ]
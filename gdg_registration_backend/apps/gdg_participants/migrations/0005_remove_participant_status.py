@@ -0,0 +1,27 @@
+# Generated by Django 5.0.9 on 2026-10-19 09:30
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gdg_participants', '0004_participant_status_type_index'),
+        # The values are copied onto the registrations first
+        ('gdg_registration', '0006_eventregistration_participant_status'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='participant',
+            name='participant_status_type',
+        ),
+        migrations.RemoveField(
+            model_name='participant',
+            name='participant_status',
+        ),
+        migrations.RemoveField(
+            model_name='participant',
+            name='payment_acknowledgement',
+        ),
+    ]
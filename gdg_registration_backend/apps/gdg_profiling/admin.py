@@ -0,0 +1,68 @@
+from django.contrib import admin
+from django.http import FileResponse
+from django.http import Http404
+from django.http import HttpResponse
+from django.urls import path
+from django.urls import reverse
+from django.utils.html import format_html
+
+from .models import RequestProfile
+from .models import SlowQuery
+from .profiler import profiling_token
+
+
+@admin.register(RequestProfile)
+class RequestProfileAdmin(admin.ModelAdmin):
+    list_display = ('created_at', 'method', 'path', 'view_name', 'status_code', 'duration_ms', 'trigger', 'requested_by', 'download_link')
+    search_fields = ('request_id', 'path')
+    list_filter = ('trigger', 'view_name', 'status_code')
+    exclude = ('profile',)
+    readonly_fields = ('request_id', 'method', 'path', 'view_name', 'status_code', 'duration_ms', 'trigger', 'requested_by', 'created_at', 'download_link', 'summary')
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def get_urls(self):
+        return [
+            path('token/', self.admin_site.admin_view(self.token_view), name='gdg_profiling_requestprofile_token'),
+            path('<int:profile_id>/download/', self.admin_site.admin_view(self.download_view), name='gdg_profiling_requestprofile_download'),
+            *super().get_urls(),
+        ]
+
+    @admin.display(description='profile')
+    def download_link(self, obj):
+        url = reverse('admin:gdg_profiling_requestprofile_download', args=[obj.pk])
+        return format_html('<a href="{}">{}.prof</a>', url, obj.request_id)
+
+    def token_view(self, request):
+        # Sent as the X-Profile-Token header of the requests to profile
+        return HttpResponse(profiling_token(request.user), content_type='text/plain')
+
+    def download_view(self, request, profile_id):
+        profile = RequestProfile.objects.filter(pk=profile_id).first()
+        if profile is None or not self.has_view_permission(request, profile):
+            raise Http404
+        return FileResponse(profile.profile.open('rb'), as_attachment=True, filename=f'{profile.request_id}.prof')
+
+
+@admin.register(SlowQuery)
+class SlowQueryAdmin(admin.ModelAdmin):
+    list_display = ('call_site', 'view_name', 'calls', 'mean_ms', 'max_ms', 'total_ms', 'last_seen')
+    search_fields = ('sql', 'call_site')
+    list_filter = ('view_name',)
+    ordering = ('-total_ms',)
+    readonly_fields = ('fingerprint', 'call_site', 'view_name', 'calls', 'mean_ms', 'max_ms', 'total_ms', 'first_seen', 'last_seen', 'sql', 'plan')
+
+    # Deleting a row starts its counts over, e.g. after adding an index
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    @admin.display(description='mean ms')
+    def mean_ms(self, obj):
+        return round(obj.mean_ms, 1)
@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class GdgProfilingConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'gdg_registration_backend.apps.gdg_profiling'
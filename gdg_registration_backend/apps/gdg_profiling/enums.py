@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class ProfileTrigger(Enum):
+    # The request carried a staff member's signed X-Profile-Token header
+    TOKEN = "TOKEN"
+    # Picked at random, see PROFILING_SAMPLE_RATE
+    SAMPLED = "SAMPLED"
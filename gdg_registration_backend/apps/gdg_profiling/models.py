@@ -0,0 +1,63 @@
+from django.conf import settings
+from django.db import models
+
+from gdg_registration_backend.apps.gdg_profiling.enums import ProfileTrigger
+
+
+class RequestProfile(models.Model):
+    """
+    cProfile run of one request, taken by ``ProfilingMiddleware``. The pstats
+    file is in the default storage, the summary is readable in the admin.
+    """
+
+    request_id = models.CharField(max_length=32, unique=True)
+    method = models.CharField(max_length=10)
+    path = models.CharField(max_length=2048)
+    # URL name the request resolved to, e.g. "api:events_list"
+    view_name = models.CharField(max_length=255, blank=True, default="")
+    status_code = models.PositiveSmallIntegerField()
+    duration_ms = models.FloatField()
+    trigger = models.CharField(max_length=20, choices=[(tag.name, tag.value) for tag in ProfileTrigger])
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL, related_name="+"
+    )
+    # marshal-ed pstats, open with ``python -m pstats`` or snakeviz
+    profile = models.FileField(upload_to="profiles/")
+    # Slowest functions by cumulative time
+    summary = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self):
+        return f"{self.method} {self.path} ({self.request_id})"
+
+
+class SlowQuery(models.Model):
+    """
+    Queries slower than ``SLOW_QUERY_MS``, one row per fingerprint, i.e. per
+    statement with its literals and IN lists collapsed. Kept up to date by
+    ``SlowQueryMiddleware``.
+    """
+
+    fingerprint = models.CharField(max_length=40, unique=True)
+    # Normalized statement
+    sql = models.TextField()
+    # EXPLAIN of the latest occurrence, empty on databases other than Postgres
+    plan = models.TextField(blank=True, default="")
+    # Innermost project frame that ran it, e.g. "apps/gdg_registration/service.py:120 in get_event_list"
+    call_site = models.CharField(max_length=255, blank=True, default="")
+    view_name = models.CharField(max_length=255, blank=True, default="")
+    calls = models.PositiveIntegerField(default=0)
+    total_ms = models.FloatField(default=0)
+    max_ms = models.FloatField(default=0)
+    first_seen = models.DateTimeField(auto_now_add=True)
+    last_seen = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        verbose_name_plural = "slow queries"
+
+    def __str__(self):
+        return f"{self.call_site or self.fingerprint} ({self.calls} calls)"
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
@@ -0,0 +1,123 @@
+"""
+Profiling of production requests.
+
+A request is run under cProfile when it carries a valid ``X-Profile-Token``
+header, or when it is picked by ``PROFILING_SAMPLE_RATE``. A staff member gets
+a token from the admin, at ``gdg_profiling/requestprofile/token/``. It is
+signed and expires after ``PROFILING_TOKEN_MAX_AGE`` seconds. The profile is
+stored as a ``RequestProfile``, whose id is returned in ``X-Profile-Id``.
+
+Every other request only pays for one header lookup and, when sampling is on,
+one random number.
+"""
+
+import cProfile
+import io
+import logging
+import marshal
+import pstats
+import random
+import time
+import uuid
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+from gdg_registration_backend.apps.gdg_profiling.enums import ProfileTrigger
+from gdg_registration_backend.apps.gdg_profiling.models import RequestProfile
+
+logger = logging.getLogger(__name__)
+
+TOKEN_HEADER = "HTTP_X_PROFILE_TOKEN"
+TOKEN_SALT = "gdg_profiling.token"
+# Functions listed in a profile's summary
+SUMMARY_LINES = 40
+
+
+def profiling_token(user) -> str:
+    return signing.TimestampSigner(salt=TOKEN_SALT).sign(str(user.pk))
+
+
+def token_user(token: str):
+    """Active staff member the token was issued to, None when it is invalid or expired."""
+    try:
+        user_id = signing.TimestampSigner(salt=TOKEN_SALT).unsign(token, max_age=settings.PROFILING_TOKEN_MAX_AGE)
+    except signing.BadSignature:
+        return None
+    return get_user_model().objects.filter(pk=user_id, is_active=True, is_staff=True).first()
+
+
+def profile_summary(profiler: cProfile.Profile) -> str:
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(SUMMARY_LINES)
+    return stream.getvalue()
+
+
+def save_profile(request, response, profiler: cProfile.Profile, duration: float, trigger: ProfileTrigger, user) -> RequestProfile:
+    profiler.create_stats()
+    # Before the summary, pstats.Stats() takes the stats off the profiler
+    stats = marshal.dumps(profiler.stats)
+    request_id = uuid.uuid4().hex
+    profile = RequestProfile(
+        request_id=request_id,
+        method=request.method,
+        path=request.get_full_path()[:2048],
+        view_name=request.resolver_match.view_name if request.resolver_match else "",
+        status_code=response.status_code,
+        duration_ms=duration * 1000,
+        trigger=trigger.value,
+        requested_by=user,
+        summary=profile_summary(profiler),
+    )
+    profile.profile.save(f"{request_id}.prof", ContentFile(stats), save=False)
+    profile.save()
+    prune_profiles()
+    return profile
+
+
+def prune_profiles() -> None:
+    """Keep the newest ``PROFILING_KEEP`` profiles, files included."""
+    stale = list(RequestProfile.objects.order_by("-created_at", "-id").values_list("id", "profile")[settings.PROFILING_KEEP:])
+    for _, name in stale:
+        default_storage.delete(name)
+    RequestProfile.objects.filter(id__in=[profile_id for profile_id, _ in stale]).delete()
+
+
+class ProfilingMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = settings.PROFILING_SAMPLE_RATE
+
+    def __call__(self, request):
+        token = request.META.get(TOKEN_HEADER)
+        if token is None and not (self.sample_rate and random.random() < self.sample_rate):
+            return self.get_response(request)
+
+        user = None
+        trigger = ProfileTrigger.SAMPLED
+        if token is not None:
+            user = token_user(token)
+            if user is None:
+                return self.get_response(request)
+            trigger = ProfileTrigger.TOKEN
+
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            response = self.get_response(request)
+        finally:
+            profiler.disable()
+        duration = time.perf_counter() - start
+
+        # A profile that cannot be stored must not fail the request
+        try:
+            profile = save_profile(request, response, profiler, duration, trigger, user)
+        except Exception:
+            logger.exception("Could not store the profile of %s %s", request.method, request.path)
+        else:
+            response["X-Profile-Id"] = profile.request_id
+        return response
@@ -0,0 +1,178 @@
+"""
+Slow query log.
+
+With ``SLOW_QUERY_MS`` set, ``SlowQueryMiddleware`` times every query of a
+request. One over the threshold is logged with the project frame that ran it,
+usually a ``RegistrationService`` method, and on Postgres with its plan. Once
+the response is ready, the request's slow queries are added up by fingerprint
+in ``SlowQuery`` and listed in the admin by total time. A filter without an
+index shows up there as a ``Seq Scan``, no ``pg_stat_statements`` needed.
+
+The plan comes from ``EXPLAIN (ANALYZE off)``: the statement is planned with
+the same parameters, not run a second time.
+"""
+
+import hashlib
+import logging
+import re
+import time
+import traceback
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DatabaseError
+from django.db import IntegrityError
+from django.db import connections
+from django.db import transaction
+from django.db.models import F
+from django.db.models import Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from gdg_registration_backend.apps.gdg_profiling.models import SlowQuery
+
+logger = logging.getLogger(__name__)
+
+PROJECT_DIR = Path(__file__).resolve().parents[2]
+# Frames skipped when looking for the caller of a query
+INSTRUMENTATION = (str(Path(__file__).resolve()), str(PROJECT_DIR / "db"))
+EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b|%s")
+_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_ROWS = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+_SPACE = re.compile(r"\s+")
+
+
+def normalize(sql: str) -> str:
+    """Statement with its literals as ``?`` and its IN lists and VALUES rows as ``(...)``."""
+    sql = _LITERALS.sub("?", sql)
+    sql = _ROWS.sub("(...)", _LISTS.sub("(...)", sql))
+    return _SPACE.sub(" ", sql).strip()
+
+
+def fingerprint(normalized_sql: str) -> str:
+    return hashlib.sha1(normalized_sql.encode()).hexdigest()
+
+
+def call_site() -> str:
+    """Innermost project frame of the current stack, outside the SQL instrumentation."""
+    for frame in reversed(traceback.extract_stack()):
+        if frame.filename.startswith(str(PROJECT_DIR)) and not frame.filename.startswith(INSTRUMENTATION):
+            return f"{Path(frame.filename).relative_to(PROJECT_DIR)}:{frame.lineno} in {frame.name}"
+    return ""
+
+
+@dataclass
+class SlowQueryHit:
+    sql: str
+    call_site: str
+    plan: str
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+class SlowQueryLog:
+    """``execute_wrapper`` keeping the queries slower than ``threshold_ms``, by fingerprint."""
+
+    def __init__(self, threshold_ms: float):
+        self.threshold_ms = threshold_ms
+        self.hits: dict[str, SlowQueryHit] = {}
+        self.explaining = False
+
+    def __call__(self, execute, sql, params, many, context):
+        if self.explaining:
+            return execute(sql, params, many, context)
+        start = time.perf_counter()
+        result = execute(sql, params, many, context)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms >= self.threshold_ms:
+            self.record(context["connection"], sql, None if many else params, elapsed_ms)
+        return result
+
+    def record(self, connection, sql, params, elapsed_ms: float) -> None:
+        normalized = normalize(sql)
+        key = fingerprint(normalized)
+        hit = self.hits.get(key)
+        if hit is None:
+            # Explained once per request, repeats of an N+1 loop are only counted
+            plan = self.explain(connection, sql, params)
+            hit = self.hits[key] = SlowQueryHit(normalized, call_site(), plan)
+            logger.warning("Slow query, %.1f ms at %s: %s\n%s", elapsed_ms, hit.call_site, sql, plan)
+        hit.calls += 1
+        hit.total_ms += elapsed_ms
+        hit.max_ms = max(hit.max_ms, elapsed_ms)
+
+    def explain(self, connection, sql, params) -> str:
+        if connection.vendor != "postgresql" or not sql.lstrip().upper().startswith(EXPLAINABLE):
+            return ""
+        self.explaining = True
+        try:
+            # In a savepoint, so a failed EXPLAIN leaves the request's transaction usable
+            with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN (ANALYZE off) {sql}", params)
+                return "\n".join(row[0] for row in cursor.fetchall())
+        except DatabaseError:
+            logger.warning("Could not explain %s", sql, exc_info=True)
+            return ""
+        finally:
+            self.explaining = False
+
+
+def save_slow_queries(hits: dict[str, SlowQueryHit], view_name: str) -> None:
+    for key, hit in hits.items():
+        changes = {
+            "calls": F("calls") + hit.calls,
+            "total_ms": F("total_ms") + hit.total_ms,
+            "max_ms": Greatest("max_ms", Value(hit.max_ms)),
+            "call_site": hit.call_site,
+            "view_name": view_name,
+            "last_seen": timezone.now(),
+        }
+        if hit.plan:
+            changes["plan"] = hit.plan
+        if SlowQuery.objects.filter(fingerprint=key).update(**changes):
+            continue
+        try:
+            with transaction.atomic():
+                SlowQuery.objects.create(
+                    fingerprint=key,
+                    sql=hit.sql,
+                    plan=hit.plan,
+                    call_site=hit.call_site,
+                    view_name=view_name,
+                    calls=hit.calls,
+                    total_ms=hit.total_ms,
+                    max_ms=hit.max_ms,
+                )
+        except IntegrityError:
+            # Another worker stored it first
+            SlowQuery.objects.filter(fingerprint=key).update(**changes)
+
+
+class SlowQueryMiddleware:
+    def __init__(self, get_response):
+        if not settings.SLOW_QUERY_MS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.threshold_ms = settings.SLOW_QUERY_MS
+
+    def __call__(self, request):
+        log = SlowQueryLog(self.threshold_ms)
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(log))
+            response = self.get_response(request)
+
+        if log.hits:
+            view_name = request.resolver_match.view_name if request.resolver_match else ""
+            # Stored outside the view's transaction, the log must not fail the request
+            try:
+                save_slow_queries(log.hits, view_name)
+            except DatabaseError:
+                logger.exception("Could not store the slow queries of %s %s", request.method, request.path)
+        return response
@@ -0,0 +1,94 @@
+import marshal
+
+import pytest
+from django.core.files.storage import default_storage
+from django.urls import reverse
+
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_profiling import profiler
+from gdg_registration_backend.apps.gdg_profiling.enums import ProfileTrigger
+from gdg_registration_backend.apps.gdg_profiling.models import RequestProfile
+from gdg_registration_backend.apps.gdg_profiling.profiler import profiling_token
+from gdg_registration_backend.apps.gdg_registration.tests.factories import EventRegistrationFactory
+
+pytestmark = pytest.mark.django_db
+
+WORKSHOP = EventTypes.WORKSHOP.value
+
+
+@pytest.fixture
+def events_list(client):
+    EventRegistrationFactory()
+
+    def get(**headers):
+        return client.get(reverse("api:events_list"), {"event_type": WORKSHOP}, **headers)
+
+    return get
+
+
+class TestProfilingMiddleware:
+    def test_untriggered_requests_are_not_profiled(self, events_list, monkeypatch):
+        monkeypatch.setattr(profiler.cProfile, "Profile", None)
+
+        response = events_list()
+
+        assert response.status_code == 200
+        assert "X-Profile-Id" not in response
+        assert not RequestProfile.objects.exists()
+
+    def test_staff_token(self, events_list, admin_user):
+        response = events_list(HTTP_X_PROFILE_TOKEN=profiling_token(admin_user))
+
+        profile = RequestProfile.objects.get()
+        assert response["X-Profile-Id"] == profile.request_id
+        assert (profile.view_name, profile.status_code) == ("api:events_list", 200)
+        assert profile.trigger == ProfileTrigger.TOKEN.value
+        assert profile.requested_by == admin_user
+        assert "get_event_list" in profile.summary
+        with profile.profile.open("rb") as stats:
+            functions = marshal.loads(stats.read())
+        assert any(name == "get_event_list" for _, _, name in functions)
+
+    @pytest.mark.parametrize("max_age", [-1, 3600])
+    def test_rejected_tokens(self, events_list, user, admin_user, settings, max_age):
+        settings.PROFILING_TOKEN_MAX_AGE = max_age
+        # Expired, or issued to someone who is not staff
+        token = profiling_token(admin_user if max_age < 0 else user)
+
+        assert "X-Profile-Id" not in events_list(HTTP_X_PROFILE_TOKEN=token)
+        assert "X-Profile-Id" not in events_list(HTTP_X_PROFILE_TOKEN="forged")
+        assert not RequestProfile.objects.exists()
+
+    def test_sampling(self, events_list, settings):
+        settings.PROFILING_SAMPLE_RATE = 1.0
+
+        events_list()
+
+        assert RequestProfile.objects.get().trigger == ProfileTrigger.SAMPLED.value
+
+    def test_keeps_the_newest(self, events_list, settings):
+        settings.PROFILING_SAMPLE_RATE = 1.0
+        settings.PROFILING_KEEP = 2
+
+        request_ids = [events_list()["X-Profile-Id"] for _ in range(3)]
+
+        assert set(RequestProfile.objects.values_list("request_id", flat=True)) == set(request_ids[1:])
+        assert not default_storage.exists(f"profiles/{request_ids[0]}.prof")
+
+
+class TestAdmin:
+    def test_token_and_download(self, client, admin_user, events_list):
+        client.force_login(admin_user)
+        token = client.get(reverse("admin:gdg_profiling_requestprofile_token")).content.decode()
+        profile_id = events_list(HTTP_X_PROFILE_TOKEN=token)["X-Profile-Id"]
+        profile = RequestProfile.objects.get(request_id=profile_id)
+
+        assert client.get(reverse("admin:gdg_profiling_requestprofile_changelist")).status_code == 200
+        response = client.get(reverse("admin:gdg_profiling_requestprofile_download", args=[profile.pk]))
+        assert response["Content-Disposition"] == f'attachment; filename="{profile_id}.prof"'
+        assert marshal.loads(b"".join(response.streaming_content))
+
+    def test_staff_only(self, client, user):
+        client.force_login(user)
+
+        assert client.get(reverse("admin:gdg_profiling_requestprofile_token")).status_code == 302
@@ -0,0 +1,92 @@
+import logging
+
+import pytest
+from django.db import connection
+from django.urls import reverse
+
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_profiling.models import SlowQuery
+from gdg_registration_backend.apps.gdg_profiling.slow_queries import fingerprint
+from gdg_registration_backend.apps.gdg_profiling.slow_queries import normalize
+from gdg_registration_backend.apps.gdg_registration.tests.factories import EventRegistrationFactory
+
+pytestmark = pytest.mark.django_db
+
+WORKSHOP = EventTypes.WORKSHOP.value
+
+
+@pytest.fixture
+def events_list(client):
+    EventRegistrationFactory()
+
+    def get():
+        return client.get(reverse("api:events_list"), {"event_type": WORKSHOP})
+
+    return get
+
+
+@pytest.fixture
+def every_query_is_slow(settings):
+    # Read when the test client builds its middleware chain, on its first request
+    settings.SLOW_QUERY_MS = 1e-6
+
+
+def test_normalize():
+    assert normalize("SELECT * FROM t WHERE id IN (%s, %s, %s) AND x = 'a''b' LIMIT 21") == (
+        "SELECT * FROM t WHERE id IN (...) AND x = ? LIMIT ?"
+    )
+    assert normalize('INSERT INTO "t2" VALUES (%s, %s),\n (%s, %s)') == 'INSERT INTO "t2" VALUES (...)'
+    assert fingerprint(normalize("WHERE id IN (%s)")) == fingerprint(normalize("WHERE id IN (%s, %s)"))
+
+
+class TestSlowQueryMiddleware:
+    def test_off_by_default(self, events_list):
+        events_list()
+
+        assert not SlowQuery.objects.exists()
+
+    def test_under_the_threshold(self, events_list, settings):
+        settings.SLOW_QUERY_MS = 60_000
+
+        events_list()
+
+        assert not SlowQuery.objects.exists()
+
+    def test_aggregates_by_fingerprint(self, events_list, every_query_is_slow, caplog):
+        with caplog.at_level(logging.WARNING, logger="gdg_registration_backend.apps.gdg_profiling.slow_queries"):
+            events_list()
+            events_list()
+
+        # The page query, the entries are only read once and then cached
+        [listing] = SlowQuery.objects.filter(
+            call_site__contains="in get_event_list", sql__contains="gdg_registration"
+        ).filter(sql__contains="ORDER BY")
+        assert listing.call_site.startswith("apps/gdg_registration/service.py:")
+        assert (listing.view_name, listing.calls) == ("api:events_list", 2)
+        assert listing.total_ms >= listing.max_ms > 0
+        assert "?" in listing.sql
+        if connection.vendor == "postgresql":
+            assert "Scan" in listing.plan
+        else:
+            assert listing.plan == ""
+        assert any(listing.call_site in record.getMessage() for record in caplog.records)
+
+    def test_explains_are_not_counted_as_the_views_queries(self, events_list, every_query_is_slow, settings, caplog):
+        settings.QUERY_STATS = True
+
+        with caplog.at_level(logging.WARNING, logger="gdg_registration_backend.db.queries"):
+            response = events_list()
+
+        # The event, the page and its entries, as without the slow query log
+        assert response["Server-Timing"].split(", ")[0].endswith(';desc="3 queries"')
+        # No query_budget warning
+        assert not [record for record in caplog.records if record.name == "gdg_registration_backend.db.queries"]
+
+
+def test_admin(admin_client, events_list, every_query_is_slow):
+    events_list()
+
+    response = admin_client.get(reverse("admin:gdg_profiling_slowquery_changelist"))
+
+    assert response.status_code == 200
+    assert b"get_event_list" in response.content
@@ -1,10 +1,59 @@
 from django.contrib import admin
-from .models import EventRegistration
+from .models import ArchivedRegistration, EventRegistration, StatusTransition
+from .service import RegistrationService
 
 
 # Register Registration model
 @admin.register(EventRegistration)
 class RegistrationAdmin(admin.ModelAdmin):
-    list_display = ('participant', 'event')
+    list_display = ('participant', 'event', 'participant_status', 'payment_acknowledgement', 'registered_at', 'waitlist_score')
     search_fields = ('participant__name', 'event__name', 'participant__ambassador_name')
-    list_filter = ('event__event_type', 'participant__payment_acknowledgement')
+    list_filter = ('event__event_type', 'participant_status', 'payment_acknowledgement')
+    # Bumped on save, see VersionedModel
+    readonly_fields = ('version',)
+
+    def save_model(self, request, obj, form, change):
+        # A status change goes through the service like any other, so it is
+        # recorded as a StatusTransition by the staff member who made it
+        participant_status = obj.participant_status
+        status_changed = 'participant_status' in form.changed_data
+        if status_changed:
+            obj.participant_status = form.initial['participant_status']
+        super().save_model(request, obj, form, change)
+        if status_changed:
+            RegistrationService.update_registration_status(obj, participant_status, actor=request.user)
+
+
+# Status transitions are append-only, the admin only reads them
+@admin.register(StatusTransition)
+class StatusTransitionAdmin(admin.ModelAdmin):
+    list_display = ('participant', 'event', 'from_status', 'to_status', 'actor', 'created_at')
+    search_fields = ('participant__name', 'participant__email_address')
+    list_filter = ('event__event_type', 'to_status')
+    list_select_related = ('participant', 'event', 'actor')
+    date_hierarchy = 'created_at'
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+# Archived registrations are written by the archive_registrations command only
+@admin.register(ArchivedRegistration)
+class ArchivedRegistrationAdmin(admin.ModelAdmin):
+    list_display = ('name', 'email_address', 'event', 'participant_status', 'registered_at', 'archived_at')
+    search_fields = ('email_address',)
+    list_filter = ('event__event_type', 'participant_status')
+    list_select_related = ('event',)
+    date_hierarchy = 'registered_at'
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
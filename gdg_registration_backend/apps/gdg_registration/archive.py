@@ -0,0 +1,155 @@
+"""
+Archival of past seasons.
+
+Events are reused every season, so their registrations pile up in the live
+tables. ``archive_registrations`` moves the registrations made before a cutoff
+into ``ArchivedRegistration``, one transaction per chunk. Each archived row
+keeps the participant's details and the status transitions of the registration,
+which are deleted from ``StatusTransition``. Participants left without a live
+registration are deleted too. Archived rows are read through
+``archived_registrations`` and never join the live tables.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.db import transaction
+
+from gdg_registration_backend.apps.gdg_notifications.models import OutboxEmail
+from gdg_registration_backend.apps.gdg_participants.models import Participant
+from gdg_registration_backend.apps.gdg_registration.models import ArchivedRegistration
+from gdg_registration_backend.apps.gdg_registration.models import EventRegistration
+from gdg_registration_backend.apps.gdg_registration.models import StatusTransition
+
+ARCHIVE_BATCH_SIZE = 1000
+
+REGISTRATION_DETAILS = (
+    "workshop_participation",
+    "team_name",
+    "team_members",
+    "purpose_of_participation",
+    "google_technologies",
+    "previous_projects",
+    "waitlist_score",
+)
+PARTICIPANT_DETAILS = (
+    "cnic",
+    "phone_number",
+    "organization",
+    "linkedin_url",
+    "github_url",
+    "participant_type",
+    "ambassador_name",
+    "job_role",
+)
+
+
+@dataclass
+class ArchiveRunResult:
+    registrations: int = 0
+    participants: int = 0
+    transitions: int = 0
+
+
+def archivable_registrations(before: datetime, event_id: int | None = None):
+    registrations = EventRegistration.objects.filter(registered_at__lt=before)
+    if event_id:
+        registrations = registrations.filter(event_id=event_id)
+    return registrations
+
+
+def archive_registrations(
+    before: datetime,
+    event_id: int | None = None,
+    batch_size: int = ARCHIVE_BATCH_SIZE,
+    on_progress=None,
+) -> ArchiveRunResult:
+    """
+    Move the registrations made before ``before`` into the archive,
+    ``batch_size`` at a time. An interrupted run keeps the chunks it committed
+    and the next run picks up the rest.
+    """
+    result = ArchiveRunResult()
+    while True:
+        with transaction.atomic():
+            chunk = list(
+                archivable_registrations(before, event_id)
+                .select_related("participant")
+                .select_for_update(of=("self",))
+                .order_by("id")[:batch_size]
+            )
+            if not chunk:
+                return result
+            _archive_chunk(chunk, result)
+        if on_progress:
+            on_progress(result)
+
+
+def _archive_chunk(chunk: list, result: ArchiveRunResult) -> None:
+    participant_ids = {registration.participant_id for registration in chunk}
+    archived_pairs = {(registration.participant_id, registration.event_id) for registration in chunk}
+
+    history = {}
+    transition_ids = []
+    transitions = StatusTransition.objects.filter(
+        participant_id__in=participant_ids,
+        event_id__in={registration.event_id for registration in chunk},
+    ).order_by("id")
+    for transition in transitions:
+        pair = (transition.participant_id, transition.event_id)
+        if pair not in archived_pairs:
+            continue
+        transition_ids.append(transition.id)
+        history.setdefault(pair, []).append(
+            {
+                "from": transition.from_status,
+                "to": transition.to_status,
+                "actor_id": transition.actor_id,
+                "at": transition.created_at.isoformat(),
+            }
+        )
+
+    ArchivedRegistration.objects.bulk_create(
+        [
+            ArchivedRegistration(
+                registration_id=registration.id,
+                event_id=registration.event_id,
+                participant_id=registration.participant_id,
+                name=registration.participant.name,
+                email_address=registration.participant.email_address,
+                participant_status=registration.participant_status,
+                payment_acknowledgement=registration.payment_acknowledgement,
+                registered_at=registration.registered_at,
+                details={
+                    **{field: getattr(registration, field) for field in REGISTRATION_DETAILS},
+                    **{field: getattr(registration.participant, field) for field in PARTICIPANT_DETAILS},
+                },
+                history=history.get((registration.participant_id, registration.event_id), []),
+            )
+            for registration in chunk
+        ]
+    )
+    StatusTransition.objects.filter(id__in=transition_ids).delete()
+    EventRegistration.objects.filter(id__in=[registration.id for registration in chunk]).delete()
+
+    # Participants of this chunk with nothing left in the live tables
+    orphans = (
+        participant_ids
+        - set(EventRegistration.objects.filter(participant_id__in=participant_ids).values_list("participant_id", flat=True))
+        - set(StatusTransition.objects.filter(participant_id__in=participant_ids).values_list("participant_id", flat=True))
+    )
+    if orphans:
+        OutboxEmail.objects.filter(participant_id__in=orphans).update(participant=None)
+        Participant.objects.filter(id__in=orphans).delete()
+
+    result.registrations += len(chunk)
+    result.participants += len(orphans)
+    result.transitions += len(transition_ids)
+
+
+def archived_registrations(event_id: int, season: int | None = None):
+    """Archived registrations of an event, in registration order."""
+    registrations = ArchivedRegistration.objects.filter(event_id=event_id)
+    if season:
+        registrations = registrations.filter(registered_at__year=season)
+    return registrations.order_by("registered_at", "id")
@@ -0,0 +1,134 @@
+"""Bulk synthetic data generators for the registration benchmarks."""
+
+import random
+from dataclasses import dataclass
+from dataclasses import field
+
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_events.models import Event
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantType
+from gdg_registration_backend.apps.gdg_participants.models import Participant
+from gdg_registration_backend.apps.gdg_registration.models import EventRegistration
+
+BATCH_SIZE = 2000
+
+WORKSHOPS = ["Flutter", "Gemini", "Firebase", "Android", "Cloud Run", "Angular"]
+GOOGLE_TECHNOLOGIES = ["Gemini", "Firebase", "Flutter", "Vertex AI", "Maps", "BigQuery"]
+JOB_ROLES = ["Software Engineer", "Data Scientist", "Product Manager", "Designer", "Student"]
+ORGANIZATIONS = ["FAST", "NED", "IBA", "Habib University", "Systems Ltd", "Careem"]
+
+
+@dataclass
+class BenchmarkData:
+    events: dict[str, Event]
+    # Participant ids registered for each event type, in registration order
+    participant_ids: dict[str, list[int]] = field(default_factory=dict)
+
+
+def create_events() -> dict[str, Event]:
+    """Return the three DevFest events, creating any that are missing."""
+    return {
+        tag.value: Event.objects.get_or_create(
+            event_type=tag.value, defaults={"name": f"DevFest {tag.value.title()}"}
+        )[0]
+        for tag in EventTypes
+    }
+
+
+def build_participant(index: int, rng: random.Random, prefix: str = "bench") -> Participant:
+    return Participant(
+        name=f"Participant {index}",
+        email_address=f"{prefix}-{index}@example.com",
+        cnic=f"42101-{index:07d}-{index % 10}",
+        phone_number=f"03{index:09d}",
+        organization=rng.choice(ORGANIZATIONS),
+        linkedin_url=f"https://linkedin.com/in/{prefix}-{index}",
+        participant_type=rng.choice([tag.value for tag in ParticipantType]),
+        ambassador_name=rng.choice(["", "Ali", "Sara", "Hamza"]),
+    )
+
+
+def build_team_member(index: int, member: int) -> dict:
+    return {
+        "name": f"Member {index}-{member}",
+        "email_address": f"member-{index}-{member}@example.com",
+        "linkedin_url": f"https://linkedin.com/in/member-{index}-{member}",
+        "github_url": f"https://github.com/member-{index}-{member}",
+        "phone_number": f"03{index:07d}{member:02d}",
+        "cnic": f"42101-{index:07d}-{member}",
+    }
+
+
+def registration_fields(event_type: str, index: int, rng: random.Random) -> dict:
+    """Event specific EventRegistration fields, shaped like real submissions."""
+    if event_type == EventTypes.WORKSHOP.value:
+        return {"workshop_participation": rng.sample(WORKSHOPS, rng.randint(1, 3))}
+    if event_type == EventTypes.HACKATHON.value:
+        return {
+            "team_name": f"Team {index}",
+            "team_members": [
+                build_team_member(index, member) for member in range(rng.randint(2, 4))
+            ],
+            "purpose_of_participation": "Build something useful with Google technologies.",
+            "google_technologies": rng.sample(GOOGLE_TECHNOLOGIES, rng.randint(1, 3)),
+            "previous_projects": "A Flutter app for campus events.",
+        }
+    return {}
+
+
+def seed(size: int, seed_value: int = 0) -> BenchmarkData:
+    """
+    Bulk insert ``size`` participants, each registered for one event type.
+
+    Registrations are spread round-robin over the event types, so every event
+    list holds about a third of the rows.
+    """
+    rng = random.Random(seed_value)  # noqa: S311
+    events = create_events()
+    event_types = [tag.value for tag in EventTypes]
+
+    participants = []
+    for index in range(size):
+        participant = build_participant(index, rng)
+        if event_types[index % len(event_types)] == EventTypes.CONFERENCE.value:
+            participant.job_role = rng.choice(JOB_ROLES)
+        participants.append(participant)
+    participants = Participant.objects.bulk_create(participants, batch_size=BATCH_SIZE)
+
+    data = BenchmarkData(events=events, participant_ids={key: [] for key in event_types})
+    registrations = []
+    for index, participant in enumerate(participants):
+        event_type = event_types[index % len(event_types)]
+        registrations.append(
+            EventRegistration(
+                participant=participant,
+                event=events[event_type],
+                **registration_fields(event_type, index, rng),
+            )
+        )
+        data.participant_ids[event_type].append(participant.id)
+    EventRegistration.objects.bulk_create(registrations, batch_size=BATCH_SIZE)
+
+    return data
+
+
+def registration_payload(
+    event_type: str, index: int, rng: random.Random, prefix: str = "bench"
+) -> dict:
+    """Request body for ``events/register/`` as the registration form sends it."""
+    participant = build_participant(index, rng, prefix)
+    payload = {
+        "event_type": event_type,
+        "name": participant.name,
+        "email_address": participant.email_address,
+        "cnic": participant.cnic,
+        "phone_number": participant.phone_number,
+        "participant_type": participant.participant_type,
+        "organization": participant.organization,
+        "linkedin_url": participant.linkedin_url,
+        "ambassador_name": participant.ambassador_name,
+        **registration_fields(event_type, index, rng),
+    }
+    if event_type == EventTypes.CONFERENCE.value:
+        payload["job_role"] = rng.choice(JOB_ROLES)
+    return payload
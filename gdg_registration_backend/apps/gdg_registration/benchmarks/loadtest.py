@@ -0,0 +1,278 @@
+"""
+Open-loop load generator for the registration endpoints.
+
+Requests are issued on an arrival schedule rather than back to back, so a slow
+server builds up a queue the same way it would when the registration form
+opens. Latency is measured from the scheduled arrival time, which keeps
+queueing delay in the percentiles instead of hiding it.
+"""
+
+import http.client
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from urllib.parse import urlencode
+from urllib.parse import urlsplit
+
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
+
+from .data import registration_payload
+
+PATTERNS = ["constant", "poisson", "ramp", "burst", "closed"]
+ENDPOINTS = {
+    "register": ("POST", "events/register/"),
+    "list": ("GET", "events/list/"),
+    "status": ("POST", "participants/status/update/"),
+}
+DEFAULT_MIX = {"register": 8, "list": 1, "status": 1}
+
+
+@dataclass
+class Sample:
+    endpoint: str
+    latency: float
+    # HTTP status code, 0 when the request never got a response
+    status: int
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 400  # noqa: PLR2004
+
+
+@dataclass
+class EndpointReport:
+    endpoint: str
+    requests: int
+    errors: int
+    throughput: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    # Failed requests per status code, 0 for connection errors and timeouts
+    errors_by_status: dict[int, int]
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+
+def arrival_times(
+    pattern: str,
+    rate: float,
+    duration: float,
+    rng: random.Random,
+    burst_factor: float = 5.0,
+    burst_seconds: float = 5.0,
+) -> list[float]:
+    """
+    Offsets in seconds at which requests are sent.
+
+    ``constant`` spaces requests evenly, ``poisson`` draws exponential gaps,
+    ``ramp`` grows the rate linearly from zero to ``rate`` and ``burst`` sends
+    ``burst_factor`` times the rate for the first ``burst_seconds`` (the moment
+    registration opens) before settling at ``rate``.
+    """
+    if pattern == "constant":
+        return [index / rate for index in range(int(rate * duration))]
+    if pattern == "poisson":
+        times, now = [], rng.expovariate(rate)
+        while now < duration:
+            times.append(now)
+            now += rng.expovariate(rate)
+        return times
+    if pattern == "ramp":
+        # Cumulative arrivals are rate * t^2 / (2 * duration), invert for t
+        total = int(rate * duration / 2)
+        return [duration * math.sqrt(index / total) for index in range(total)] if total else []
+    if pattern == "burst":
+        burst_seconds = min(burst_seconds, duration)
+        burst_rate = rate * burst_factor
+        times = [index / burst_rate for index in range(int(burst_rate * burst_seconds))]
+        steady = int(rate * (duration - burst_seconds))
+        return times + [burst_seconds + index / rate for index in range(steady)]
+    msg = f"Unknown arrival pattern: {pattern}"
+    raise ValueError(msg)
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(samples: list[Sample], elapsed: float) -> list[EndpointReport]:
+    reports = []
+    by_endpoint: dict[str, list[Sample]] = {}
+    for sample in samples:
+        by_endpoint.setdefault(sample.endpoint, []).append(sample)
+    by_endpoint["total"] = samples
+
+    for endpoint, endpoint_samples in by_endpoint.items():
+        latencies = sorted(sample.latency * 1000 for sample in endpoint_samples)
+        reports.append(
+            EndpointReport(
+                endpoint=endpoint,
+                requests=len(endpoint_samples),
+                errors=sum(1 for sample in endpoint_samples if not sample.ok),
+                throughput=len(endpoint_samples) / elapsed if elapsed else 0.0,
+                p50_ms=percentile(latencies, 50),
+                p95_ms=percentile(latencies, 95),
+                p99_ms=percentile(latencies, 99),
+                errors_by_status=dict(
+                    Counter(sample.status for sample in endpoint_samples if not sample.ok)
+                ),
+            )
+        )
+    return reports
+
+
+class LoadTest:
+    def __init__(
+        self,
+        base_url: str,
+        mix: dict[str, int] | None = None,
+        seed: int = 0,
+        timeout: float = 30.0,
+    ):
+        url = urlsplit(base_url)
+        self.scheme = url.scheme
+        self.netloc = url.netloc
+        self.prefix = url.path.rstrip("/") + "/"
+        self.mix = mix or DEFAULT_MIX
+        self.timeout = timeout
+        self.rng = random.Random(seed)  # noqa: S311
+        # Unique per run, the participant email address is unique
+        self.run_id = f"load{int(time.time())}"
+        self.counter = 0
+        self.event_types = [tag.value for tag in EventTypes]
+        # Participant ids seen in list responses, used for status updates
+        self.known_participants: dict[str, list[int]] = {key: [] for key in self.event_types}
+        self.lock = threading.RLock()
+        self.local = threading.local()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        # One keep-alive connection per worker thread
+        if getattr(self.local, "connection", None) is None:
+            connection_class = (
+                http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+            )
+            self.local.connection = connection_class(self.netloc, timeout=self.timeout)
+        return self.local.connection
+
+    def _drop_connection(self) -> None:
+        connection = getattr(self.local, "connection", None)
+        if connection is not None:
+            connection.close()
+        self.local.connection = None
+
+    def next_request(self) -> tuple[str, str, str, dict | None]:
+        """Pick the next endpoint by weight and build its request. Not thread safe."""
+        endpoint = self.rng.choices(list(self.mix), weights=list(self.mix.values()))[0]
+        method, path = ENDPOINTS[endpoint]
+        event_type = self.rng.choice(self.event_types)
+
+        if endpoint == "register":
+            self.counter += 1
+            body = registration_payload(event_type, self.counter, self.rng, prefix=self.run_id)
+            return endpoint, method, path, body
+
+        if endpoint == "list":
+            query = {"event_type": event_type, "page": self.rng.randint(1, 5), "perPage": 10}
+            return endpoint, method, f"{path}?{urlencode(query)}", None
+
+        with self.lock:
+            candidates = list(self.known_participants[event_type])
+        participants = self.rng.sample(candidates, min(len(candidates), self.rng.randint(1, 20)))
+        body = {
+            "type": event_type,
+            "status": ParticipantStatus.SHORTLISTED.value,
+            # An unknown id still exercises the endpoint before any list response arrived
+            "participants": participants or [0],
+        }
+        return endpoint, method, path, body
+
+    def send(self, endpoint: str, method: str, path: str, body: dict | None, scheduled: float) -> Sample:
+        headers = {"Accept": "application/json"}
+        payload = None
+        if body is not None:
+            payload = json.dumps(body)
+            headers["Content-Type"] = "application/json"
+
+        try:
+            connection = self._connection()
+            connection.request(method, self.prefix + path, body=payload, headers=headers)
+            response = connection.getresponse()
+            content = response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            self._drop_connection()
+            return Sample(endpoint, time.perf_counter() - scheduled, 0)
+
+        latency = time.perf_counter() - scheduled
+        if endpoint == "list" and status == 200:  # noqa: PLR2004
+            self._remember(content)
+        return Sample(endpoint, latency, status)
+
+    def _remember(self, content: bytes) -> None:
+        try:
+            data = json.loads(content)
+            ids = [participant["id"] for participant in data["participants"]]
+            event_type = data["event_type"]
+        except (ValueError, KeyError, TypeError):
+            return
+        with self.lock:
+            known = self.known_participants.setdefault(event_type, [])
+            known.extend(ids)
+            del known[:-1000]
+
+    def run(
+        self,
+        pattern: str,
+        rate: float,
+        duration: float,
+        concurrency: int,
+        **pattern_options,
+    ) -> tuple[list[Sample], float]:
+        """Run the load test, returns the samples and the elapsed wall-clock time."""
+        if pattern == "closed":
+            return self._run_closed(duration, concurrency)
+
+        schedule = arrival_times(pattern, rate, duration, self.rng, **pattern_options)
+        futures = []
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            started = time.perf_counter()
+            for offset in schedule:
+                scheduled = started + offset
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(executor.submit(self.send, *self.next_request(), scheduled))
+            samples = [future.result() for future in futures]
+        return samples, time.perf_counter() - started
+
+    def _run_closed(self, duration: float, concurrency: int) -> tuple[list[Sample], float]:
+        # Every worker sends its next request as soon as the previous one returns
+        samples: list[Sample] = []
+        started = time.perf_counter()
+        deadline = started + duration
+
+        def worker():
+            while time.perf_counter() < deadline:
+                with self.lock:
+                    request = self.next_request()
+                sample = self.send(*request, time.perf_counter())
+                with self.lock:
+                    samples.append(sample)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for _ in range(concurrency):
+                executor.submit(worker)
+        return samples, time.perf_counter() - started
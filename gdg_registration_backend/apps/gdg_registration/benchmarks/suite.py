@@ -0,0 +1,232 @@
+"""Timing, query count and peak memory benchmarks for RegistrationService."""
+
+import itertools
+import json
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+from contextlib import contextmanager
+from dataclasses import asdict
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connection
+from django.db import transaction
+from django.test.utils import CaptureQueriesContext
+
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_participants.data_class_model import ShortlistDTO
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
+from gdg_registration_backend.apps.gdg_registration.fragments import registration_fragments
+from gdg_registration_backend.apps.gdg_registration.models import EventRegistration
+from gdg_registration_backend.apps.gdg_registration.service import RegistrationService
+
+from .data import BenchmarkData
+from .data import registration_payload
+from .data import seed
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+PER_PAGE = 10
+# Number of participants touched by one bulk status change
+STATUS_BATCH = 500
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    size: int
+    seconds: float
+    queries: int
+    peak_memory_kb: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}@{self.size}"
+
+
+@dataclass
+class BenchmarkCase:
+    name: str
+    func: Callable[[], object]
+    # Untimed, restores the state ``func`` starts from before every run
+    reset: Callable[[], object] | None = None
+
+
+def measure(
+    name: str,
+    size: int,
+    func: Callable[[], object],
+    repeat: int = 3,
+    reset: Callable[[], object] | None = None,
+) -> BenchmarkResult:
+    """
+    Run ``func`` once under query capture and tracemalloc, then ``repeat`` more
+    times untraced and keep the fastest wall-clock time. ``reset`` runs before
+    each of them, outside the measurement.
+    """
+    reset = reset or (lambda: None)
+    reset()
+    tracemalloc.start()
+    try:
+        with CaptureQueriesContext(connection) as queries:
+            func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    timings = []
+    for _ in range(repeat):
+        reset()
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+
+    return BenchmarkResult(
+        name=name,
+        size=size,
+        seconds=min(timings) if timings else 0.0,
+        queries=len(queries),
+        peak_memory_kb=round(peak / 1024, 1),
+    )
+
+
+def benchmark_cases(data: BenchmarkData) -> list[BenchmarkCase]:
+    cases: list[BenchmarkCase] = []
+
+    for position, (event_type, participant_ids) in enumerate(data.participant_ids.items()):
+        # Round-robin seeding puts participant ``position`` first in this event
+        email = f"bench-{position}@example.com"
+        last_page = max(1, -(-len(participant_ids) // PER_PAGE))
+        cases += [
+            BenchmarkCase(
+                f"get_event_list.{event_type}.first_page",
+                lambda event_type=event_type: RegistrationService.get_event_list(
+                    event_type, 1, PER_PAGE, None, None
+                ),
+            ),
+            BenchmarkCase(
+                f"get_event_list.{event_type}.deep_page",
+                lambda event_type=event_type, page=last_page: RegistrationService.get_event_list(
+                    event_type, page, PER_PAGE, None, None
+                ),
+            ),
+            BenchmarkCase(
+                f"get_event_list.{event_type}.filter_type",
+                lambda event_type=event_type: RegistrationService.get_event_list(
+                    event_type, 1, PER_PAGE, "participant_type", "STUDENT"
+                ),
+            ),
+            BenchmarkCase(
+                f"get_event_list.{event_type}.filter_email",
+                lambda event_type=event_type, email=email: RegistrationService.get_event_list(
+                    event_type, 1, PER_PAGE, "email_address", email
+                ),
+            ),
+        ]
+
+    # Every call needs a fresh participant, the email address is unique
+    counter = itertools.count()
+    rng = random.Random(0)  # noqa: S311
+    for event_type in data.participant_ids:
+        cases.append(
+            BenchmarkCase(
+                f"register_event.{event_type}",
+                lambda event_type=event_type: RegistrationService.register_event(
+                    event_type,
+                    registration_payload(event_type, next(counter), rng, prefix="bench-new"),
+                ),
+            )
+        )
+
+    workshop = EventTypes.WORKSHOP.value
+    batch = ShortlistDTO(participants=data.participant_ids[workshop][:STATUS_BATCH])
+
+    def reset_batch():
+        # Back to PENDING, a repeat would otherwise find the batch in the target
+        # status already and time an UPDATE that changes nothing
+        EventRegistration.objects.filter(
+            event__event_type=workshop, participant_id__in=batch.participants
+        ).update(participant_status=ParticipantStatus.PENDING.value)
+
+    cases += [
+        BenchmarkCase(
+            "shortlist_participants",
+            lambda: RegistrationService.shortlist_participants(batch, workshop),
+            reset_batch,
+        ),
+        BenchmarkCase(
+            "status_participants",
+            lambda: RegistrationService.status_participants(
+                batch, workshop, ParticipantStatus.CONFIRMED.value
+            ),
+            reset_batch,
+        ),
+    ]
+    return cases
+
+
+@contextmanager
+def private_fragments():
+    """
+    Cache event list fragments apart from the shared cache for the run. The
+    rows are rolled back and their ids handed out again, and so are the keys.
+    """
+    fragments = registration_fragments()
+    shared = fragments.shared
+    fragments.clear()
+    fragments.shared = LocMemCache("benchmark-fragments", {})
+    try:
+        yield
+    finally:
+        fragments.clear()
+        fragments.shared.clear()
+        fragments.shared = shared
+
+
+def run_suite(size: int, repeat: int = 3) -> list[BenchmarkResult]:
+    """Seed ``size`` registrations, benchmark every case and roll everything back."""
+    with private_fragments(), transaction.atomic():
+        data = seed(size)
+        results = [
+            measure(case.name, size, case.func, repeat, case.reset) for case in benchmark_cases(data)
+        ]
+        transaction.set_rollback(True)
+    return results
+
+
+def load_baseline(path: Path = DEFAULT_BASELINE) -> dict:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_baseline(results: list[BenchmarkResult], path: Path = DEFAULT_BASELINE) -> None:
+    baseline = load_baseline(path)
+    for result in results:
+        baseline[result.key] = asdict(result)
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+def compare(results: list[BenchmarkResult], baseline: dict, tolerance: float = 0.25) -> list[str]:
+    """
+    Return a message for every result that is slower than the baseline by more
+    than ``tolerance`` or issues more queries than the baseline did.
+    """
+    regressions = []
+    for result in results:
+        reference = baseline.get(result.key)
+        if not reference:
+            continue
+        if result.queries > reference["queries"]:
+            regressions.append(
+                f"{result.key}: {result.queries} queries, baseline {reference['queries']}"
+            )
+        if result.seconds > reference["seconds"] * (1 + tolerance):
+            regressions.append(
+                f"{result.key}: {result.seconds * 1000:.1f} ms, "
+                f"baseline {reference['seconds'] * 1000:.1f} ms"
+            )
+    return regressions
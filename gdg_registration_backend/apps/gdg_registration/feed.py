@@ -0,0 +1,195 @@
+"""
+Live feed of registration and status changes for organizer dashboards.
+
+``RegistrationService`` publishes a message to the channel of the event once
+the change commits, and the websocket application forwards it to every
+connection subscribed to that event. Messages fan out through a broker:
+
+* ``RedisBroker`` publishes with Redis ``PUBLISH``. Each ASGI process keeps a
+  single pattern subscription and hands messages to its local subscribers, so
+  a dashboard costs neither a database query nor a Redis connection. A lost
+  subscription is logged and re-established with backoff; messages published
+  meanwhile are missed.
+* ``InMemoryBroker`` delivers within the process, for tests and local runs.
+
+Each subscriber has a bounded queue. A dashboard that stops reading loses
+messages instead of holding memory, and it can reload the list endpoint to
+catch up.
+"""
+
+import asyncio
+import functools
+import json
+import logging
+
+from django.conf import settings
+from django.db import transaction
+
+from gdg_registration_backend.apps.gdg_events.models import Event
+from gdg_registration_backend.apps.gdg_registration.models import EventRegistration
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "gdg:feed:"
+SUBSCRIBER_QUEUE_SIZE = 1000
+# Seconds before resubscribing to Redis, doubled after each failed attempt
+RECONNECT_DELAY = 0.5
+MAX_RECONNECT_DELAY = 30.0
+
+
+def event_channel(event_type: str) -> str:
+    return f"{CHANNEL_PREFIX}{event_type}"
+
+
+class Subscriber:
+    """One websocket connection's inbox, bound to the event loop it reads from."""
+
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.channels: set[str] = set()
+
+    def put(self, message: dict) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning("Dropping feed message for a slow subscriber")
+
+    async def get(self) -> dict:
+        return await self.queue.get()
+
+
+class InMemoryBroker:
+    def __init__(self):
+        self.subscribers: dict[str, set[Subscriber]] = {}
+
+    def subscriber(self) -> Subscriber:
+        return Subscriber()
+
+    async def subscribe(self, subscriber: Subscriber, channel: str) -> None:
+        self.subscribers.setdefault(channel, set()).add(subscriber)
+        subscriber.channels.add(channel)
+
+    def unsubscribe(self, subscriber: Subscriber, channel: str) -> None:
+        self.subscribers.get(channel, set()).discard(subscriber)
+        subscriber.channels.discard(channel)
+
+    def close(self, subscriber: Subscriber) -> None:
+        for channel in list(subscriber.channels):
+            self.unsubscribe(subscriber, channel)
+
+    def deliver(self, channel: str, message: dict) -> None:
+        """Hand ``message`` to the local subscribers, callable from any thread."""
+        for subscriber in list(self.subscribers.get(channel, ())):
+            try:
+                subscriber.loop.call_soon_threadsafe(subscriber.put, message)
+            except RuntimeError:
+                # The connection's loop is closed, it is about to unsubscribe
+                pass
+
+    def publish(self, channel: str, message: dict) -> None:
+        self.deliver(channel, message)
+
+
+class RedisBroker(InMemoryBroker):
+    def __init__(self, url: str):
+        import redis
+        import redis.asyncio
+
+        super().__init__()
+        self.client = redis.Redis.from_url(url)
+        self.async_client = redis.asyncio.Redis.from_url(url)
+        self.listener: asyncio.Task | None = None
+
+    def publish(self, channel: str, message: dict) -> None:
+        self.client.publish(channel, json.dumps(message))
+
+    async def subscribe(self, subscriber: Subscriber, channel: str) -> None:
+        await super().subscribe(subscriber, channel)
+        if self.listener is None or self.listener.done():
+            self.listener = asyncio.create_task(self.listen())
+
+    async def listen(self) -> None:
+        import redis
+
+        delay = RECONNECT_DELAY
+        while True:
+            pubsub = self.async_client.pubsub()
+            try:
+                await pubsub.psubscribe(f"{CHANNEL_PREFIX}*")
+                delay = RECONNECT_DELAY
+                async for item in pubsub.listen():
+                    if item["type"] != "pmessage":
+                        continue
+                    self.deliver(item["channel"].decode(), json.loads(item["data"]))
+            except (redis.ConnectionError, redis.TimeoutError) as e:
+                logger.warning("Feed subscription lost, resubscribing in %.1fs: %s", delay, e)
+            finally:
+                await pubsub.aclose()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+
+_memory_broker = InMemoryBroker()
+
+
+@functools.cache
+def _redis_broker(url: str) -> RedisBroker:
+    return RedisBroker(url)
+
+
+def get_broker() -> InMemoryBroker:
+    """Redis when ``FEED_REDIS_URL`` is set, in-process otherwise."""
+    url = getattr(settings, "FEED_REDIS_URL", "")
+    return _redis_broker(url) if url else _memory_broker
+
+
+def publish(event_type: str, message_type: str, data: dict) -> None:
+    """
+    Publish to the event's channel once the current transaction commits. A
+    broker failure is logged and never fails the change itself.
+    """
+    message = {"type": message_type, "event_type": event_type, "data": data}
+
+    def send():
+        try:
+            get_broker().publish(event_channel(event_type), message)
+        except Exception:
+            logger.exception("Could not publish %s for %s", message_type, event_type)
+
+    transaction.on_commit(send)
+
+
+def publish_registration_created(registration: EventRegistration) -> None:
+    participant = registration.participant
+    publish(
+        registration.event.event_type,
+        "registration.created",
+        {
+            "registration_id": registration.id,
+            "participant_id": participant.id,
+            "name": participant.name,
+            "participant_type": participant.participant_type,
+            "status": registration.participant_status,
+            "team_name": registration.team_name,
+            "registered_at": registration.registered_at.isoformat(),
+        },
+    )
+
+
+def publish_status_changed(event: Event, participant_status: str, changes: list) -> None:
+    """One message for a batch of ``(participant_id, name, previous status)`` changes."""
+    if not changes:
+        return
+
+    publish(
+        event.event_type,
+        "status.changed",
+        {
+            "status": participant_status,
+            "participants": [
+                {"id": participant_id, "name": name, "from_status": previous_status}
+                for participant_id, name, previous_status in changes
+            ],
+        },
+    )
@@ -0,0 +1,265 @@
+"""
+Cached list entries of registrations.
+
+``get_event_list`` serializes each registration of a page to a JSON fragment.
+A fragment is keyed by the registration id and by the ``version`` of the
+registration and of its participant, which every write bumps. A changed row is
+looked up under a new key and its old fragment ages out, so nothing is ever
+invalidated.
+
+Lookups go to a bounded LRU in the process first, then to the shared cache
+(``CACHES["default"]``, Redis in production), which keeps fragments warm
+across workers and deploys.
+
+Missing fragments are built single-flight. A shortlisting round gives a whole
+page new keys at once, and the organizers refreshing it wait for one build
+instead of each running it:
+
+- within a worker, the threads that need a key another thread is building
+  wait on its future;
+- across workers, the builder holds a lock key in the shared cache, taken
+  with ``add()`` (``SET NX`` on Redis). The others poll the shared cache for
+  the fragment for up to ``LOCK_WAIT`` seconds, then build it themselves.
+  The lock holds a token of the build that took it, and a build only deletes
+  the locks that still hold its token. A build that outlives ``LOCK_TIMEOUT``
+  so leaves alone a lock another worker has taken since. On Redis the check
+  and the delete are one script, elsewhere they are two calls.
+
+Fragments also expire after ``FRAGMENT_CACHE_TIMEOUT``. So that hot ones are
+not all rebuilt at once, a lookup may rebuild an entry a little before it
+expires, the more likely the closer it is to expiring and the longer it took
+to build (probabilistic early expiration). Only the caller that takes the lock
+rebuilds it, the others keep the cached fragment meanwhile.
+"""
+
+import functools
+import math
+import random
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+
+from django.conf import settings
+from django.core.cache import caches
+
+from gdg_registration_backend.metrics import record_cache_lookup
+
+# Bump when a participant DTO or the entry layout changes, older fragments are then ignored
+FRAGMENT_FORMAT = 2
+# Seconds a build lock outlives a worker that died holding it
+LOCK_TIMEOUT = 10
+# Seconds a worker waits for a fragment another worker is building
+LOCK_WAIT = 2.0
+POLL_INTERVAL = 0.05
+# Above 1 rebuilds earlier, below 1 later
+EARLY_REFRESH_BETA = 1.0
+
+# Deletes each lock in KEYS that still holds the token ARGV[1]
+RELEASE_LOCKS_SCRIPT = """
+local released = 0
+for _, key in ipairs(KEYS) do
+    if redis.call("get", key) == ARGV[1] then
+        released = released + redis.call("del", key)
+    end
+end
+return released
+"""
+
+# (fragment, expires at as a timestamp, seconds its build took)
+Entry = tuple[str, float, float]
+
+
+def fragment_key(registration_id: int, version: int, participant_version: int) -> str:
+    return f"registration-dto:{FRAGMENT_FORMAT}:{registration_id}:{version}:{participant_version}"
+
+
+def lock_key(key: str) -> str:
+    return f"{key}:lock"
+
+
+def redis_client(cache):
+    """The redis-py client behind a django-redis cache, None for other backends."""
+    get_client = getattr(getattr(cache, "client", None), "get_client", None)
+    return get_client(write=True) if get_client else None
+
+
+def expires_early(entry: Entry, now: float, beta: float = EARLY_REFRESH_BETA) -> bool:
+    _, expires_at, build_seconds = entry
+    return now - build_seconds * beta * math.log(1 - random.random()) >= expires_at  # noqa: S311
+
+
+class FragmentCache:
+    def __init__(self, shared, local_size: int, timeout: int):
+        self.shared = shared
+        self.local_size = local_size
+        self.timeout = timeout
+        self.local: OrderedDict[str, Entry] = OrderedDict()
+        # Keys this process is building, with the future their fragment is set on
+        self.building: dict[str, Future] = {}
+        self.lock = threading.Lock()
+
+    def get_or_build(self, keys: list[str], build: Callable[[list[str]], dict[str, str]]) -> dict[str, str]:
+        """
+        Fragments of ``keys``. ``build`` is called with the keys that are
+        neither cached nor being built elsewhere and returns their fragments.
+        Keys it leaves out, e.g. deleted rows, are left out of the result.
+        """
+        entries = self.get_many(keys)
+        now = time.time()
+        fragments = {key: fragment for key, (fragment, _, _) in entries.items()}
+        refresh = [key for key, entry in entries.items() if expires_early(entry, now)]
+        missing = [key for key in keys if key not in entries]
+        if not missing and not refresh:
+            return fragments
+
+        owned, awaited = self.claim(missing + refresh, fragments)
+        try:
+            # An integer, which Redis backends store as it is rather than pickled
+            token = secrets.randbits(63)
+            locked = self.lock_shared(owned, token)
+            try:
+                fragments.update(self.build_and_store(locked, build))
+            finally:
+                self.unlock_shared(locked, token)
+            # Refreshes another worker is doing keep the cached fragment
+            contended = [key for key in owned if key not in locked and key not in fragments]
+            if contended:
+                fragments.update(self.wait_shared(contended))
+                fragments.update(self.build_and_store([key for key in contended if key not in fragments], build))
+        except BaseException as exc:
+            self.release(owned, exc=exc)
+            raise
+        self.release(owned, fragments)
+
+        failed = []
+        for key, future in awaited.items():
+            try:
+                fragment = future.result(timeout=LOCK_TIMEOUT)
+            except Exception:  # noqa: BLE001
+                # The other thread's build failed or hangs, this request builds its own
+                failed.append(key)
+                continue
+            if fragment is not None:
+                fragments[key] = fragment
+        record_cache_lookup("fragments_coalesced", hit=True, count=len(awaited) - len(failed))
+        fragments.update(self.build_and_store(failed, build))
+        return fragments
+
+    def get_many(self, keys: list[str]) -> dict[str, Entry]:
+        found = {}
+        now = time.time()
+        with self.lock:
+            for key in keys:
+                entry = self.local.get(key)
+                if entry is not None and entry[1] > now:
+                    self.local.move_to_end(key)
+                    found[key] = entry
+        record_cache_lookup("fragments_local", hit=True, count=len(found))
+        record_cache_lookup("fragments_local", hit=False, count=len(keys) - len(found))
+
+        missing = [key for key in keys if key not in found]
+        if missing:
+            shared = self.shared.get_many(missing)
+            record_cache_lookup("fragments_shared", hit=True, count=len(shared))
+            record_cache_lookup("fragments_shared", hit=False, count=len(missing) - len(shared))
+            self.remember(shared)
+            found.update(shared)
+        return found
+
+    def set_many(self, entries: dict[str, Entry]) -> None:
+        self.remember(entries)
+        self.shared.set_many(entries, self.timeout)
+
+    def remember(self, entries: dict[str, Entry]) -> None:
+        with self.lock:
+            for key, entry in entries.items():
+                self.local[key] = entry
+                self.local.move_to_end(key)
+            while len(self.local) > self.local_size:
+                self.local.popitem(last=False)
+
+    def clear(self) -> None:
+        """Empty the local LRU, the shared cache is left alone."""
+        with self.lock:
+            self.local.clear()
+
+    def claim(self, keys: list[str], cached: dict[str, str]) -> tuple[list[str], dict[str, Future]]:
+        """Split ``keys`` into those this thread builds and those another thread already does."""
+        owned, awaited = [], {}
+        with self.lock:
+            for key in keys:
+                future = self.building.get(key)
+                if future is None:
+                    self.building[key] = Future()
+                    owned.append(key)
+                elif key not in cached:
+                    awaited[key] = future
+        return owned, awaited
+
+    def release(self, owned: list[str], fragments: dict[str, str] | None = None, exc: BaseException | None = None):
+        with self.lock:
+            futures = [self.building.pop(key) for key in owned]
+        for key, future in zip(owned, futures, strict=True):
+            if exc is None:
+                future.set_result(fragments.get(key))
+            else:
+                future.set_exception(exc)
+
+    def lock_shared(self, keys: list[str], token: int) -> list[str]:
+        # add() returns None instead of False when an unreachable Redis is
+        # ignored, every worker then builds for itself
+        return [key for key in keys if self.shared.add(lock_key(key), token, LOCK_TIMEOUT) is not False]
+
+    def unlock_shared(self, keys: list[str], token: int) -> None:
+        """Delete the locks of ``keys`` that still hold ``token``."""
+        if not keys:
+            return
+        locks = [lock_key(key) for key in keys]
+        client = redis_client(self.shared)
+        if client is not None:
+            import redis
+
+            try:
+                release = client.register_script(RELEASE_LOCKS_SCRIPT)
+                release(keys=[self.shared.make_key(lock) for lock in locks], args=[token])
+            except redis.RedisError:
+                # Like the cache calls, an unreachable Redis does not fail the
+                # request. The locks expire after LOCK_TIMEOUT
+                pass
+        else:
+            held = self.shared.get_many(locks)
+            self.shared.delete_many([lock for lock, value in held.items() if value == token])
+
+    def wait_shared(self, keys: list[str]) -> dict[str, str]:
+        """Fragments other workers build for ``keys``, polled for up to ``LOCK_WAIT`` seconds."""
+        found = {}
+        pending = list(keys)
+        deadline = time.monotonic() + LOCK_WAIT
+        while pending and time.monotonic() < deadline:
+            time.sleep(POLL_INTERVAL)
+            values = self.shared.get_many(pending + [lock_key(key) for key in pending])
+            entries = {key: values[key] for key in pending if key in values}
+            self.remember(entries)
+            found.update({key: fragment for key, (fragment, _, _) in entries.items()})
+            # A lock released without a fragment, e.g. for a deleted row, is not waited for
+            pending = [key for key in pending if key not in entries and lock_key(key) in values]
+        record_cache_lookup("fragments_coalesced", hit=True, count=len(found))
+        return found
+
+    def build_and_store(self, keys: list[str], build: Callable[[list[str]], dict[str, str]]) -> dict[str, str]:
+        if not keys:
+            return {}
+        start = time.perf_counter()
+        fragments = build(keys)
+        build_seconds = time.perf_counter() - start
+        expires_at = time.time() + self.timeout
+        self.set_many({key: (fragment, expires_at, build_seconds) for key, fragment in fragments.items()})
+        return fragments
+
+
+@functools.cache
+def registration_fragments() -> FragmentCache:
+    return FragmentCache(caches["default"], settings.FRAGMENT_CACHE_LOCAL_SIZE, settings.FRAGMENT_CACHE_TIMEOUT)
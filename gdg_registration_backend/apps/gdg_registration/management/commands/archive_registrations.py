@@ -0,0 +1,57 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.utils import timezone
+
+from gdg_registration_backend.apps.gdg_events.models import Event
+from gdg_registration_backend.apps.gdg_registration.archive import ARCHIVE_BATCH_SIZE
+from gdg_registration_backend.apps.gdg_registration.archive import archivable_registrations
+from gdg_registration_backend.apps.gdg_registration.archive import archive_registrations
+
+
+class Command(BaseCommand):
+    help = "Move registrations of past seasons out of the live tables into the archive."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--before", required=True,
+            help="Archive registrations made before this date, e.g. 2025-01-01.",
+        )
+        parser.add_argument("--event-type", help="Only this event, all events by default.")
+        parser.add_argument("--batch-size", type=int, default=ARCHIVE_BATCH_SIZE)
+        parser.add_argument("--dry-run", action="store_true", help="Only count the registrations.")
+
+    def handle(self, *args, **options):
+        try:
+            before = datetime.fromisoformat(options["before"])
+        except ValueError as e:
+            raise CommandError(f"Invalid --before date: {options['before']}") from e
+        if timezone.is_naive(before):
+            before = timezone.make_aware(before)
+
+        event_id = None
+        if options["event_type"]:
+            event = Event.objects.filter(event_type=options["event_type"]).first()
+            if not event:
+                msg = f"Event {options['event_type']} not found."
+                raise CommandError(msg)
+            event_id = event.id
+
+        if options["dry_run"]:
+            count = archivable_registrations(before, event_id).count()
+            self.stdout.write(f"{count} registrations would be archived")
+            return
+
+        def report(result):
+            self.stdout.write(f"Archived {result.registrations} registrations")
+
+        result = archive_registrations(
+            before, event_id, batch_size=options["batch_size"], on_progress=report,
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result.registrations} registrations archived, "
+                f"{result.participants} participants and {result.transitions} transitions removed"
+            )
+        )
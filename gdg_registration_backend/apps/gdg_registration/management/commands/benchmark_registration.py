@@ -0,0 +1,64 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from gdg_registration_backend.apps.gdg_registration.benchmarks.suite import DEFAULT_BASELINE
+from gdg_registration_backend.apps.gdg_registration.benchmarks.suite import DEFAULT_SIZES
+from gdg_registration_backend.apps.gdg_registration.benchmarks.suite import compare
+from gdg_registration_backend.apps.gdg_registration.benchmarks.suite import load_baseline
+from gdg_registration_backend.apps.gdg_registration.benchmarks.suite import run_suite
+from gdg_registration_backend.apps.gdg_registration.benchmarks.suite import save_baseline
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark RegistrationService against synthetic data. All generated rows "
+        "are rolled back when the run finishes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", nargs="+", type=int, default=DEFAULT_SIZES,
+            help="Number of registrations to seed for each run.",
+        )
+        parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case.")
+        parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+        parser.add_argument(
+            "--tolerance", type=float, default=0.25,
+            help="Allowed slowdown against the baseline, 0.25 means 25%%.",
+        )
+        parser.add_argument(
+            "--save-baseline", action="store_true",
+            help="Store the results as the new baseline instead of comparing.",
+        )
+        parser.add_argument(
+            "--fail-on-regression", action="store_true",
+            help="Exit with an error when a case regressed against the baseline.",
+        )
+
+    def handle(self, *args, **options):
+        results = []
+        for size in options["sizes"]:
+            self.stdout.write(f"Seeding {size} registrations...")
+            size_results = run_suite(size, options["repeat"])
+            for result in size_results:
+                self.stdout.write(
+                    f"  {result.name:<48} {result.seconds * 1000:>10.2f} ms "
+                    f"{result.queries:>6} queries {result.peak_memory_kb:>10.1f} KiB"
+                )
+            results += size_results
+
+        if options["save_baseline"]:
+            save_baseline(results, options["baseline"])
+            self.stdout.write(self.style.SUCCESS(f"Baseline saved to {options['baseline']}"))
+            return
+
+        regressions = compare(results, load_baseline(options["baseline"]), options["tolerance"])
+        for regression in regressions:
+            self.stdout.write(self.style.WARNING(regression))
+        if regressions and options["fail_on_regression"]:
+            msg = f"{len(regressions)} benchmark regression(s) against the baseline"
+            raise CommandError(msg)
+        if not regressions:
+            self.stdout.write(self.style.SUCCESS("No regressions against the baseline"))
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from gdg_registration_backend.apps.gdg_events.models import Event
+from gdg_registration_backend.apps.gdg_registration.tickets import TICKET_BATCH_SIZE
+from gdg_registration_backend.apps.gdg_registration.tickets import generate_tickets
+
+
+class Command(BaseCommand):
+    help = "Render QR tickets for confirmed participants whose ticket data changed."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--event-type", help="Only this event, all events by default.")
+        parser.add_argument(
+            "--workers", type=int, default=None,
+            help="Rendering processes, one per CPU by default.",
+        )
+        parser.add_argument("--batch-size", type=int, default=TICKET_BATCH_SIZE)
+        parser.add_argument("--force", action="store_true", help="Render every ticket again.")
+
+    def handle(self, *args, **options):
+        event_id = None
+        if options["event_type"]:
+            event = Event.objects.filter(event_type=options["event_type"]).first()
+            if not event:
+                msg = f"Event {options['event_type']} not found."
+                raise CommandError(msg)
+            event_id = event.id
+
+        def report(result):
+            self.stdout.write(f"Rendered {result.rendered}, unchanged {result.unchanged}")
+
+        result = generate_tickets(
+            event_id,
+            workers=options["workers"],
+            batch_size=options["batch_size"],
+            force=options["force"],
+            on_progress=report,
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"{result.rendered} tickets rendered, {result.unchanged} unchanged")
+        )
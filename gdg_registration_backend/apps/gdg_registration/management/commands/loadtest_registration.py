@@ -0,0 +1,86 @@
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from gdg_registration_backend.apps.gdg_registration.benchmarks.data import create_events
+from gdg_registration_backend.apps.gdg_registration.benchmarks.loadtest import DEFAULT_MIX
+from gdg_registration_backend.apps.gdg_registration.benchmarks.loadtest import ENDPOINTS
+from gdg_registration_backend.apps.gdg_registration.benchmarks.loadtest import PATTERNS
+from gdg_registration_backend.apps.gdg_registration.benchmarks.loadtest import LoadTest
+from gdg_registration_backend.apps.gdg_registration.benchmarks.loadtest import summarize
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    mix = {}
+    for part in value.split(","):
+        endpoint, _, weight = part.partition("=")
+        if endpoint not in ENDPOINTS or not weight.isdigit():
+            msg = f"Invalid mix entry: {part}"
+            raise CommandError(msg)
+        mix[endpoint] = int(weight)
+    return mix
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive events/register/, events/list/ and participants/status/update/ on a "
+        "running server and report latency percentiles, error rates and throughput."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--base-url", default="http://127.0.0.1:8000/api/v1/registration/",
+            help="Registration API root of the server under test.",
+        )
+        parser.add_argument("--pattern", choices=PATTERNS, default="constant")
+        parser.add_argument("--rate", type=float, default=50.0, help="Requests per second.")
+        parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run.")
+        parser.add_argument("--concurrency", type=int, default=32, help="Concurrent connections.")
+        parser.add_argument("--burst-factor", type=float, default=5.0)
+        parser.add_argument("--burst-seconds", type=float, default=5.0)
+        parser.add_argument(
+            "--mix", default=",".join(f"{key}={value}" for key, value in DEFAULT_MIX.items()),
+            help="Endpoint weights, e.g. register=8,list=1,status=1.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--create-events", action="store_true",
+            help="Create the DevFest events in the configured database first.",
+        )
+
+    def handle(self, *args, **options):
+        if options["create_events"]:
+            create_events()
+
+        pattern_options = {}
+        if options["pattern"] == "burst":
+            pattern_options = {
+                "burst_factor": options["burst_factor"],
+                "burst_seconds": options["burst_seconds"],
+            }
+
+        load_test = LoadTest(options["base_url"], parse_mix(options["mix"]), options["seed"])
+        self.stdout.write(
+            f"Running {options['pattern']} load at {options['rate']} req/s for "
+            f"{options['duration']}s with {options['concurrency']} connections..."
+        )
+        samples, elapsed = load_test.run(
+            options["pattern"], options["rate"], options["duration"],
+            options["concurrency"], **pattern_options,
+        )
+
+        self.stdout.write(
+            f"{'endpoint':<10} {'requests':>9} {'errors':>8} {'req/s':>9} "
+            f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+        )
+        for report in summarize(samples, elapsed):
+            self.stdout.write(
+                f"{report.endpoint:<10} {report.requests:>9} {report.error_rate:>8.1%} "
+                f"{report.throughput:>9.1f} {report.p50_ms:>9.1f} {report.p95_ms:>9.1f} "
+                f"{report.p99_ms:>9.1f}"
+            )
+            if report.errors_by_status and report.endpoint != "total":
+                breakdown = ", ".join(
+                    f"{status or 'no response'}: {count}"
+                    for status, count in sorted(report.errors_by_status.items())
+                )
+                self.stdout.write(f"{'':<10} errors by status: {breakdown}")
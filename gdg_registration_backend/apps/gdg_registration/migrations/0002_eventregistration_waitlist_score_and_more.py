@@ -0,0 +1,31 @@
+# Generated by Django 5.0.9 on 2026-10-18 23:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gdg_events', '0002_event_capacity'),
+        ('gdg_participants', '0003_alter_participant_participant_status'),
+        ('gdg_registration', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='eventregistration',
+            name='waitlist_score',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='eventregistration',
+            name='event',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, to='gdg_events.event'),
+        ),
+        migrations.AlterField(
+            model_name='eventregistration',
+            name='participant',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, to='gdg_participants.participant'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0.9 on 2026-10-18 23:48
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gdg_events', '0002_event_capacity'),
+        ('gdg_participants', '0003_alter_participant_participant_status'),
+        ('gdg_registration', '0002_eventregistration_waitlist_score_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatusTransition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(choices=[('PENDING', 'PENDING'), ('SHORTLISTED', 'SHORTLISTED'), ('CONFIRMED', 'CONFIRMED'), ('REJECTED', 'REJECTED'), ('ATTENDED', 'ATTENDED')], max_length=20)),
+                ('to_status', models.CharField(choices=[('PENDING', 'PENDING'), ('SHORTLISTED', 'SHORTLISTED'), ('CONFIRMED', 'CONFIRMED'), ('REJECTED', 'REJECTED'), ('ATTENDED', 'ATTENDED')], max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('actor', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, to='gdg_events.event')),
+                ('participant', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, to='gdg_participants.participant')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['event', 'created_at'], name='transition_event_timeline'), models.Index(fields=['participant', 'created_at'], name='transition_participant_time')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.9 on 2026-10-19 00:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gdg_registration', '0003_statustransition'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='eventregistration',
+            name='ticket',
+            field=models.FileField(blank=True, max_length=255, upload_to='tickets/'),
+        ),
+    ]
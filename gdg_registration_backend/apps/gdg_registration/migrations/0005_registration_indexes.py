@@ -0,0 +1,46 @@
+# Generated by Django 5.0.9 on 2026-10-19 00:15
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gdg_events', '0002_event_capacity'),
+        ('gdg_participants', '0004_participant_status_type_index'),
+        ('gdg_registration', '0004_eventregistration_ticket'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Build the composite indexes before dropping the single-column FK
+        # indexes they replace, so the table is never left without one
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['event', 'registered_at', 'id'], name='registration_event_time'),
+        ),
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['event', '-waitlist_score', 'registered_at', 'id'], name='registration_waitlist'),
+        ),
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['participant', 'event'], name='registration_participant_event'),
+        ),
+        migrations.AddIndex(
+            model_name='statustransition',
+            index=models.Index(fields=['event', 'id'], name='transition_event_version'),
+        ),
+        migrations.AlterField(
+            model_name='eventregistration',
+            name='event',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.DO_NOTHING, to='gdg_events.event'),
+        ),
+        migrations.AlterField(
+            model_name='eventregistration',
+            name='participant',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.DO_NOTHING, to='gdg_participants.participant'),
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.0.9 on 2026-10-19 09:30
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_status_from_participants(apps, schema_editor):
+    # Every registration of a participant starts from the participant's
+    # current global status, one UPDATE for the whole table
+    EventRegistration = apps.get_model("gdg_registration", "EventRegistration")
+    Participant = apps.get_model("gdg_participants", "Participant")
+    participant = Participant.objects.filter(pk=OuterRef("participant_id"))
+    EventRegistration.objects.update(
+        participant_status=Subquery(participant.values("participant_status")[:1]),
+        payment_acknowledgement=Subquery(participant.values("payment_acknowledgement")[:1]),
+    )
+
+
+def copy_status_to_participants(apps, schema_editor):
+    # Going back to one status per participant keeps the latest registration's
+    EventRegistration = apps.get_model("gdg_registration", "EventRegistration")
+    Participant = apps.get_model("gdg_participants", "Participant")
+    latest = EventRegistration.objects.filter(participant_id=OuterRef("pk")).order_by("-registered_at", "-id")
+    Participant.objects.filter(pk__in=EventRegistration.objects.values("participant_id")).update(
+        participant_status=Subquery(latest.values("participant_status")[:1]),
+        payment_acknowledgement=Subquery(latest.values("payment_acknowledgement")[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gdg_participants', '0004_participant_status_type_index'),
+        ('gdg_registration', '0005_registration_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='eventregistration',
+            name='participant_status',
+            field=models.CharField(choices=[('PENDING', 'PENDING'), ('SHORTLISTED', 'SHORTLISTED'), ('CONFIRMED', 'CONFIRMED'), ('REJECTED', 'REJECTED'), ('ATTENDED', 'ATTENDED')], default='PENDING', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='eventregistration',
+            name='payment_acknowledgement',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(copy_status_from_participants, copy_status_to_participants),
+        # Index the copied values in one pass rather than row by row
+        migrations.RemoveIndex(
+            model_name='eventregistration',
+            name='registration_waitlist',
+        ),
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['event', 'participant_status', 'registered_at', 'id'], name='registration_event_status'),
+        ),
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['event', 'participant_status', '-waitlist_score', 'registered_at', 'id'], name='registration_waitlist'),
+        ),
+    ]
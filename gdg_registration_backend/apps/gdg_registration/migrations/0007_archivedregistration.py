@@ -0,0 +1,35 @@
+# Generated by Django 5.0.9 on 2026-10-19 00:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gdg_events', '0002_event_capacity'),
+        ('gdg_registration', '0006_eventregistration_participant_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedRegistration',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('registration_id', models.PositiveIntegerField(unique=True)),
+                ('participant_id', models.PositiveIntegerField()),
+                ('name', models.CharField(max_length=255)),
+                ('email_address', models.EmailField(max_length=254)),
+                ('participant_status', models.CharField(choices=[('PENDING', 'PENDING'), ('SHORTLISTED', 'SHORTLISTED'), ('CONFIRMED', 'CONFIRMED'), ('REJECTED', 'REJECTED'), ('ATTENDED', 'ATTENDED')], max_length=20)),
+                ('payment_acknowledgement', models.BooleanField(default=False)),
+                ('registered_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('details', models.JSONField(default=dict)),
+                ('history', models.JSONField(default=list)),
+                ('event', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.DO_NOTHING, to='gdg_events.event')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['event', 'registered_at', 'id'], name='archive_event_time'), models.Index(fields=['email_address'], name='archive_email')],
+            },
+        ),
+    ]
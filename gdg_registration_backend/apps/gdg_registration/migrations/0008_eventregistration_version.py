@@ -0,0 +1,18 @@
+# Generated by Django 5.0.9 on 2026-10-19 01:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gdg_registration', '0007_archivedregistration'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='eventregistration',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -1,14 +1,21 @@
 # from asyncio import Event
+from django.conf import settings
 from django.db import models
 
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
 from gdg_registration_backend.apps.gdg_participants.models import Participant
 from gdg_registration_backend.apps.gdg_events.models import Event
+from gdg_registration_backend.db.models import VersionedModel
 
 
 
-class EventRegistration(models.Model):
-    participant = models.ForeignKey(Participant, on_delete=models.DO_NOTHING)
-    event = models.ForeignKey(Event, on_delete=models.DO_NOTHING)
+class EventRegistration(VersionedModel):
+    # Waitlist order: highest score first, then first come first served.
+    WAITLIST_ORDERING = ("-waitlist_score", "registered_at", "id")
+
+    # Both foreign keys lead a composite index below, single-column ones would be redundant
+    participant = models.ForeignKey(Participant, on_delete=models.DO_NOTHING, db_index=False)
+    event = models.ForeignKey(Event, on_delete=models.DO_NOTHING, db_index=False)
     registered_at = models.DateTimeField(auto_now_add=True)
     workshop_participation = models.JSONField(null=True)
     team_name = models.CharField(max_length=255, null=True)
@@ -16,6 +23,81 @@ class EventRegistration(models.Model):
     purpose_of_participation = models.TextField(null=True)
     google_technologies = models.JSONField(null=True)
     previous_projects = models.TextField(null=True)
+    waitlist_score = models.IntegerField(default=0)
+    # Status and payment are per event: a participant shortlisted for the
+    # hackathon can still be pending for the workshop
+    participant_status = models.CharField(max_length=20, choices=[(tag.name, tag.value) for tag in ParticipantStatus], default=ParticipantStatus.PENDING.value)
+    payment_acknowledgement = models.BooleanField(default=False)
+    # Pre-rendered QR ticket, named after a fingerprint of its printed data
+    ticket = models.FileField(upload_to="tickets/", max_length=255, blank=True)
+
+    class Meta:
+        indexes = [
+            # Event lists page through an event in registration order
+            models.Index(fields=["event", "registered_at", "id"], name="registration_event_time"),
+            # Status filters and seat counts within an event, in list order
+            models.Index(fields=["event", "participant_status", "registered_at", "id"], name="registration_event_status"),
+            # Head of an event's waitlist (its PENDING rows), see WAITLIST_ORDERING
+            models.Index(fields=["event", "participant_status", "-waitlist_score", "registered_at", "id"], name="registration_waitlist"),
+            # Duplicate registration checks and joins from a participant
+            models.Index(fields=["participant", "event"], name="registration_participant_event"),
+        ]
 
     def __str__(self):
         return f"{self.participant.name} - {self.event.name}"
+
+
+class StatusTransition(models.Model):
+    """Append-only record of a participant status change, written in bulk."""
+
+    participant = models.ForeignKey(Participant, on_delete=models.DO_NOTHING)
+    event = models.ForeignKey(Event, on_delete=models.DO_NOTHING)
+    from_status = models.CharField(max_length=20, choices=[(tag.name, tag.value) for tag in ParticipantStatus])
+    to_status = models.CharField(max_length=20, choices=[(tag.name, tag.value) for tag in ParticipantStatus])
+    # None for anonymous API calls and automatic waitlist promotions
+    actor = models.ForeignKey(settings.AUTH_USER_MODEL, null=True, on_delete=models.SET_NULL, related_name="+")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["event", "created_at"], name="transition_event_timeline"),
+            models.Index(fields=["participant", "created_at"], name="transition_participant_time"),
+            # Check-in snapshot versions and deltas, see snapshots.py
+            models.Index(fields=["event", "id"], name="transition_event_version"),
+        ]
+
+    def __str__(self):
+        return f"{self.participant_id}: {self.from_status} -> {self.to_status}"
+
+
+class ArchivedRegistration(models.Model):
+    """
+    A registration from a past season, moved out of the live tables by the
+    ``archive_registrations`` command together with its participant details
+    and status history. Read-only from then on.
+    """
+
+    # Id the row had in EventRegistration, archiving it twice is an error
+    registration_id = models.PositiveIntegerField(unique=True)
+    event = models.ForeignKey(Event, on_delete=models.DO_NOTHING, db_index=False)
+    # Plain id, the participant itself is deleted once none of its rows are live
+    participant_id = models.PositiveIntegerField()
+    name = models.CharField(max_length=255)
+    email_address = models.EmailField()
+    participant_status = models.CharField(max_length=20, choices=[(tag.name, tag.value) for tag in ParticipantStatus])
+    payment_acknowledgement = models.BooleanField(default=False)
+    registered_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+    # Remaining registration and participant fields, see archive.py
+    details = models.JSONField(default=dict)
+    # Status transitions as [{"from", "to", "actor_id", "at"}], oldest first
+    history = models.JSONField(default=list)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["event", "registered_at", "id"], name="archive_event_time"),
+            models.Index(fields=["email_address"], name="archive_email"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} - {self.registered_at:%Y}"
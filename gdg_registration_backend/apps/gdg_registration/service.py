@@ -1,9 +1,12 @@
+import json
 from dataclasses import asdict
+from django.db import connection
+from django.db import transaction
+from django.db.models import F
 from rest_framework import status
 from rest_framework.response import Response
 
 from gdg_registration_backend.apps.gdg_events.models import Event
-from gdg_registration_backend.apps.gdg_events.data_class_model import EventDTO
 from gdg_registration_backend.apps.gdg_participants.data_class_model import (
     ConferenceParticipantCreateDTO,
     ConferenceParticipantDTO,
@@ -16,135 +19,215 @@ from gdg_registration_backend.apps.gdg_participants.data_class_model import (
     WorkshopParticipantCreateDTO,
     WorkshopParticipantDTO,
 )
+from gdg_registration_backend.apps.gdg_jobs.models import Job
+from gdg_registration_backend.apps.gdg_jobs.runner import enqueue_job
+from gdg_registration_backend.apps.gdg_notifications.outbox import enqueue_status_emails
 from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
 from gdg_registration_backend.apps.gdg_participants.models import Participant
-from gdg_registration_backend.apps.gdg_registration.models import EventRegistration
+from gdg_registration_backend.apps.gdg_registration.archive import archived_registrations
+from gdg_registration_backend.apps.gdg_registration.feed import publish_registration_created
+from gdg_registration_backend.apps.gdg_registration.feed import publish_status_changed
+from gdg_registration_backend.apps.gdg_registration.fragments import fragment_key
+from gdg_registration_backend.apps.gdg_registration.fragments import registration_fragments
+from gdg_registration_backend.apps.gdg_registration.models import EventRegistration, StatusTransition
+from gdg_registration_backend.apps.gdg_registration.tickets import read_ticket_token
 from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.db.queries import query_budget
+from gdg_registration_backend.replicas import replica_reads
+
+# Participant ids per UPDATE statement in bulk status changes
+STATUS_UPDATE_CHUNK_SIZE = 1000
+
+# List filters that live on the registration rather than on the participant
+REGISTRATION_FILTERS = ("participant_status", "payment_acknowledgement")
+
+# Outcomes of a ticket scan
+CHECKED_IN = "CHECKED_IN"
+ALREADY_CHECKED_IN = "ALREADY_CHECKED_IN"
+NOT_ADMISSIBLE = "NOT_ADMISSIBLE"
+INVALID_TICKET = "INVALID_TICKET"
+
+
+def coerce_participant_ids(values) -> list[int]:
+    """
+    Participant ids of a request body as integers, the raw status UPDATE
+    compares them to a bigint column. Raises ValueError for anything else.
+    """
+    message = "Participant ids must be a list of integers."
+    if not isinstance(values, (list, tuple)) or any(isinstance(value, (bool, float)) for value in values):
+        raise ValueError(message)
+    try:
+        return [int(value) for value in values]
+    except (TypeError, ValueError):
+        raise ValueError(message) from None
 
 
 class RegistrationService:
 
     @staticmethod
+    @query_budget(3)
+    @replica_reads()
     def get_event_list(
         event_type: str, page: int, per_page: int, filter_by: str, search: str
-    ) -> EventDTO:
+    ) -> dict:
         event = Event.objects.filter(event_type=event_type).first()
         if not event:
             raise ValueError("Event not found.")
 
-        participants = Participant.objects.all()
+        registrations = EventRegistration.objects.filter(event=event)
         if filter_by and search:
-            participants = participants.filter(**{filter_by: search})
-        registrations = EventRegistration.objects.filter(
-            event=event, participant__in=participants
-        )
+            # Status filters hit the (event, status) index, the rest go through the participant
+            if filter_by in REGISTRATION_FILTERS:
+                registrations = registrations.filter(**{filter_by: search})
+            else:
+                registrations = registrations.filter(**{f"participant__{filter_by}": search})
+        # Registration order keeps pages stable. Only ids and versions are read
+        # for the page, the wide rows only for the entries not cached yet.
+        page_rows = registrations.order_by("registered_at", "id").values_list(
+            "id", "version", "participant__version"
+        )[page * per_page - per_page : page * per_page]
+        keys = {
+            registration_id: fragment_key(registration_id, version, participant_version)
+            for registration_id, version, participant_version in page_rows
+        }
+
+        registration_ids = {key: registration_id for registration_id, key in keys.items()}
+
+        def build(missing_keys):
+            # A row changed since the page was read is stored under its older
+            # key, readers of that version then get newer data, never older
+            rows = EventRegistration.objects.filter(
+                id__in=[registration_ids[key] for key in missing_keys]
+            ).select_related("participant")
+            return {
+                keys[reg.id]: json.dumps(asdict(RegistrationService._participant_dto(event_type, reg)))
+                for reg in rows
+            }
 
+        fragments = registration_fragments().get_or_build(list(keys.values()), build)
+        return {
+            "event_type": event.event_type,
+            # Rows deleted since the page was read are left out
+            "participants": [json.loads(fragments[key]) for key in keys.values() if key in fragments],
+        }
+
+    @staticmethod
+    def _participant_dto(event_type: str, reg: EventRegistration) -> ParticipantDTO:
         if event_type == EventTypes.WORKSHOP.value:
-            participant_dtos = [
-                WorkshopParticipantDTO(
-                    id=reg.participant.id,
-                    name=reg.participant.name,
-                    email_address=reg.participant.email_address,
-                    cnic=reg.participant.cnic,
-                    participant_type=reg.participant.participant_type,
-                    phone_number=reg.participant.phone_number,
-                    organization=reg.participant.organization,
-                    linkedin_url=reg.participant.linkedin_url,
-                    ambassador_name=reg.participant.ambassador_name,
-                    payment_acknowledgement=reg.participant.payment_acknowledgement,
-                    participant_status=reg.participant.participant_status,
-                    workshop_participation=reg.workshop_participation,
-                )
-                for reg in registrations[page * per_page - per_page : page * per_page]
-            ]
+            return WorkshopParticipantDTO(
+                id=reg.participant.id,
+                name=reg.participant.name,
+                email_address=reg.participant.email_address,
+                cnic=reg.participant.cnic,
+                participant_type=reg.participant.participant_type,
+                phone_number=reg.participant.phone_number,
+                organization=reg.participant.organization,
+                linkedin_url=reg.participant.linkedin_url,
+                ambassador_name=reg.participant.ambassador_name,
+                payment_acknowledgement=reg.payment_acknowledgement,
+                participant_status=reg.participant_status,
+                workshop_participation=reg.workshop_participation,
+            )
 
-        elif event_type == EventTypes.CONFERENCE.value:
-            participant_dtos = [
-                ConferenceParticipantDTO(
-                    id=reg.participant.id,
-                    name=reg.participant.name,
-                    email_address=reg.participant.email_address,
-                    cnic=reg.participant.cnic,
-                    participant_type=reg.participant.participant_type,
-                    phone_number=reg.participant.phone_number,
-                    organization=reg.participant.organization,
-                    linkedin_url=reg.participant.linkedin_url,
-                    ambassador_name=reg.participant.ambassador_name,
-                    payment_acknowledgement=reg.participant.payment_acknowledgement,
-                    participant_status=reg.participant.participant_status,
-                    job_role=reg.participant.job_role,
-                )
-                for reg in registrations[page * per_page - per_page : page * per_page]
-            ]
+        if event_type == EventTypes.CONFERENCE.value:
+            return ConferenceParticipantDTO(
+                id=reg.participant.id,
+                name=reg.participant.name,
+                email_address=reg.participant.email_address,
+                cnic=reg.participant.cnic,
+                participant_type=reg.participant.participant_type,
+                phone_number=reg.participant.phone_number,
+                organization=reg.participant.organization,
+                linkedin_url=reg.participant.linkedin_url,
+                ambassador_name=reg.participant.ambassador_name,
+                payment_acknowledgement=reg.payment_acknowledgement,
+                participant_status=reg.participant_status,
+                job_role=reg.participant.job_role,
+            )
 
-        elif event_type == EventTypes.HACKATHON.value:
-            participant_dtos = [
-                HackathonParticipantDTO(
-                    id=reg.participant.id,
-                    name=reg.participant.name,
-                    email_address=reg.participant.email_address,
-                    cnic=reg.participant.cnic,
-                    participant_type=reg.participant.participant_type,
-                    phone_number=reg.participant.phone_number,
-                    organization=reg.participant.organization,
-                    linkedin_url=reg.participant.linkedin_url,
-                    ambassador_name=reg.participant.ambassador_name,
-                    payment_acknowledgement=reg.participant.payment_acknowledgement,
-                    participant_status=reg.participant.participant_status,
-                    team_name=reg.team_name,
-                    team_members=[
-                        HackathonTeamMemberDTO(
-                            name=team_member["name"],
-                            email_address=team_member.get("email_address"),
-                            linkedin_url=team_member.get("linkedin_url"),
-                            github_url=team_member.get("github_url", "N/A"),
-                            phone_number=team_member.get("phone_number"),
-                            cnic=team_member.get("cnic"),
-                        )
-                        for team_member in reg.team_members
-                    ],
-                    purpose_of_participation=reg.purpose_of_participation,
-                    google_technologies=reg.google_technologies,
-                    previous_projects=reg.previous_projects,
-                )
-                for reg in registrations[page * per_page - per_page : page * per_page]
-            ]
+        if event_type == EventTypes.HACKATHON.value:
+            return HackathonParticipantDTO(
+                id=reg.participant.id,
+                name=reg.participant.name,
+                email_address=reg.participant.email_address,
+                cnic=reg.participant.cnic,
+                participant_type=reg.participant.participant_type,
+                phone_number=reg.participant.phone_number,
+                organization=reg.participant.organization,
+                linkedin_url=reg.participant.linkedin_url,
+                ambassador_name=reg.participant.ambassador_name,
+                payment_acknowledgement=reg.payment_acknowledgement,
+                participant_status=reg.participant_status,
+                team_name=reg.team_name,
+                team_members=[
+                    HackathonTeamMemberDTO(
+                        name=team_member["name"],
+                        email_address=team_member.get("email_address"),
+                        linkedin_url=team_member.get("linkedin_url"),
+                        github_url=team_member.get("github_url", "N/A"),
+                        phone_number=team_member.get("phone_number"),
+                        cnic=team_member.get("cnic"),
+                    )
+                    for team_member in reg.team_members
+                ],
+                purpose_of_participation=reg.purpose_of_participation,
+                google_technologies=reg.google_technologies,
+                previous_projects=reg.previous_projects,
+            )
+        raise ValueError("Invalid event type.")
 
-        else:
-            raise ValueError("Invalid event type.")
-        event_dto = EventDTO(event_type=event.event_type, participants=participant_dtos)
-        response_data = asdict(event_dto)  # Convert the dataclass to a dictionary
+    @staticmethod
+    @query_budget(2)
+    @replica_reads()
+    def get_archived_list(event_type: str, season: int | None, page: int, per_page: int) -> dict:
+        """
+        Registrations of past seasons, read from the archive alone so the live
+        tables are never scanned for them.
+        """
+        event = Event.objects.filter(event_type=event_type).first()
+        if not event:
+            raise ValueError("Event not found.")
 
-        return response_data
+        registrations = archived_registrations(event.id, season)
+        return {
+            "event_type": event.event_type,
+            "season": season,
+            "registrations": list(
+                registrations.values(
+                    "registration_id",
+                    "participant_id",
+                    "name",
+                    "email_address",
+                    "participant_status",
+                    "payment_acknowledgement",
+                    "registered_at",
+                    "details",
+                    "history",
+                )[page * per_page - per_page : page * per_page]
+            ),
+        }
 
     @staticmethod
-    def shortlist_participants(shortlist_dto: ShortlistDTO, event_type: str) -> None:
-        participants = Participant.objects.filter(id__in=shortlist_dto.participants)
+    @query_budget(5)
+    def shortlist_participants(shortlist_dto: ShortlistDTO, event_type: str, actor=None) -> None:
         event = Event.objects.filter(event_type=event_type).first()
         if not event:
             raise ValueError("Event not found.")
 
-        registrations = EventRegistration.objects.filter(
-            event=event, participant__in=participants
+        # Shortlisting emails are queued in the outbox by the bulk update
+        RegistrationService._bulk_update_status(
+            event, shortlist_dto.participants, ParticipantStatus.SHORTLISTED.value, actor
         )
-        for registration in registrations:
-            registration.participant.participant_status = (
-                ParticipantStatus.SHORTLISTED.value
-            )
-            registration.participant.save()
-            # Send email notification here
 
     @staticmethod
-    def status_participants(shortlist_dto: ShortlistDTO, event_type: str, participant_status: str) -> list:
+    @query_budget(12)
+    def status_participants(shortlist_dto: ShortlistDTO, event_type: str, participant_status: str, actor=None) -> list:
         # Validate if the status is a valid enum value
         if not ParticipantStatus.is_valid_status(participant_status):
             raise ValueError(f"Invalid participant status: {participant_status}")
     
-        # Fetch participants based on provided IDs
-        participants = Participant.objects.filter(id__in=shortlist_dto.participants)
-        
         # Ensure that there are participants to update
-        if not participants.exists():
+        if not Participant.objects.filter(id__in=shortlist_dto.participants).exists():
             raise ValueError("No valid participants found.")
     
         # Fetch the event by type
@@ -152,27 +235,370 @@ class RegistrationService:
         if not event:
             raise ValueError("Event not found.")
     
-        # Get event registrations for the event and participants
-        registrations = EventRegistration.objects.filter(
-            event=event, participant__in=participants
+        # Update every participant registered for the event and collect their names
+        updated_participants = RegistrationService._bulk_update_status(
+            event, shortlist_dto.participants, participant_status, actor
         )
-        
-        # List to store updated participant names
-        updated_participants = []
-    
-        # Update the status for each participant in the registration
-        for registration in registrations:
-            registration.participant.participant_status = participant_status
-            registration.participant.save()
-    
-            # Append the participant's name to the list after status update
-            updated_participants.append(registration.participant.name)
+
+        # Rejections free up seats, refill them from the waitlist
+        if participant_status == ParticipantStatus.REJECTED.value:
+            RegistrationService.promote_waitlist(event_type, actor=actor)
     
         return updated_participants
 
+    @staticmethod
+    @query_budget(12)
+    def update_registration_status(registration: EventRegistration, participant_status: str, actor=None) -> None:
+        """
+        Set the status of a single registration, e.g. from the admin, with the
+        transition, email and feed event of a bulk update.
+        """
+        if not ParticipantStatus.is_valid_status(participant_status):
+            raise ValueError(f"Invalid participant status: {participant_status}")
+
+        RegistrationService._bulk_update_status(
+            registration.event, [registration.participant_id], participant_status, actor
+        )
+        if participant_status == ParticipantStatus.REJECTED.value:
+            RegistrationService.promote_waitlist(registration.event.event_type, actor=actor)
+        registration.refresh_from_db(fields=["participant_status", "version"])
+
+    @staticmethod
+    @query_budget(6)
+    def promote_waitlist(
+        event_type: str, target_status: str = ParticipantStatus.SHORTLISTED.value, actor=None
+    ) -> list:
+        # A promotion fills a free seat, any other status would leave it free
+        if target_status not in ParticipantStatus.seat_holding_statuses():
+            raise ValueError(f"Invalid participant status for a promotion: {target_status}")
+
+        with transaction.atomic():
+            # Lock the event row so concurrent promotions cannot hand out the same seats
+            event = Event.objects.select_for_update().filter(event_type=event_type).first()
+            if not event:
+                raise ValueError("Event not found.")
+
+            # Uncapped events have no waitlist
+            if event.capacity is None:
+                return []
+
+            registrations = EventRegistration.objects.filter(event=event)
+            taken_seats = registrations.filter(
+                participant_status__in=ParticipantStatus.seat_holding_statuses()
+            ).count()
+            free_seats = event.capacity - taken_seats
+            if free_seats <= 0:
+                return []
+
+            # Head of the waitlist, sized to the number of free seats. Its rows stay
+            # locked until the promotion commits: a concurrent status change either
+            # commits first and the row is skipped, or waits, so the UPDATE below
+            # changes exactly these rows and the transitions, emails and feed
+            # events match it
+            waitlist = list(
+                registrations.filter(participant_status=ParticipantStatus.PENDING.value)
+                .order_by(*EventRegistration.WAITLIST_ORDERING)
+                .select_for_update(of=("self",))
+                .values_list(
+                    "id", "participant_id", "participant__name", "participant__email_address"
+                )[:free_seats]
+            )
+            if not waitlist:
+                return []
+
+            # Promote the whole batch with a single UPDATE
+            registrations.filter(
+                id__in=[registration_id for registration_id, _, _, _ in waitlist],
+                participant_status=ParticipantStatus.PENDING.value,
+            ).update(participant_status=target_status, version=F("version") + 1)
+            waitlist = [(participant_id, name, email_address) for _, participant_id, name, email_address in waitlist]
+
+            StatusTransition.objects.bulk_create(
+                StatusTransition(
+                    participant_id=participant_id,
+                    event=event,
+                    from_status=ParticipantStatus.PENDING.value,
+                    to_status=target_status,
+                    actor=actor,
+                )
+                for participant_id, _, _ in waitlist
+            )
+            enqueue_status_emails(event, target_status, waitlist)
+            publish_status_changed(
+                event,
+                target_status,
+                [
+                    (participant_id, name, ParticipantStatus.PENDING.value)
+                    for participant_id, name, _ in waitlist
+                ],
+            )
+
+        return [name for _, name, _ in waitlist]
+
+    # Background variants: validate up front, queue the work for a ``run_jobs``
+    # worker and return the job at once
+
+    @staticmethod
+    @query_budget(2)
+    def enqueue_shortlist_participants(shortlist_dto: ShortlistDTO, event_type: str, actor=None) -> Job:
+        if not Event.objects.filter(event_type=event_type).exists():
+            raise ValueError("Event not found.")
+
+        return enqueue_job(
+            "registration.shortlist_participants",
+            actor=actor,
+            event_type=event_type,
+            participants=list(shortlist_dto.participants),
+        )
+
+    @staticmethod
+    @query_budget(2)
+    def enqueue_status_participants(shortlist_dto: ShortlistDTO, event_type: str, participant_status: str, actor=None) -> Job:
+        if not ParticipantStatus.is_valid_status(participant_status):
+            raise ValueError(f"Invalid participant status: {participant_status}")
+        if not Event.objects.filter(event_type=event_type).exists():
+            raise ValueError("Event not found.")
+
+        return enqueue_job(
+            "registration.status_participants",
+            actor=actor,
+            event_type=event_type,
+            participant_status=participant_status,
+            participants=list(shortlist_dto.participants),
+        )
+
+    @staticmethod
+    @query_budget(2)
+    def enqueue_promote_waitlist(
+        event_type: str, target_status: str = ParticipantStatus.SHORTLISTED.value, actor=None
+    ) -> Job:
+        if target_status not in ParticipantStatus.seat_holding_statuses():
+            raise ValueError(f"Invalid participant status for a promotion: {target_status}")
+        if not Event.objects.filter(event_type=event_type).exists():
+            raise ValueError("Event not found.")
+
+        return enqueue_job(
+            "registration.promote_waitlist",
+            actor=actor,
+            event_type=event_type,
+            target_status=target_status,
+        )
+
                 
 
     @staticmethod
+    @query_budget(3)
+    def check_in(token: str, actor=None) -> dict:
+        """
+        Admit the holder of a ticket: the signature is checked without touching
+        the database and a single conditional UPDATE marks a confirmed
+        participant ATTENDED. Scanning the same ticket again is harmless.
+        """
+        try:
+            registration_id, participant_id, event_id = read_ticket_token(token)
+        except ValueError:
+            return {"result": INVALID_TICKET}
+
+        with transaction.atomic():
+            checked_in = EventRegistration.objects.filter(
+                id=registration_id,
+                participant_id=participant_id,
+                event_id=event_id,
+                participant_status=ParticipantStatus.CONFIRMED.value,
+            ).update(participant_status=ParticipantStatus.ATTENDED.value, version=F("version") + 1)
+            if checked_in:
+                RegistrationService._record_check_ins(event_id, [participant_id], actor)
+
+        if checked_in:
+            result = CHECKED_IN
+        else:
+            # Only a failed scan pays for a lookup, to tell a repeat scan apart
+            current_status = (
+                EventRegistration.objects.filter(
+                    id=registration_id, participant_id=participant_id, event_id=event_id
+                )
+                .values_list("participant_status", flat=True)
+                .first()
+            )
+            result = ALREADY_CHECKED_IN if current_status == ParticipantStatus.ATTENDED.value else NOT_ADMISSIBLE
+
+        return {"result": result, "registration_id": registration_id, "participant_id": participant_id}
+
+    @staticmethod
+    @query_budget(4)
+    def check_in_batch(tokens: list, actor=None) -> list:
+        """
+        Admit many scans at once, e.g. from a scanner that was offline. Returns
+        one ``check_in`` outcome per token, in order.
+        """
+        scans = []
+        for token in tokens:
+            try:
+                scans.append(read_ticket_token(token))
+            except ValueError:
+                scans.append(None)
+
+        valid = {scan for scan in scans if scan}
+        if not valid:
+            return [{"result": INVALID_TICKET} for _ in scans]
+
+        with transaction.atomic():
+            # Current status of every scanned registration, locked until updated
+            statuses = {
+                (registration_id, participant_id, event_id): participant_status
+                for registration_id, participant_id, event_id, participant_status in (
+                    EventRegistration.objects.filter(id__in=[scan[0] for scan in valid])
+                    .select_for_update()
+                    .values_list("id", "participant_id", "event_id", "participant_status")
+                )
+            }
+            admitted = {
+                scan for scan in valid if statuses.get(scan) == ParticipantStatus.CONFIRMED.value
+            }
+            EventRegistration.objects.filter(
+                id__in={registration_id for registration_id, _, _ in admitted},
+                participant_status=ParticipantStatus.CONFIRMED.value,
+            ).update(participant_status=ParticipantStatus.ATTENDED.value, version=F("version") + 1)
+
+            for event_id in {event_id for _, _, event_id in admitted}:
+                RegistrationService._record_check_ins(
+                    event_id,
+                    list({participant_id for _, participant_id, scan_event in admitted if scan_event == event_id}),
+                    actor,
+                )
+
+        results = []
+        for scan in scans:
+            if scan is None:
+                results.append({"result": INVALID_TICKET})
+                continue
+            if scan in admitted:
+                result = CHECKED_IN
+                # A ticket scanned twice in one batch counts once
+                admitted.discard(scan)
+            elif statuses.get(scan) in (ParticipantStatus.ATTENDED.value, ParticipantStatus.CONFIRMED.value):
+                result = ALREADY_CHECKED_IN
+            else:
+                result = NOT_ADMISSIBLE
+            results.append({"result": result, "registration_id": scan[0], "participant_id": scan[1]})
+        return results
+
+    @staticmethod
+    def _record_check_ins(event_id: int, participant_ids: list, actor=None) -> None:
+        event = Event.objects.only("id", "event_type").get(pk=event_id)
+        StatusTransition.objects.bulk_create(
+            StatusTransition(
+                participant_id=participant_id,
+                event=event,
+                from_status=ParticipantStatus.CONFIRMED.value,
+                to_status=ParticipantStatus.ATTENDED.value,
+                actor=actor,
+            )
+            for participant_id in participant_ids
+        )
+        publish_status_changed(
+            event,
+            ParticipantStatus.ATTENDED.value,
+            [(participant_id, None, ParticipantStatus.CONFIRMED.value) for participant_id in participant_ids],
+        )
+
+    @staticmethod
+    def _bulk_update_status(event: Event, participant_ids: list, participant_status: str, actor=None) -> list:
+        """
+        Set the status of the given participants registered for ``event`` with
+        one UPDATE per chunk of ids, record the transitions and queue the
+        notification emails with one INSERT each per chunk, and return the names
+        of the updated rows.
+        """
+        updated_participants = []
+        participant_ids = list(dict.fromkeys(coerce_participant_ids(participant_ids)))
+
+        with transaction.atomic():
+            for start in range(0, len(participant_ids), STATUS_UPDATE_CHUNK_SIZE):
+                chunk = participant_ids[start : start + STATUS_UPDATE_CHUNK_SIZE]
+                rows = RegistrationService._update_status_chunk(event, chunk, participant_status)
+                StatusTransition.objects.bulk_create(
+                    StatusTransition(
+                        participant_id=participant_id,
+                        event=event,
+                        from_status=previous_status,
+                        to_status=participant_status,
+                        actor=actor,
+                    )
+                    for participant_id, _, _, previous_status in rows
+                    if previous_status != participant_status
+                )
+                enqueue_status_emails(
+                    event,
+                    participant_status,
+                    [
+                        (participant_id, name, email_address)
+                        for participant_id, name, email_address, previous_status in rows
+                        if previous_status != participant_status
+                    ],
+                )
+                publish_status_changed(
+                    event,
+                    participant_status,
+                    [
+                        (participant_id, name, previous_status)
+                        for participant_id, name, _, previous_status in rows
+                        if previous_status != participant_status
+                    ],
+                )
+                updated_participants += [name for _, name, _, _ in rows]
+
+        return updated_participants
+
+    @staticmethod
+    def _update_status_chunk(event: Event, participant_ids: list, participant_status: str) -> list:
+        """
+        Update one chunk, returns ``(participant id, name, email address, previous status)``
+        for every updated row.
+        """
+        if connection.vendor == "postgresql":
+            # Postgres: lock the rows, update them and return the previous status in
+            # the same round trip
+            quote = connection.ops.quote_name
+            registration_table = quote(EventRegistration._meta.db_table)
+            participant_table = quote(Participant._meta.db_table)
+            sql = (
+                f"UPDATE {registration_table} "
+                f"SET {quote('participant_status')} = %s, "
+                f"{quote('version')} = {registration_table}.{quote('version')} + 1 "
+                f"FROM ("
+                f"SELECT registration.{quote('id')}, registration.{quote('participant_status')}, "
+                f"participant.{quote('name')}, participant.{quote('email_address')} "
+                f"FROM {registration_table} AS registration "
+                f"JOIN {participant_table} AS participant "
+                f"ON participant.{quote('id')} = registration.{quote('participant_id')} "
+                f"WHERE registration.{quote('event_id')} = %s "
+                f"AND registration.{quote('participant_id')} = ANY(%s) "
+                f"FOR UPDATE OF registration"
+                f") AS previous "
+                f"WHERE {registration_table}.{quote('id')} = previous.{quote('id')} "
+                f"RETURNING {registration_table}.{quote('participant_id')}, previous.{quote('name')}, "
+                f"previous.{quote('email_address')}, previous.{quote('participant_status')}"
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(sql, [participant_status, event.id, participant_ids])
+                return cursor.fetchall()
+
+        registered = EventRegistration.objects.filter(
+            event=event, participant_id__in=participant_ids
+        ).select_for_update()
+        rows = list(
+            registered.values_list(
+                "id", "participant_id", "participant__name", "participant__email_address", "participant_status"
+            )
+        )
+        EventRegistration.objects.filter(id__in=[row[0] for row in rows]).update(
+            participant_status=participant_status, version=F("version") + 1
+        )
+        return [row[1:] for row in rows]
+
+    @staticmethod
+    @query_budget(5)
     def register_event(event_type: str, data: dict) -> EventRegistration:
         participant_dto = ParticipantCreateDTO(
             name=data.get("name"),
@@ -220,33 +646,35 @@ class RegistrationService:
     def _create_registration(event_type: str, event_dto) -> EventRegistration:
         event = Event.objects.get(event_type=event_type)
 
-        participant, created = Participant.objects.get_or_create(
-            name=event_dto.name,
-            email_address=event_dto.email_address,
-            phone_number=event_dto.phone_number,
-            cnic=event_dto.cnic,
-            organization=event_dto.organization,
-            linkedin_url=event_dto.linkedin_url,
-            ambassador_name=event_dto.ambassador_name,
-        )
+        with transaction.atomic():
+            participant, created = Participant.objects.get_or_create(
+                name=event_dto.name,
+                email_address=event_dto.email_address,
+                phone_number=event_dto.phone_number,
+                cnic=event_dto.cnic,
+                organization=event_dto.organization,
+                linkedin_url=event_dto.linkedin_url,
+                ambassador_name=event_dto.ambassador_name,
+            )
 
-        # if event_type != EventTypes.WORKSHOP.value:
-        if EventRegistration.objects.filter(
-            participant=participant, event=event
-        ).exists():
-            raise ValueError("Participant is already registered for this event.")
-
-        registration = EventRegistration.objects.create(
-            participant=participant,
-            event=event,
-            workshop_participation=getattr(event_dto, "workshop_participation", None),
-            team_name=getattr(event_dto, "team_name", None),
-            team_members=getattr(event_dto, "team_members", None),
-            purpose_of_participation=getattr(
-                event_dto, "purpose_of_participation", None
-            ),
-            google_technologies=getattr(event_dto, "google_technologies", None),
-            previous_projects=getattr(event_dto, "previous_projects", None),
-        )
+            # if event_type != EventTypes.WORKSHOP.value:
+            if EventRegistration.objects.filter(
+                participant=participant, event=event
+            ).exists():
+                raise ValueError("Participant is already registered for this event.")
+
+            registration = EventRegistration.objects.create(
+                participant=participant,
+                event=event,
+                workshop_participation=getattr(event_dto, "workshop_participation", None),
+                team_name=getattr(event_dto, "team_name", None),
+                team_members=getattr(event_dto, "team_members", None),
+                purpose_of_participation=getattr(
+                    event_dto, "purpose_of_participation", None
+                ),
+                google_technologies=getattr(event_dto, "google_technologies", None),
+                previous_projects=getattr(event_dto, "previous_projects", None),
+            )
+            publish_registration_created(registration)
 
         return registration
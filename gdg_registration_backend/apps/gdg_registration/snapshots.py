@@ -0,0 +1,145 @@
+"""
+Check-in snapshots that let scanners admit people while the venue is offline.
+
+A snapshot is a compact binary list of the admissible registrations of one
+event. It is streamed straight from the database and compressed on the fly.
+Its version is the id of the newest ``StatusTransition`` of the event, which
+every status change writes, the admin's included, as long as it goes through
+``RegistrationService``. A
+scanner that holds version ``v`` asks for a delta ``since=v``, which carries
+the current state of every registration whose status changed after ``v``.
+Ids are handed out when a transition is written, not when it commits, so one
+with an id below ``v`` can become visible after ``v`` was read. A delta
+therefore also re-reads the transitions written up to
+``SNAPSHOT_OVERLAP_SECONDS`` before ``v``. Applying a delta is an upsert keyed
+on the registration id, so the registrations it repeats do no harm.
+
+Layout, little-endian, zlib-compressed after the header::
+
+    header   b"GDGS" | format u8 | kind u8 (0 full, 1 delta) | event_id u32 | version u64
+    record   registration_id u32 | participant_id u32 | status u8 | initials_len u8 | initials utf-8
+
+``status`` is the position of the participant status in ``ParticipantStatus``.
+A delta record whose status is not admissible removes the registration from
+the scanner's list.
+"""
+
+import struct
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.db.models import Max
+from django.db.models import Q
+from django.db.models import Subquery
+
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
+from gdg_registration_backend.apps.gdg_registration.models import EventRegistration
+from gdg_registration_backend.apps.gdg_registration.models import StatusTransition
+from gdg_registration_backend.replicas import read_database
+from gdg_registration_backend.replicas import replica_reads
+
+MAGIC = b"GDGS"
+FORMAT_VERSION = 1
+FULL = 0
+DELTA = 1
+HEADER = struct.Struct("<4sBBIQ")
+RECORD = struct.Struct("<IIBB")
+STATUS_CODES = {status.value: code for code, status in enumerate(ParticipantStatus)}
+ADMISSIBLE_STATUSES = [ParticipantStatus.CONFIRMED.value, ParticipantStatus.ATTENDED.value]
+STREAM_CHUNK_SIZE = 2000
+# Longer than any transaction writing status transitions stays open
+SNAPSHOT_OVERLAP_SECONDS = 60
+
+
+@dataclass(frozen=True)
+class SnapshotRecord:
+    registration_id: int
+    participant_id: int
+    status: str
+    initials: str
+
+
+def initials(name: str) -> str:
+    return "".join(part[0] for part in (name or "").split()[:3]).upper()
+
+
+def snapshot_version(event_id: int, using: str | None = None) -> int:
+    transitions = StatusTransition.objects.using(using).filter(event_id=event_id)
+    return transitions.aggregate(version=Max("id"))["version"] or 0
+
+
+def snapshot_rows(event_id: int, since: int | None = None):
+    registrations = EventRegistration.objects.filter(event_id=event_id)
+    if since is None:
+        registrations = registrations.filter(participant_status__in=ADMISSIBLE_STATUSES)
+    else:
+        version_written = StatusTransition.objects.filter(id=since).values("created_at")
+        overlap = Subquery(version_written) - timedelta(seconds=SNAPSHOT_OVERLAP_SECONDS)
+        changed = StatusTransition.objects.filter(
+            Q(id__gt=since) | Q(created_at__gte=overlap), event_id=event_id
+        ).values("participant_id")
+        registrations = registrations.filter(participant_id__in=changed)
+    return registrations.order_by("id").values_list(
+        "id", "participant_id", "participant_status", "participant__name"
+    )
+
+
+def stream_snapshot(event_id: int, since: int | None = None) -> tuple[int, Iterator[bytes]]:
+    """
+    The snapshot version and the byte chunks of a full snapshot, or of the
+    delta since ``since``. Rows are read with a server-side cursor where the
+    database supports it and never held in memory all at once. Both come from
+    the read replica when there is one.
+    """
+    with replica_reads():
+        database = read_database()
+    version = snapshot_version(event_id, database)
+    kind = FULL if since is None else DELTA
+
+    def chunks():
+        yield HEADER.pack(MAGIC, FORMAT_VERSION, kind, event_id, version)
+        compressor = zlib.compressobj(level=9)
+        buffer = bytearray()
+        for registration_id, participant_id, participant_status, name in snapshot_rows(
+            event_id, since
+        ).using(database).iterator(chunk_size=STREAM_CHUNK_SIZE):
+            encoded = initials(name).encode()
+            buffer += RECORD.pack(
+                registration_id, participant_id, STATUS_CODES[participant_status], len(encoded)
+            )
+            buffer += encoded
+            if len(buffer) >= 64 * 1024:
+                if compressed := compressor.compress(bytes(buffer)):
+                    yield compressed
+                buffer.clear()
+        yield compressor.compress(bytes(buffer)) + compressor.flush()
+
+    return version, chunks()
+
+
+def read_snapshot(data: bytes) -> tuple[dict, list[SnapshotRecord]]:
+    """Decode a snapshot, the reference for scanner implementations."""
+    magic, format_version, kind, event_id, version = HEADER.unpack_from(data)
+    if magic != MAGIC or format_version != FORMAT_VERSION:
+        raise ValueError("Not a check-in snapshot.")
+
+    statuses = list(ParticipantStatus)
+    body = zlib.decompress(data[HEADER.size :])
+    records = []
+    offset = 0
+    while offset < len(body):
+        registration_id, participant_id, status_code, length = RECORD.unpack_from(body, offset)
+        offset += RECORD.size
+        records.append(
+            SnapshotRecord(
+                registration_id,
+                participant_id,
+                statuses[status_code].value,
+                body[offset : offset + length].decode(),
+            )
+        )
+        offset += length
+    header = {"kind": kind, "event_id": event_id, "version": version}
+    return header, records
@@ -0,0 +1,78 @@
+"""
+Background versions of the bulk registration operations, run by ``run_jobs``.
+
+Participants are updated one chunk per transaction with a progress checkpoint
+after each, so a cancelled job stops between chunks and keeps the chunks it
+already applied.
+"""
+
+from gdg_registration_backend.apps.gdg_events.models import Event
+from gdg_registration_backend.apps.gdg_jobs.registry import JobContext
+from gdg_registration_backend.apps.gdg_jobs.registry import task
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
+from gdg_registration_backend.apps.gdg_registration import tickets
+from gdg_registration_backend.apps.gdg_registration.service import STATUS_UPDATE_CHUNK_SIZE
+from gdg_registration_backend.apps.gdg_registration.service import RegistrationService
+
+
+def _update_in_chunks(
+    context: JobContext, event_type: str, participant_status: str, participants: list
+) -> dict:
+    event = Event.objects.filter(event_type=event_type).first()
+    if not event:
+        raise ValueError("Event not found.")
+
+    participant_ids = list(dict.fromkeys(participants))
+    updated = promoted = 0
+    for start in range(0, len(participant_ids), STATUS_UPDATE_CHUNK_SIZE):
+        chunk = participant_ids[start : start + STATUS_UPDATE_CHUNK_SIZE]
+        updated += len(
+            RegistrationService._bulk_update_status(event, chunk, participant_status, context.actor)
+        )
+        # Refill the seats freed so far before a possible cancellation
+        if participant_status == ParticipantStatus.REJECTED.value:
+            promoted += len(RegistrationService.promote_waitlist(event_type, actor=context.actor))
+        context.progress(
+            start + len(chunk), len(participant_ids), f"{updated} participants updated"
+        )
+
+    return {"updated": updated, "promoted": promoted}
+
+
+@task("registration.shortlist_participants")
+def shortlist_participants(context: JobContext, event_type: str, participants: list) -> dict:
+    return _update_in_chunks(
+        context, event_type, ParticipantStatus.SHORTLISTED.value, participants
+    )
+
+
+@task("registration.status_participants")
+def status_participants(
+    context: JobContext, event_type: str, participant_status: str, participants: list
+) -> dict:
+    return _update_in_chunks(context, event_type, participant_status, participants)
+
+
+@task("registration.promote_waitlist")
+def promote_waitlist(context: JobContext, event_type: str, target_status: str) -> dict:
+    promoted = RegistrationService.promote_waitlist(event_type, target_status, actor=context.actor)
+    context.progress(len(promoted), len(promoted))
+    return {"promoted": len(promoted)}
+
+
+@task("registration.generate_tickets")
+def generate_tickets(context: JobContext, event_type: str | None = None, force: bool = False) -> dict:
+    event_id = None
+    if event_type:
+        event = Event.objects.filter(event_type=event_type).first()
+        if not event:
+            raise ValueError("Event not found.")
+        event_id = event.id
+
+    def report(result):
+        context.progress(
+            result.rendered + result.unchanged, message=f"{result.rendered} tickets rendered",
+        )
+
+    result = tickets.generate_tickets(event_id, force=force, on_progress=report)
+    return {"rendered": result.rendered, "unchanged": result.unchanged}
@@ -0,0 +1,40 @@
+from factory import Faker
+from factory import Sequence
+from factory import SubFactory
+from factory.django import DjangoModelFactory
+
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_events.models import Event
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantType
+from gdg_registration_backend.apps.gdg_participants.models import Participant
+from gdg_registration_backend.apps.gdg_registration.models import EventRegistration
+
+
+class EventFactory(DjangoModelFactory[Event]):
+    name = Faker("catch_phrase")
+    event_type = EventTypes.WORKSHOP.value
+
+    class Meta:
+        model = Event
+        django_get_or_create = ["event_type"]
+
+
+class ParticipantFactory(DjangoModelFactory[Participant]):
+    name = Faker("name")
+    email_address = Sequence(lambda n: f"participant{n}@example.com")
+    cnic = Faker("numerify", text="#####-#######-#")
+    phone_number = Faker("numerify", text="03#########")
+    participant_type = ParticipantType.STUDENT.value
+
+    class Meta:
+        model = Participant
+
+
+class EventRegistrationFactory(DjangoModelFactory[EventRegistration]):
+    participant = SubFactory(ParticipantFactory)
+    event = SubFactory(EventFactory)
+    participant_status = ParticipantStatus.PENDING.value
+
+    class Meta:
+        model = EventRegistration
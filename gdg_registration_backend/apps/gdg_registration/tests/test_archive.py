@@ -0,0 +1,136 @@
+from datetime import datetime
+from datetime import timezone
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_notifications.models import OutboxEmail
+from gdg_registration_backend.apps.gdg_participants.data_class_model import ShortlistDTO
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
+from gdg_registration_backend.apps.gdg_participants.models import Participant
+from gdg_registration_backend.apps.gdg_registration.archive import archive_registrations
+from gdg_registration_backend.apps.gdg_registration.models import ArchivedRegistration
+from gdg_registration_backend.apps.gdg_registration.models import EventRegistration
+from gdg_registration_backend.apps.gdg_registration.models import StatusTransition
+from gdg_registration_backend.apps.gdg_registration.service import RegistrationService
+
+from .factories import EventFactory
+from .factories import EventRegistrationFactory
+
+pytestmark = pytest.mark.django_db
+
+WORKSHOP = EventTypes.WORKSHOP.value
+LAST_SEASON = datetime(2024, 11, 1, tzinfo=timezone.utc)
+CUTOFF = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def last_season(*registrations):
+    EventRegistration.objects.filter(id__in=[r.id for r in registrations]).update(registered_at=LAST_SEASON)
+
+
+class TestArchiveRegistrations:
+    def test_moves_past_registrations_with_their_history(self):
+        old = EventRegistrationFactory(team_name="Old team")
+        current = EventRegistrationFactory()
+        RegistrationService.status_participants(
+            ShortlistDTO(participants=[old.participant_id, current.participant_id]),
+            WORKSHOP,
+            ParticipantStatus.CONFIRMED.value,
+        )
+        last_season(old)
+
+        result = archive_registrations(CUTOFF)
+
+        assert (result.registrations, result.participants, result.transitions) == (1, 1, 1)
+        assert list(EventRegistration.objects.values_list("id", flat=True)) == [current.id]
+        assert list(StatusTransition.objects.values_list("participant_id", flat=True)) == [current.participant_id]
+        assert not Participant.objects.filter(pk=old.participant_id).exists()
+        archived = ArchivedRegistration.objects.get()
+        assert archived.registration_id == old.id
+        assert archived.email_address == old.participant.email_address
+        assert archived.participant_status == ParticipantStatus.CONFIRMED.value
+        assert archived.details["team_name"] == "Old team"
+        assert archived.details["cnic"] == old.participant.cnic
+        assert [(step["from"], step["to"]) for step in archived.history] == [
+            (ParticipantStatus.PENDING.value, ParticipantStatus.CONFIRMED.value),
+        ]
+
+    def test_keeps_participants_registered_this_season(self):
+        old = EventRegistrationFactory()
+        EventRegistrationFactory(
+            participant=old.participant,
+            event=EventFactory(event_type=EventTypes.HACKATHON.value),
+        )
+        last_season(old)
+
+        result = archive_registrations(CUTOFF)
+
+        assert (result.registrations, result.participants) == (1, 0)
+        assert Participant.objects.filter(pk=old.participant_id).exists()
+
+    def test_detaches_outbox_emails_of_deleted_participants(self):
+        old = EventRegistrationFactory()
+        RegistrationService.shortlist_participants(ShortlistDTO(participants=[old.participant_id]), WORKSHOP)
+        last_season(old)
+
+        archive_registrations(CUTOFF)
+
+        assert OutboxEmail.objects.get().participant_id is None
+
+    def test_runs_in_chunks(self):
+        registrations = EventRegistrationFactory.create_batch(25)
+        last_season(*registrations)
+        progress = []
+
+        archive_registrations(CUTOFF, batch_size=10, on_progress=lambda result: progress.append(result.registrations))
+
+        assert progress == [10, 20, 25]
+        assert not EventRegistration.objects.exists()
+        assert ArchivedRegistration.objects.count() == 25
+
+    def test_only_the_given_event(self):
+        workshop = EventRegistrationFactory()
+        hackathon = EventRegistrationFactory(event=EventFactory(event_type=EventTypes.HACKATHON.value))
+        last_season(workshop, hackathon)
+
+        archive_registrations(CUTOFF, event_id=workshop.event_id)
+
+        assert list(EventRegistration.objects.values_list("id", flat=True)) == [hackathon.id]
+
+    def test_command(self):
+        last_season(*EventRegistrationFactory.create_batch(3))
+        EventRegistrationFactory()
+
+        call_command("archive_registrations", "--before", "2025-01-01", "--dry-run")
+        assert EventRegistration.objects.count() == 4
+
+        call_command("archive_registrations", "--before", "2025-01-01", "--event-type", WORKSHOP)
+        assert EventRegistration.objects.count() == 1
+        assert ArchivedRegistration.objects.count() == 3
+
+
+class TestArchivedList:
+    def test_reads_the_archive_only(self, django_assert_num_queries):
+        old = EventRegistrationFactory()
+        EventRegistrationFactory()
+        last_season(old)
+        archive_registrations(CUTOFF)
+
+        # Event lookup and one page of the archive
+        with django_assert_num_queries(2):
+            archive = RegistrationService.get_archived_list(WORKSHOP, 2024, 1, 10)
+
+        assert [row["registration_id"] for row in archive["registrations"]] == [old.id]
+        assert RegistrationService.get_archived_list(WORKSHOP, 2023, 1, 10)["registrations"] == []
+
+    def test_api_is_staff_only(self, client, admin_user):
+        EventFactory()
+        url = reverse("api:events_archive")
+
+        assert client.get(url, {"event_type": WORKSHOP}).status_code == 403
+        client.force_login(admin_user)
+        assert client.get(url, {"event_type": WORKSHOP}).json()["registrations"] == []
+        assert client.get(url, {"event_type": WORKSHOP, "season": "last"}).status_code == 400
+        assert client.get(url, {"event_type": EventTypes.HACKATHON.value}).status_code == 404
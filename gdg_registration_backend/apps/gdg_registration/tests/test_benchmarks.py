@@ -0,0 +1,68 @@
+import pytest
+from django.core.management import call_command
+
+from gdg_registration_backend.apps.gdg_participants.models import Participant
+from gdg_registration_backend.apps.gdg_registration.benchmarks.suite import BenchmarkResult
+from gdg_registration_backend.apps.gdg_registration.benchmarks.suite import compare
+from gdg_registration_backend.apps.gdg_registration.benchmarks.suite import load_baseline
+from gdg_registration_backend.apps.gdg_registration.benchmarks.suite import measure
+from gdg_registration_backend.apps.gdg_registration.benchmarks.suite import run_suite
+
+pytestmark = pytest.mark.django_db
+
+
+def test_run_suite_rolls_back():
+    results = run_suite(30, repeat=1)
+
+    assert {result.name for result in results} >= {
+        "get_event_list.WORKSHOP.deep_page",
+        "register_event.HACKATHON",
+        "shortlist_participants",
+        "status_participants",
+    }
+    assert all(result.queries > 0 for result in results)
+    assert not Participant.objects.exists()
+
+
+def test_measure_resets_before_every_run():
+    calls = []
+
+    measure("case", 1, lambda: calls.append("run"), repeat=2, reset=lambda: calls.append("reset"))
+
+    assert calls == ["reset", "run"] * 3
+
+
+def test_compare_flags_regressions():
+    baseline = {
+        "status_participants@10": {"seconds": 0.1, "queries": 5},
+        "shortlist_participants@10": {"seconds": 0.1, "queries": 5},
+    }
+    results = [
+        BenchmarkResult("status_participants", 10, 0.2, 5, 1.0),
+        BenchmarkResult("shortlist_participants", 10, 0.11, 6, 1.0),
+        BenchmarkResult("register_event.WORKSHOP", 10, 9.0, 99, 1.0),
+    ]
+
+    regressions = compare(results, baseline, tolerance=0.25)
+
+    assert regressions == [
+        "status_participants@10: 200.0 ms, baseline 100.0 ms",
+        "shortlist_participants@10: 6 queries, baseline 5",
+    ]
+
+
+def test_stored_baseline_covers_default_sizes():
+    baseline = load_baseline()
+
+    assert {"status_participants@1000", "status_participants@100000"} <= set(baseline)
+
+
+def test_command_saves_baseline(tmp_path):
+    baseline = tmp_path / "baseline.json"
+
+    call_command(
+        "benchmark_registration", "--sizes", "9", "--repeat", "0",
+        "--baseline", str(baseline), "--save-baseline",
+    )
+
+    assert "register_event.CONFERENCE@9" in load_baseline(baseline)
@@ -0,0 +1,158 @@
+import pytest
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
+from gdg_registration_backend.apps.gdg_registration.models import EventRegistration
+from gdg_registration_backend.apps.gdg_registration.models import StatusTransition
+from gdg_registration_backend.apps.gdg_registration.service import ALREADY_CHECKED_IN
+from gdg_registration_backend.apps.gdg_registration.service import CHECKED_IN
+from gdg_registration_backend.apps.gdg_registration.service import INVALID_TICKET
+from gdg_registration_backend.apps.gdg_registration.service import NOT_ADMISSIBLE
+from gdg_registration_backend.apps.gdg_registration.service import RegistrationService
+from gdg_registration_backend.apps.gdg_registration.tickets import ticket_token
+
+from .factories import EventFactory
+from .factories import EventRegistrationFactory
+
+pytestmark = pytest.mark.django_db
+
+CONFIRMED = ParticipantStatus.CONFIRMED.value
+ATTENDED = ParticipantStatus.ATTENDED.value
+
+
+def token_for(registration):
+    return ticket_token(registration.id, registration.participant_id, registration.event_id)
+
+
+def status_of(registration):
+    return EventRegistration.objects.get(pk=registration.pk).participant_status
+
+
+class TestCheckIn:
+    def test_confirmed_participant_is_admitted_once(self, django_assert_num_queries):
+        registration = EventRegistrationFactory(participant_status=CONFIRMED)
+        token = token_for(registration)
+
+        # Conditional UPDATE, then the audit row for the change, in one savepoint
+        with django_assert_num_queries(5):
+            outcome = RegistrationService.check_in(token)
+
+        assert outcome["result"] == CHECKED_IN
+        assert status_of(registration) == ATTENDED
+        assert RegistrationService.check_in(token)["result"] == ALREADY_CHECKED_IN
+        transition = StatusTransition.objects.get()
+        assert (transition.from_status, transition.to_status) == (CONFIRMED, ATTENDED)
+
+    def test_unconfirmed_participant_is_turned_away(self):
+        registration = EventRegistrationFactory()
+
+        assert RegistrationService.check_in(token_for(registration))["result"] == NOT_ADMISSIBLE
+        assert status_of(registration) == ParticipantStatus.PENDING.value
+
+    def test_ticket_for_another_event(self):
+        registration = EventRegistrationFactory(participant_status=CONFIRMED)
+        other_event = EventFactory(event_type=EventTypes.HACKATHON.value)
+        token = ticket_token(registration.id, registration.participant_id, other_event.id)
+
+        assert RegistrationService.check_in(token)["result"] == NOT_ADMISSIBLE
+
+    def test_forged_token_needs_no_query(self, django_assert_num_queries):
+        registration = EventRegistrationFactory(participant_status=CONFIRMED)
+        forged = f"{registration.id}.{registration.participant_id}.{registration.event_id}:forged"
+
+        with django_assert_num_queries(0):
+            assert RegistrationService.check_in(forged) == {"result": INVALID_TICKET}
+
+
+class TestBatchCheckIn:
+    def test_mixed_batch(self):
+        confirmed = EventRegistrationFactory.create_batch(3, participant_status=CONFIRMED)
+        attended = EventRegistrationFactory(participant_status=ATTENDED)
+        pending = EventRegistrationFactory()
+        tokens = [
+            *map(token_for, confirmed),
+            token_for(confirmed[0]),
+            token_for(attended),
+            token_for(pending),
+            "garbage",
+        ]
+
+        results = RegistrationService.check_in_batch(tokens)
+
+        assert [outcome["result"] for outcome in results] == [
+            CHECKED_IN, CHECKED_IN, CHECKED_IN,
+            ALREADY_CHECKED_IN, ALREADY_CHECKED_IN, NOT_ADMISSIBLE, INVALID_TICKET,
+        ]
+        assert {status_of(registration) for registration in confirmed} == {ATTENDED}
+        assert StatusTransition.objects.count() == 3
+
+    def test_query_count_does_not_grow_with_batch(self, django_assert_max_num_queries):
+        registrations = EventRegistrationFactory.create_batch(
+            200, participant_status=CONFIRMED,
+        )
+
+        with django_assert_max_num_queries(7):
+            results = RegistrationService.check_in_batch(list(map(token_for, registrations)))
+
+        assert {outcome["result"] for outcome in results} == {CHECKED_IN}
+
+
+@pytest.fixture
+def scanner(client, admin_user):
+    """A client sending a staff account's API token, as the scanner app does."""
+    token = Token.objects.create(user=admin_user)
+    client.defaults["HTTP_AUTHORIZATION"] = f"Token {token.key}"
+    return client
+
+
+class TestCheckInAPI:
+    def test_check_in(self, scanner, admin_user):
+        registration = EventRegistrationFactory(participant_status=CONFIRMED)
+        url = reverse("api:participants_checkin")
+
+        first = scanner.post(url, {"token": token_for(registration)}, content_type="application/json")
+        second = scanner.post(url, {"token": token_for(registration)}, content_type="application/json")
+
+        assert first.status_code == second.status_code == 200
+        assert (first.json()["result"], second.json()["result"]) == (CHECKED_IN, ALREADY_CHECKED_IN)
+        assert StatusTransition.objects.get().actor == admin_user
+
+    def test_rejections(self, scanner):
+        registration = EventRegistrationFactory()
+        url = reverse("api:participants_checkin")
+
+        assert scanner.post(url, {"token": "x:y"}, content_type="application/json").status_code == 400
+        assert scanner.post(
+            url, {"token": token_for(registration)}, content_type="application/json",
+        ).status_code == 409
+
+    @pytest.mark.parametrize("url_name", ["api:participants_checkin", "api:participants_checkin_batch"])
+    def test_needs_a_staff_token(self, client, user, url_name):
+        registration = EventRegistrationFactory(participant_status=CONFIRMED)
+        payload = {"token": token_for(registration), "tokens": [token_for(registration)]}
+
+        anonymous = client.post(reverse(url_name), payload, content_type="application/json")
+        # Sessions are not accepted, and neither are tokens of other accounts
+        client.force_login(user)
+        with_session = client.post(reverse(url_name), payload, content_type="application/json")
+        client.defaults["HTTP_AUTHORIZATION"] = f"Token {Token.objects.create(user=user).key}"
+        not_staff = client.post(reverse(url_name), payload, content_type="application/json")
+
+        assert (anonymous.status_code, with_session.status_code, not_staff.status_code) == (401, 401, 403)
+        registration.refresh_from_db()
+        assert registration.participant_status == CONFIRMED
+
+    def test_batch(self, scanner, admin_user):
+        registrations = EventRegistrationFactory.create_batch(2, participant_status=CONFIRMED)
+
+        response = scanner.post(
+            reverse("api:participants_checkin_batch"),
+            {"tokens": [*map(token_for, registrations), "bad"]},
+            content_type="application/json",
+        )
+
+        assert response.status_code == 200
+        assert response.json()["counts"] == {CHECKED_IN: 2, INVALID_TICKET: 1}
+        assert {transition.actor for transition in StatusTransition.objects.all()} == {admin_user}
@@ -0,0 +1,198 @@
+import json
+import random
+
+import pytest
+import redis
+from asgiref.sync import async_to_sync
+from asgiref.testing import ApplicationCommunicator
+
+from config.websocket import websocket_application
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_participants.data_class_model import ShortlistDTO
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
+from gdg_registration_backend.apps.gdg_registration import feed
+from gdg_registration_backend.apps.gdg_registration.benchmarks.data import (
+    registration_payload,
+)
+from gdg_registration_backend.apps.gdg_registration.service import RegistrationService
+
+from .factories import EventFactory
+from .factories import EventRegistrationFactory
+
+WORKSHOP = EventTypes.WORKSHOP.value
+HACKATHON = EventTypes.HACKATHON.value
+
+
+@pytest.fixture
+def published(monkeypatch):
+    messages = []
+    monkeypatch.setattr(
+        feed.get_broker(), "publish", lambda channel, message: messages.append((channel, message)),
+    )
+    return messages
+
+
+async def receive_json(communicator):
+    return json.loads((await communicator.receive_output(1))["text"])
+
+
+class TestWebsocket:
+    def test_subscribed_dashboards_receive_their_events(self):
+        async def scenario():
+            communicator = ApplicationCommunicator(websocket_application, {"type": "websocket"})
+            await communicator.send_input({"type": "websocket.connect"})
+            assert (await communicator.receive_output(1))["type"] == "websocket.accept"
+
+            await communicator.send_input({"type": "websocket.receive", "text": "ping"})
+            assert (await communicator.receive_output(1))["text"] == "pong!"
+
+            await communicator.send_input({
+                "type": "websocket.receive",
+                "text": json.dumps({"action": "subscribe", "event_type": WORKSHOP}),
+            })
+            assert await receive_json(communicator) == {"type": "subscribed", "event_type": WORKSHOP}
+
+            broker = feed.get_broker()
+            broker.publish(feed.event_channel(HACKATHON), {"type": "registration.created", "n": 1})
+            broker.publish(feed.event_channel(WORKSHOP), {"type": "registration.created", "n": 2})
+            assert (await receive_json(communicator))["n"] == 2
+
+            await communicator.send_input({
+                "type": "websocket.receive",
+                "text": json.dumps({"action": "unsubscribe", "event_type": WORKSHOP}),
+            })
+            assert (await receive_json(communicator))["type"] == "unsubscribed"
+            broker.publish(feed.event_channel(WORKSHOP), {"type": "registration.created", "n": 3})
+            assert await communicator.receive_nothing(0.1)
+
+            await communicator.send_input({"type": "websocket.disconnect"})
+            await communicator.wait(1)
+            assert not any(broker.subscribers.values())
+
+        async_to_sync(scenario)()
+
+    def test_invalid_commands(self):
+        async def scenario():
+            communicator = ApplicationCommunicator(websocket_application, {"type": "websocket"})
+            await communicator.send_input({"type": "websocket.connect"})
+            await communicator.receive_output(1)
+
+            for text in ["hello", json.dumps({"action": "subscribe", "event_type": "MEETUP"})]:
+                await communicator.send_input({"type": "websocket.receive", "text": text})
+                assert (await receive_json(communicator))["type"] == "error"
+
+            await communicator.send_input({"type": "websocket.disconnect"})
+            await communicator.wait(1)
+
+        async_to_sync(scenario)()
+
+    def test_slow_subscribers_drop_messages(self, monkeypatch):
+        monkeypatch.setattr(feed, "SUBSCRIBER_QUEUE_SIZE", 2)
+
+        async def scenario():
+            subscriber = feed.Subscriber()
+            for n in range(3):
+                subscriber.put({"n": n})
+            return [subscriber.queue.get_nowait() for _ in range(subscriber.queue.qsize())]
+
+        assert async_to_sync(scenario)() == [{"n": 0}, {"n": 1}]
+
+
+class Stop(Exception):
+    pass
+
+
+class FlakyPubSub:
+    """Drops the connection on the first subscription and delivers one message on the next."""
+
+    subscriptions = 0
+
+    async def psubscribe(self, pattern):
+        FlakyPubSub.subscriptions += 1
+
+    async def listen(self):
+        if FlakyPubSub.subscriptions == 1:
+            raise redis.ConnectionError("Connection closed by server.")
+        yield {"type": "psubscribe", "channel": b"gdg:feed:*", "data": 1}
+        yield {"type": "pmessage", "channel": feed.event_channel(WORKSHOP).encode(), "data": b'{"n": 1}'}
+        raise Stop
+
+    async def aclose(self):
+        pass
+
+
+def test_redis_listener_resubscribes_after_a_lost_connection(monkeypatch, caplog):
+    broker = feed.RedisBroker("redis://localhost:6379/0")
+    monkeypatch.setattr(broker.async_client, "pubsub", FlakyPubSub)
+    monkeypatch.setattr(FlakyPubSub, "subscriptions", 0)
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(feed.asyncio, "sleep", sleep)
+    delivered = []
+    monkeypatch.setattr(broker, "deliver", lambda channel, message: delivered.append((channel, message)))
+
+    with pytest.raises(Stop):
+        async_to_sync(broker.listen)()
+
+    assert delays == [feed.RECONNECT_DELAY]
+    assert delivered == [(feed.event_channel(WORKSHOP), {"n": 1})]
+    assert "Feed subscription lost" in caplog.text
+
+
+@pytest.mark.django_db
+class TestPublishing:
+    def test_registration_is_published_on_commit(
+        self, published, django_capture_on_commit_callbacks,
+    ):
+        EventFactory()
+        payload = registration_payload(WORKSHOP, 0, random.Random(0), "feed")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            registration = RegistrationService.register_event(WORKSHOP, payload)
+            assert not published
+
+        [(channel, message)] = published
+        assert channel == feed.event_channel(WORKSHOP)
+        assert message["type"] == "registration.created"
+        assert message["data"]["registration_id"] == registration.id
+        assert message["data"]["name"] == payload["name"]
+        assert "email_address" not in message["data"]
+
+    def test_status_changes_are_published_per_batch(
+        self, published, django_capture_on_commit_callbacks,
+    ):
+        registrations = EventRegistrationFactory.create_batch(3)
+        confirmed = registrations[0]
+        confirmed.participant_status = ParticipantStatus.CONFIRMED.value
+        confirmed.save()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            RegistrationService.status_participants(
+                ShortlistDTO(participants=[r.participant_id for r in registrations]),
+                WORKSHOP,
+                ParticipantStatus.CONFIRMED.value,
+            )
+
+        [(_, message)] = published
+        assert message["type"] == "status.changed"
+        assert message["data"]["status"] == ParticipantStatus.CONFIRMED.value
+        # Participants already confirmed are not announced again
+        assert sorted(p["id"] for p in message["data"]["participants"]) == sorted(
+            r.participant_id for r in registrations[1:]
+        )
+        assert {p["from_status"] for p in message["data"]["participants"]} == {
+            ParticipantStatus.PENDING.value,
+        }
+
+    def test_rolled_back_changes_are_not_published(self, published):
+        registrations = EventRegistrationFactory.create_batch(2)
+
+        RegistrationService.shortlist_participants(
+            ShortlistDTO(participants=[r.participant_id for r in registrations]), WORKSHOP,
+        )
+
+        # The test transaction never commits
+        assert not published
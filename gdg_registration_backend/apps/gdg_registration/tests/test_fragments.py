@@ -0,0 +1,174 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.core.cache.backends.locmem import LocMemCache
+from prometheus_client import REGISTRY
+
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_participants.data_class_model import ShortlistDTO
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
+from gdg_registration_backend.apps.gdg_registration import fragments as fragments_module
+from gdg_registration_backend.apps.gdg_registration.fragments import FragmentCache
+from gdg_registration_backend.apps.gdg_registration.fragments import expires_early
+from gdg_registration_backend.apps.gdg_registration.fragments import lock_key
+from gdg_registration_backend.apps.gdg_registration.fragments import registration_fragments
+from gdg_registration_backend.apps.gdg_registration.service import RegistrationService
+from gdg_registration_backend.db.queries import collect_query_stats
+
+from .factories import EventRegistrationFactory
+
+pytestmark = pytest.mark.django_db
+
+WORKSHOP = EventTypes.WORKSHOP.value
+COALESCED = {"cache": "fragments_coalesced", "result": "hit"}
+
+
+def event_list():
+    with collect_query_stats() as stats:
+        result = RegistrationService.get_event_list(WORKSHOP, 1, 10, None, None)
+    return result["participants"], stats.count
+
+
+class TestEventListFragments:
+    def test_warm_pages_only_read_versions(self):
+        EventRegistrationFactory.create_batch(3)
+
+        cold, cold_queries = event_list()
+        warm, warm_queries = event_list()
+
+        assert warm == cold
+        assert (cold_queries, warm_queries) == (3, 2)
+
+    def test_shared_cache_behind_the_local_one(self):
+        EventRegistrationFactory.create_batch(3)
+        cold, _ = event_list()
+        # As seen by another worker
+        registration_fragments().clear()
+
+        assert event_list() == (cold, 2)
+
+    def test_status_change_is_a_new_version(self):
+        registration = EventRegistrationFactory()
+        event_list()
+
+        RegistrationService.shortlist_participants(ShortlistDTO(participants=[registration.participant_id]), WORKSHOP)
+        [entry], queries = event_list()
+
+        assert entry["participant_status"] == ParticipantStatus.SHORTLISTED.value
+        assert queries == 3
+
+    def test_participant_save_is_a_new_version(self):
+        registration = EventRegistrationFactory()
+        event_list()
+
+        participant = registration.participant
+        participant.name = "Renamed"
+        participant.save(update_fields=["name"])
+        [entry], _ = event_list()
+
+        assert entry["name"] == "Renamed"
+        participant.refresh_from_db()
+        assert participant.version == 2
+
+
+class TestFragmentCache:
+    @pytest.fixture
+    def fragments(self, request):
+        # Local memory caches of the same name share their data
+        return FragmentCache(LocMemCache(request.node.name, {}), local_size=2, timeout=60)
+
+    @pytest.fixture
+    def builds(self):
+        calls = []
+
+        def build(keys):
+            calls.append(keys)
+            return {key: f"built {key}" for key in keys}
+
+        build.calls = calls
+        return build
+
+    def test_local_lru_keeps_the_latest(self, fragments, builds):
+        fragments.get_or_build(["a", "b"], builds)
+        fragments.get_or_build(["a"], builds)
+        fragments.get_or_build(["c"], builds)
+
+        assert list(fragments.local) == ["a", "c"]
+        assert fragments.get_or_build(["a", "b", "c"], builds) == {"a": "built a", "b": "built b", "c": "built c"}
+        assert builds.calls == [["a", "b"], ["c"]]
+
+    def test_threads_wait_for_the_build_in_progress(self, fragments):
+        started, finish = threading.Event(), threading.Event()
+        calls = []
+
+        def slow_build(keys):
+            calls.append(keys)
+            started.set()
+            finish.wait(5)
+            return {key: "slow" for key in keys}
+
+        coalesced = REGISTRY.get_sample_value("cache_lookups_total", COALESCED) or 0
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(fragments.get_or_build, ["a"], slow_build)
+            started.wait(5)
+            second = pool.submit(fragments.get_or_build, ["a"], slow_build)
+            # Until the second one waits on the first one's future
+            time.sleep(0.1)
+            finish.set()
+
+            assert first.result() == second.result() == {"a": "slow"}
+        assert calls == [["a"]]
+        assert REGISTRY.get_sample_value("cache_lookups_total", COALESCED) == coalesced + 1
+
+    def test_workers_wait_for_the_lock_holder(self, fragments, builds):
+        # Another worker holds the lock and stores the fragment a little later
+        fragments.shared.add(lock_key("a"), 1)
+        entry = ("theirs", time.time() + 60, 0.01)
+        threading.Timer(0.1, fragments.shared.set, ["a", entry]).start()
+
+        assert fragments.get_or_build(["a"], builds) == {"a": "theirs"}
+        assert builds.calls == []
+
+    def test_builds_when_the_lock_holder_gives_up(self, fragments, builds, monkeypatch):
+        monkeypatch.setattr(fragments_module, "LOCK_WAIT", 0.2)
+        fragments.shared.add(lock_key("a"), 1)
+
+        assert fragments.get_or_build(["a"], builds) == {"a": "built a"}
+
+    def test_releases_its_own_locks_only(self, fragments):
+        def slow_build(keys):
+            # Past LOCK_TIMEOUT: the lock on "b" expired and another worker took it
+            fragments.shared.set(lock_key("b"), "theirs")
+            return {key: "built" for key in keys}
+
+        fragments.get_or_build(["a", "b"], slow_build)
+
+        assert fragments.shared.get(lock_key("a")) is None
+        assert fragments.shared.get(lock_key("b")) == "theirs"
+
+    def test_early_refresh(self, fragments, builds, monkeypatch):
+        # Built in 10 s, expiring in 1 s: rebuilt ahead of time
+        fragments.set_many({"a": ("cached", time.time() + 1, 10.0)})
+        monkeypatch.setattr(fragments_module.random, "random", lambda: 0.5)
+
+        assert fragments.get_or_build(["a"], builds) == {"a": "built a"}
+
+    def test_early_refresh_in_progress_elsewhere(self, fragments, builds, monkeypatch):
+        fragments.set_many({"a": ("cached", time.time() + 1, 10.0)})
+        monkeypatch.setattr(fragments_module.random, "random", lambda: 0.5)
+        fragments.shared.add(lock_key("a"), 1)
+
+        assert fragments.get_or_build(["a"], builds) == {"a": "cached"}
+        assert builds.calls == []
+
+
+def test_expires_early(monkeypatch):
+    monkeypatch.setattr(fragments_module.random, "random", lambda: 0.5)
+    now = time.time()
+
+    assert not expires_early(("x", now + 60, 0.01), now)
+    assert expires_early(("x", now + 1, 10.0), now)
+    assert expires_early(("x", now, 0.0), now)
@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from gdg_registration_backend.apps.gdg_registration.benchmarks.data import create_events
+from gdg_registration_backend.apps.gdg_registration.benchmarks.loadtest import LoadTest
+from gdg_registration_backend.apps.gdg_registration.benchmarks.loadtest import Sample
+from gdg_registration_backend.apps.gdg_registration.benchmarks.loadtest import arrival_times
+from gdg_registration_backend.apps.gdg_registration.benchmarks.loadtest import percentile
+from gdg_registration_backend.apps.gdg_registration.benchmarks.loadtest import summarize
+
+
+class TestArrivalTimes:
+    def test_constant(self):
+        assert arrival_times("constant", 4, 1, random.Random(0)) == [0, 0.25, 0.5, 0.75]
+
+    def test_ramp_accelerates(self):
+        times = arrival_times("ramp", 100, 10, random.Random(0))
+
+        assert len(times) == 500
+        first_half = sum(1 for offset in times if offset < 5)
+        assert first_half < len(times) / 2
+
+    def test_burst_front_loads(self):
+        times = arrival_times(
+            "burst", 10, 5, random.Random(0), burst_factor=5, burst_seconds=1,
+        )
+
+        assert sum(1 for offset in times if offset < 1) == 50
+        assert len(times) == 90
+
+    def test_poisson_stays_in_window(self):
+        times = arrival_times("poisson", 50, 2, random.Random(0))
+
+        assert all(0 < offset < 2 for offset in times)
+        assert times == sorted(times)
+
+    def test_unknown_pattern(self):
+        with pytest.raises(ValueError, match="Unknown arrival pattern"):
+            arrival_times("sawtooth", 1, 1, random.Random(0))
+
+
+def test_percentile():
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 95) == 0
+
+
+def test_summarize():
+    samples = [
+        Sample("register", 0.010, 201),
+        Sample("register", 0.030, 500),
+        Sample("list", 0.020, 200),
+        Sample("list", 0.040, 0),
+    ]
+
+    reports = {report.endpoint: report for report in summarize(samples, elapsed=2)}
+
+    assert reports["register"].error_rate == 0.5
+    assert reports["register"].errors_by_status == {500: 1}
+    assert reports["list"].p99_ms == 40
+    assert reports["total"].requests == 4
+    assert reports["total"].throughput == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_load_test_against_live_server(live_server):
+    create_events()
+    load_test = LoadTest(
+        f"{live_server.url}/api/v1/registration/", mix={"register": 3, "list": 1},
+    )
+
+    samples, _ = load_test.run("constant", rate=40, duration=0.5, concurrency=1)
+
+    assert len(samples) == 20
+    assert all(sample.ok for sample in samples)
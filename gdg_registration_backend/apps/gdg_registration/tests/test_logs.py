@@ -0,0 +1,136 @@
+import functools
+import json
+import logging
+import sys
+import threading
+
+import pytest
+from django.urls import reverse
+from prometheus_client import REGISTRY
+
+from gdg_registration_backend import logs
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_registration.service import RegistrationService
+
+from .factories import EventFactory
+
+pytestmark = pytest.mark.django_db
+
+WORKSHOP = EventTypes.WORKSHOP.value
+
+
+class Collect(logging.Handler):
+    def __init__(self, unblock=None):
+        super().__init__()
+        self.records = []
+        self.threads = set()
+        self.unblock = unblock
+
+    def emit(self, record):
+        if self.unblock is not None:
+            self.unblock.wait(5)
+        self.threads.add(threading.current_thread())
+        self.records.append(record)
+
+
+@pytest.fixture
+def collect():
+    handler = Collect()
+    handler.addFilter(logs.RequestContextFilter())
+    logger = logging.getLogger("gdg_registration_backend")
+    logger.addHandler(handler)
+    yield handler
+    logger.removeHandler(handler)
+
+
+class TestRequestLogMiddleware:
+    def test_records_carry_the_request(self, client, collect, monkeypatch):
+        EventFactory()
+        get_event_list = RegistrationService.get_event_list
+
+        @functools.wraps(get_event_list)
+        def logged(*args, **kwargs):
+            logging.getLogger("gdg_registration_backend.apps").warning("listing")
+            return get_event_list(*args, **kwargs)
+
+        monkeypatch.setattr(RegistrationService, "get_event_list", logged)
+
+        response = client.get(reverse("api:events_list"), {"event_type": WORKSHOP})
+
+        request_id = response["X-Request-ID"]
+        listing, finished = collect.records
+        assert (listing.request_id, listing.view) == (request_id, "api:events_list")
+        assert finished.getMessage() == f"GET {reverse('api:events_list')} 200"
+        assert (finished.request_id, finished.status) == (request_id, 200)
+        assert finished.duration_ms >= 0
+
+    def test_keeps_the_proxy_request_id(self, client, collect):
+        response = client.get("/no-such-page/", HTTP_X_REQUEST_ID="edge-42")
+
+        assert response["X-Request-ID"] == "edge-42"
+        assert collect.records[-1].request_id == "edge-42"
+
+    def test_no_context_outside_requests(self, collect):
+        logging.getLogger("gdg_registration_backend.apps").warning("outside")
+
+        assert collect.records[0].request_id == ""
+
+
+class TestListenerQueueHandler:
+    def test_handlers_run_on_the_listener_thread(self):
+        target = Collect()
+        handler = logs.ListenerQueueHandler([target])
+
+        handler.handle(logging.makeLogRecord({"levelno": logging.INFO, "msg": "%s registrations", "args": (3,)}))
+        handler.close()
+
+        [record] = target.records
+        assert record.getMessage() == "3 registrations"
+        assert threading.current_thread() not in target.threads
+
+    def test_drops_instead_of_blocking(self):
+        release = threading.Event()
+        handler = logs.ListenerQueueHandler([Collect(release)], maxsize=1)
+        dropped = REGISTRY.get_sample_value("log_records_dropped_total") or 0
+
+        # The first record blocks the listener, the second fills the queue
+        for _ in range(5):
+            handler.handle(logging.makeLogRecord({"levelno": logging.INFO, "msg": "burst"}))
+        release.set()
+        handler.close()
+
+        assert 3 <= handler.dropped <= 4
+        assert REGISTRY.get_sample_value("log_records_dropped_total") == dropped + handler.dropped
+
+
+def test_sampling_filter():
+    debug = logging.makeLogRecord({"levelno": logging.DEBUG})
+    info = logging.makeLogRecord({"levelno": logging.INFO})
+
+    assert not logs.SamplingFilter(0).filter(debug)
+    assert logs.SamplingFilter(0).filter(info)
+    assert logs.SamplingFilter(1).filter(debug)
+
+
+def test_json_formatter():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.makeLogRecord({
+            "name": "gdg_registration_backend.requests",
+            "levelno": logging.ERROR,
+            "levelname": "ERROR",
+            "msg": "GET %s %s",
+            "args": ("/api/events/", 500),
+            "request_id": "abc",
+            "view": "api:events_list",
+            "duration_ms": 12.5,
+            "exc_info": sys.exc_info(),
+        })
+
+    data = json.loads(logs.JsonFormatter().format(record))
+
+    assert data["message"] == "GET /api/events/ 500"
+    assert (data["request_id"], data["view"], data["duration_ms"]) == ("abc", "api:events_list", 12.5)
+    assert "ValueError: boom" in data["exception"]
+    assert "status" not in data
@@ -0,0 +1,118 @@
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import pytest
+from django.urls import reverse
+from prometheus_client import REGISTRY
+
+from gdg_registration_backend import metrics
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
+
+from .factories import EventFactory
+from .factories import EventRegistrationFactory
+
+pytestmark = pytest.mark.django_db
+
+WORKSHOP = EventTypes.WORKSHOP.value
+TOKEN = "scrape-token"
+
+
+@pytest.fixture
+def scrape(client, settings):
+    settings.METRICS_TOKEN = TOKEN
+
+    def scrape():
+        response = client.get(reverse("metrics"), HTTP_AUTHORIZATION=f"Bearer {TOKEN}")
+        assert response.status_code == 200
+        return response.content.decode()
+
+    return scrape
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class TestEndpoint:
+    def test_off_without_token(self, client):
+        assert client.get(reverse("metrics")).status_code == 404
+
+    def test_needs_the_token(self, client, settings):
+        settings.METRICS_TOKEN = TOKEN
+
+        assert client.get(reverse("metrics")).status_code == 401
+        assert client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer wrong").status_code == 401
+
+    def test_registration_counts(self, scrape):
+        EventRegistrationFactory.create_batch(2)
+        EventRegistrationFactory(
+            event=EventFactory(event_type=EventTypes.HACKATHON.value),
+            participant_status=ParticipantStatus.CONFIRMED.value,
+        )
+
+        body = scrape()
+
+        assert 'registrations{event_type="WORKSHOP",participant_status="PENDING"} 2.0' in body
+        assert 'registrations{event_type="HACKATHON",participant_status="CONFIRMED"} 1.0' in body
+
+
+class TestMiddleware:
+    def test_latency_and_status_by_url_name(self, client, scrape):
+        EventFactory()
+        view = "api:events_list"
+        before = sample("http_request_duration_seconds_count", view=view, method="GET")
+
+        client.get(reverse(view), {"event_type": WORKSHOP})
+        client.get(reverse(view), {"event_type": EventTypes.HACKATHON.value})
+
+        assert sample("http_request_duration_seconds_count", view=view, method="GET") == before + 2
+        body = scrape()
+        assert f'http_responses_total{{method="GET",status="404",view="{view}"}}' in body
+        assert f'http_request_duration_seconds_bucket{{le="0.005",method="GET",view="{view}"}}' in body
+
+    def test_unresolved_paths_share_a_label(self, client):
+        before = sample("http_responses_total", view="unresolved", method="GET", status="404")
+
+        client.get("/no-such-page/")
+        client.get("/another-page/")
+
+        assert sample("http_responses_total", view="unresolved", method="GET", status="404") == before + 2
+
+    def test_pool_gauges(self, client, monkeypatch):
+        stats = {"default": {"pool_size": 4, "pool_available": 3, "requests_waiting": 1}}
+        monkeypatch.setitem(sys.modules, metrics.POOL_BACKEND_MODULE, SimpleNamespace(pool_stats=lambda: stats))
+
+        client.get("/no-such-page/")
+
+        assert sample("db_pool_connections", database="default", state="total") == 4
+        assert sample("db_pool_connections", database="default", state="available") == 3
+        assert sample("db_pool_requests_waiting", database="default") == 1
+
+
+def test_cache_lookups():
+    before = sample("cache_lookups_total", cache="event_list", result="hit")
+
+    metrics.record_cache_lookup("event_list", hit=True)
+
+    assert sample("cache_lookups_total", cache="event_list", result="hit") == before + 1
+
+
+def test_workers_add_up(tmp_path, monkeypatch):
+    """Samples of separate worker processes are summed by any scrape."""
+    worker = (
+        "from gdg_registration_backend.metrics import RESPONSES; "
+        "RESPONSES.labels('api:events_list', 'GET', 200).inc()"
+    )
+    for _ in range(2):
+        subprocess.run(
+            [sys.executable, "-c", worker], check=True, env={"PROMETHEUS_MULTIPROC_DIR": str(tmp_path)},
+        )
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+    registry = metrics.scrape_registry()
+
+    assert registry.get_sample_value(
+        "http_responses_total", {"view": "api:events_list", "method": "GET", "status": "200"},
+    ) == 2
@@ -0,0 +1,99 @@
+import inspect
+import random
+
+import pytest
+
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_participants.data_class_model import ShortlistDTO
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
+from gdg_registration_backend.apps.gdg_registration.benchmarks.data import registration_payload
+from gdg_registration_backend.apps.gdg_registration.models import EventRegistration
+from gdg_registration_backend.apps.gdg_registration.service import CHECKED_IN
+from gdg_registration_backend.apps.gdg_registration.service import RegistrationService
+from gdg_registration_backend.apps.gdg_registration.tickets import ticket_token
+
+from .factories import EventFactory
+from .factories import EventRegistrationFactory
+
+pytestmark = pytest.mark.django_db
+
+WORKSHOP = EventTypes.WORKSHOP.value
+PENDING = ParticipantStatus.PENDING.value
+CONFIRMED = ParticipantStatus.CONFIRMED.value
+REJECTED = ParticipantStatus.REJECTED.value
+
+# Enough rows for a query per row to blow any budget
+SIZE = 50
+
+
+@pytest.fixture
+def pending():
+    EventFactory(capacity=SIZE)
+    return [registration.participant_id for registration in EventRegistrationFactory.create_batch(SIZE)]
+
+
+@pytest.fixture
+def tokens():
+    return [
+        ticket_token(registration.id, registration.participant_id, registration.event_id)
+        for registration in EventRegistrationFactory.create_batch(SIZE, participant_status=CONFIRMED)
+    ]
+
+
+def test_every_public_method_declares_a_budget():
+    methods = {
+        name for name, method in inspect.getmembers(RegistrationService, inspect.isfunction)
+        if not name.startswith("_")
+    }
+    assert {name for name in methods if not hasattr(getattr(RegistrationService, name), "query_budget")} == set()
+
+
+class TestQueryBudgets:
+    def test_event_list(self, assert_query_budget, pending):
+        result = assert_query_budget(RegistrationService.get_event_list, WORKSHOP, 1, SIZE, None, None)
+
+        assert len(result["participants"]) == SIZE
+
+    def test_archived_list(self, assert_query_budget, pending):
+        assert_query_budget(RegistrationService.get_archived_list, WORKSHOP, None, 1, SIZE)
+
+    def test_shortlist(self, assert_query_budget, pending):
+        assert_query_budget(RegistrationService.shortlist_participants, ShortlistDTO(participants=pending), WORKSHOP)
+
+    def test_rejection_with_promotion(self, assert_query_budget, pending):
+        RegistrationService.status_participants(ShortlistDTO(participants=pending[:10]), WORKSHOP, CONFIRMED)
+
+        # Rejecting frees seats, which promotes the waitlist in the same call
+        assert_query_budget(
+            RegistrationService.status_participants, ShortlistDTO(participants=pending[:5]), WORKSHOP, REJECTED,
+        )
+
+    def test_single_rejection_with_promotion(self, assert_query_budget, pending):
+        RegistrationService.status_participants(ShortlistDTO(participants=pending[:10]), WORKSHOP, CONFIRMED)
+        registration = EventRegistration.objects.get(participant_id=pending[0])
+
+        assert_query_budget(RegistrationService.update_registration_status, registration, REJECTED)
+
+    def test_promote_waitlist(self, assert_query_budget, pending):
+        assert len(assert_query_budget(RegistrationService.promote_waitlist, WORKSHOP)) == SIZE
+
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [("enqueue_shortlist_participants", ()), ("enqueue_status_participants", (CONFIRMED,))],
+    )
+    def test_enqueue(self, assert_query_budget, pending, method, args):
+        assert_query_budget(getattr(RegistrationService, method), ShortlistDTO(participants=pending), WORKSHOP, *args)
+
+    def test_enqueue_promote_waitlist(self, assert_query_budget, pending):
+        assert_query_budget(RegistrationService.enqueue_promote_waitlist, WORKSHOP)
+
+    def test_check_in(self, assert_query_budget, tokens):
+        assert assert_query_budget(RegistrationService.check_in, tokens[0])["result"] == CHECKED_IN
+
+    def test_check_in_batch(self, assert_query_budget, tokens):
+        assert_query_budget(RegistrationService.check_in_batch, tokens)
+
+    def test_register(self, assert_query_budget, pending):
+        payload = registration_payload(WORKSHOP, 0, random.Random(0), "budget")
+
+        assert_query_budget(RegistrationService.register_event, WORKSHOP, payload)
@@ -0,0 +1,198 @@
+"""
+Query plan regression tests.
+
+The hot ``RegistrationService`` queries are captured as they run and
+``EXPLAIN``-ed on Postgres. With sequential scans disabled, a table that no
+index can serve still shows up as a ``Seq Scan`` or as a full index scan
+without an index condition, and either fails the test. With the planner left
+alone on analyzed data, the paged queries must walk their composite index
+instead of sorting the whole event.
+"""
+
+import json
+import random
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_participants.data_class_model import ShortlistDTO
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
+from gdg_registration_backend.apps.gdg_registration.benchmarks.data import registration_payload
+from gdg_registration_backend.apps.gdg_registration.benchmarks.data import seed
+from gdg_registration_backend.apps.gdg_registration.models import EventRegistration
+from gdg_registration_backend.apps.gdg_registration.models import StatusTransition
+from gdg_registration_backend.apps.gdg_registration.service import RegistrationService
+from gdg_registration_backend.apps.gdg_registration.snapshots import stream_snapshot
+from gdg_registration_backend.apps.gdg_registration.tickets import ticket_token
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(connection.vendor != "postgresql", reason="EXPLAIN plans are Postgres specific"),
+]
+
+WORKSHOP = EventTypes.WORKSHOP.value
+CONFIRMED = ParticipantStatus.CONFIRMED.value
+INDEX_SCANS = ("Index Scan", "Index Only Scan")
+
+
+def explain(operation, *, seqscan: bool = True) -> list[tuple[str, dict]]:
+    """``(sql, JSON plan)`` of every query ``operation`` runs."""
+    with CaptureQueriesContext(connection) as captured:
+        operation()
+
+    plans = []
+    with connection.cursor() as cursor:
+        # Cost random reads as on the SSDs the database runs on, otherwise the
+        # planner hashes whole tables this small rather than look rows up
+        cursor.execute("SET LOCAL random_page_cost = 1.1")
+        if not seqscan:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        for query in captured.captured_queries:
+            sql = query["sql"]
+            if not sql.startswith(("SELECT", "UPDATE", "DELETE")):
+                continue
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}")
+            plan = cursor.fetchone()[0]
+            plans.append((sql, json.loads(plan) if isinstance(plan, str) else plan))
+        cursor.execute("SET LOCAL enable_seqscan = on")
+        cursor.execute("RESET random_page_cost")
+    return plans
+
+
+def nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from nodes(child)
+
+
+def full_scans(operation) -> dict[str, list[str]]:
+    """Tables read in full by each query ``operation`` runs, by SQL."""
+    scans = {}
+    for sql, plan in explain(operation, seqscan=False):
+        if tables := [
+            node["Relation Name"]
+            for node in nodes(plan[0]["Plan"])
+            if node["Node Type"] == "Seq Scan"
+            or (node["Node Type"] in INDEX_SCANS and "Index Cond" not in node)
+        ]:
+            scans[sql] = tables
+    return scans
+
+
+def indexes_used(operation, table: str) -> list[set[str]]:
+    """Index names each query reading ``table`` uses."""
+    return [
+        {node.get("Index Name") for node in nodes(plan[0]["Plan"])} - {None}
+        for sql, plan in explain(operation)
+        if f'FROM "{table}"' in sql
+    ]
+
+
+@pytest.fixture
+def data():
+    data = seed(1500)
+    event = data.events[WORKSHOP]
+    # A handful of free seats, as when a few confirmed participants drop out
+    event.capacity = 260
+    event.save()
+    confirmed = data.participant_ids[WORKSHOP][:250]
+    EventRegistration.objects.filter(event=event, participant_id__in=confirmed).update(participant_status=CONFIRMED)
+    StatusTransition.objects.bulk_create(
+        StatusTransition(
+            participant_id=participant_id,
+            event=event,
+            from_status=ParticipantStatus.PENDING.value,
+            to_status=CONFIRMED,
+        )
+        for participant_id in confirmed
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    return data
+
+
+class TestNoFullScans:
+    @pytest.mark.parametrize(
+        ("filter_by", "search"),
+        [
+            (None, None),
+            ("participant_type", "STUDENT"),
+            ("participant_status", CONFIRMED),
+            ("email_address", "bench-0@example.com"),
+        ],
+    )
+    def test_event_list(self, data, filter_by, search):
+        assert full_scans(
+            lambda: RegistrationService.get_event_list(WORKSHOP, 2, 10, filter_by, search),
+        ) == {}
+
+    def test_register(self, data):
+        payload = registration_payload(WORKSHOP, 0, random.Random(0), "plan")  # noqa: S311
+
+        assert full_scans(lambda: RegistrationService.register_event(WORKSHOP, payload)) == {}
+
+    def test_rejection_and_waitlist_promotion(self, data):
+        ids = data.participant_ids[WORKSHOP][:5]
+
+        assert full_scans(
+            lambda: RegistrationService.status_participants(
+                ShortlistDTO(participants=ids), WORKSHOP, ParticipantStatus.REJECTED.value,
+            ),
+        ) == {}
+
+    def test_check_in(self, data):
+        registration = data.events[WORKSHOP].eventregistration_set.filter(
+            participant_status=CONFIRMED,
+        ).first()
+        token = ticket_token(registration.id, registration.participant_id, registration.event_id)
+
+        assert full_scans(lambda: RegistrationService.check_in(token)) == {}
+        # The repeat scan takes the lookup path
+        assert full_scans(lambda: RegistrationService.check_in(token)) == {}
+
+    def test_snapshot(self, data):
+        event_id = data.events[WORKSHOP].id
+
+        assert full_scans(lambda: b"".join(stream_snapshot(event_id)[1])) == {}
+        version = StatusTransition.objects.latest("id").id
+        assert full_scans(lambda: b"".join(stream_snapshot(event_id, since=version - 10)[1])) == {}
+
+
+class TestCompositeIndexes:
+    def test_event_list_pages_in_registration_order(self, data):
+        # The page's ids, then the rows of the entries not cached yet
+        page, entries = indexes_used(
+            lambda: RegistrationService.get_event_list(WORKSHOP, 3, 10, None, None),
+            "gdg_registration_eventregistration",
+        )
+
+        assert "registration_event_time" in page
+        assert "gdg_registration_eventregistration_pkey" in entries
+
+    def test_event_list_filters_status_within_event(self, data):
+        page, _ = indexes_used(
+            lambda: RegistrationService.get_event_list(WORKSHOP, 1, 10, "participant_status", CONFIRMED),
+            "gdg_registration_eventregistration",
+        )
+
+        assert "registration_event_status" in page
+
+    def test_waitlist_head_in_waitlist_order(self, data):
+        used = indexes_used(
+            lambda: RegistrationService.promote_waitlist(WORKSHOP),
+            "gdg_registration_eventregistration",
+        )
+
+        assert any("registration_waitlist" in names for names in used)
+
+    def test_duplicate_registration_check(self, data):
+        payload = registration_payload(WORKSHOP, 1, random.Random(1), "plan")  # noqa: S311
+
+        used = indexes_used(
+            lambda: RegistrationService.register_event(WORKSHOP, payload),
+            "gdg_registration_eventregistration",
+        )
+
+        assert any("registration_participant_event" in names for names in used)
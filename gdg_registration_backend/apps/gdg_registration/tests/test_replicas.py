@@ -0,0 +1,104 @@
+import pytest
+from django.db import DEFAULT_DB_ALIAS
+from django.urls import reverse
+
+from gdg_registration_backend import replicas
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
+from gdg_registration_backend.apps.gdg_registration.service import RegistrationService
+from gdg_registration_backend.replicas import PIN_COOKIE
+from gdg_registration_backend.replicas import REPLICA_DB_ALIAS
+from gdg_registration_backend.replicas import pin_scope
+from gdg_registration_backend.replicas import read_database
+from gdg_registration_backend.replicas import replica_reads
+
+from .factories import EventRegistrationFactory
+
+pytestmark = pytest.mark.django_db
+
+WORKSHOP = EventTypes.WORKSHOP.value
+
+
+@pytest.fixture
+def routed(monkeypatch):
+    """
+    Aliases reads are routed to with a replica configured. The tests have no
+    replica, so the queries themselves still run on the primary.
+    """
+    routed = []
+    monkeypatch.setattr(replicas, "replica_configured", lambda: True)
+
+    def db_for_read(self, model, **hints):
+        routed.append(read_database())
+        return DEFAULT_DB_ALIAS
+
+    monkeypatch.setattr(replicas.ReplicaRouter, "db_for_read", db_for_read)
+    return routed
+
+
+class TestReadDatabase:
+    def test_primary_without_replica(self):
+        with replica_reads():
+            assert read_database() == DEFAULT_DB_ALIAS
+
+    def test_replica_only_inside_replica_reads(self, routed):
+        with pin_scope():
+            assert read_database() == DEFAULT_DB_ALIAS
+            with replica_reads():
+                assert read_database() == REPLICA_DB_ALIAS
+            assert read_database() == DEFAULT_DB_ALIAS
+
+    def test_writes_pin_the_rest_of_the_scope(self, routed):
+        with pin_scope() as wrote, replica_reads():
+            EventRegistrationFactory()
+
+            assert wrote()
+            assert read_database() == DEFAULT_DB_ALIAS
+
+    def test_event_list_reads_replica(self, routed):
+        EventRegistrationFactory.create_batch(3)
+
+        with pin_scope():
+            RegistrationService.get_event_list(WORKSHOP, 1, 10, None, None)
+
+        assert routed
+        assert set(routed) == {REPLICA_DB_ALIAS}
+
+
+class TestPrimaryPin:
+    def test_write_pins_client_to_primary(self, client, routed):
+        registration = EventRegistrationFactory()
+
+        response = client.post(
+            reverse("api:participants_status_update"),
+            {"type": WORKSHOP, "status": ParticipantStatus.CONFIRMED.value,
+             "participants": [registration.participant_id]},
+            content_type="application/json",
+        )
+
+        assert response.cookies[PIN_COOKIE]["max-age"] == 5
+        # The cookie keeps the next list on the primary, so it shows the change
+        routed.clear()
+        response = client.get(reverse("api:events_list"), {"event_type": WORKSHOP})
+        assert response.json()["participants"][0]["participant_status"] == ParticipantStatus.CONFIRMED.value
+        assert set(routed) == {DEFAULT_DB_ALIAS}
+
+    def test_reads_leave_client_unpinned(self, client, routed):
+        EventRegistrationFactory()
+
+        response = client.get(reverse("api:events_list"), {"event_type": WORKSHOP})
+
+        assert PIN_COOKIE not in response.cookies
+        assert set(routed) == {REPLICA_DB_ALIAS}
+
+    def test_no_pin_without_replica(self, client):
+        registration = EventRegistrationFactory()
+
+        response = client.post(
+            reverse("api:participants_status_update"),
+            {"type": WORKSHOP, "status": ParticipantStatus.CONFIRMED.value,
+             "participants": [registration.participant_id]},
+            content_type="application/json",
+        )
+
+        assert PIN_COOKIE not in response.cookies
@@ -0,0 +1,172 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_participants.data_class_model import ShortlistDTO
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
+from gdg_registration_backend.apps.gdg_registration.models import StatusTransition
+from gdg_registration_backend.apps.gdg_registration.service import RegistrationService
+from gdg_registration_backend.apps.gdg_registration.snapshots import DELTA
+from gdg_registration_backend.apps.gdg_registration.snapshots import FULL
+from gdg_registration_backend.apps.gdg_registration.snapshots import (
+    SNAPSHOT_OVERLAP_SECONDS,
+)
+from gdg_registration_backend.apps.gdg_registration.snapshots import read_snapshot
+from gdg_registration_backend.apps.gdg_registration.snapshots import stream_snapshot
+from gdg_registration_backend.apps.gdg_registration.tickets import ticket_token
+
+from .factories import EventFactory
+from .factories import EventRegistrationFactory
+
+pytestmark = pytest.mark.django_db
+
+WORKSHOP = EventTypes.WORKSHOP.value
+CONFIRMED = ParticipantStatus.CONFIRMED.value
+
+
+def age_transitions(seconds, **filters):
+    for transition in StatusTransition.objects.filter(**filters):
+        StatusTransition.objects.filter(pk=transition.pk).update(
+            created_at=transition.created_at - timedelta(seconds=seconds)
+        )
+
+
+def snapshot(event_id, since=None):
+    _, chunks = stream_snapshot(event_id, since)
+    return read_snapshot(b"".join(chunks))
+
+
+@pytest.fixture
+def registrations():
+    pending = EventRegistrationFactory(participant__name="Pending Person")
+    confirmed = [
+        EventRegistrationFactory(participant__name="Ada Lovelace"),
+        EventRegistrationFactory(participant__name="Grace Brewster Murray Hopper"),
+        EventRegistrationFactory(participant__name="Ümit Şahin"),
+    ]
+    RegistrationService.status_participants(
+        ShortlistDTO(participants=[r.participant_id for r in confirmed]), WORKSHOP, CONFIRMED,
+    )
+    return pending, confirmed
+
+
+class TestSnapshots:
+    def test_full_snapshot_lists_admissible_registrations(self, registrations):
+        pending, confirmed = registrations
+
+        header, records = snapshot(pending.event_id)
+
+        assert header == {
+            "kind": FULL,
+            "event_id": pending.event_id,
+            "version": StatusTransition.objects.latest("id").id,
+        }
+        assert [(r.registration_id, r.participant_id, r.status, r.initials) for r in records] == [
+            (confirmed[0].id, confirmed[0].participant_id, CONFIRMED, "AL"),
+            (confirmed[1].id, confirmed[1].participant_id, CONFIRMED, "GBM"),
+            (confirmed[2].id, confirmed[2].participant_id, CONFIRMED, "ÜŞ"),
+        ]
+
+    def test_delta_carries_changes_since_version(self, registrations):
+        pending, confirmed = registrations
+        header, _ = snapshot(pending.event_id)
+        RegistrationService.check_in(
+            ticket_token(confirmed[0].id, confirmed[0].participant_id, confirmed[0].event_id),
+        )
+        RegistrationService.status_participants(
+            ShortlistDTO(participants=[confirmed[1].participant_id]),
+            WORKSHOP,
+            ParticipantStatus.REJECTED.value,
+        )
+
+        delta_header, records = snapshot(pending.event_id, since=header["version"])
+
+        assert delta_header["kind"] == DELTA
+        assert delta_header["version"] > header["version"]
+        assert {(r.registration_id, r.status) for r in records} == {
+            (confirmed[0].id, ParticipantStatus.ATTENDED.value),
+            (confirmed[1].id, ParticipantStatus.REJECTED.value),
+            # Confirmed within the overlap before the version, so repeated
+            (confirmed[2].id, CONFIRMED),
+        }
+        # Nothing changed since the latest version, which itself is repeated
+        age_transitions(SNAPSHOT_OVERLAP_SECONDS + 1, id__lt=delta_header["version"])
+        _, records = snapshot(pending.event_id, since=delta_header["version"])
+        assert [r.registration_id for r in records] == [confirmed[1].id]
+
+    def test_delta_rereads_transitions_committed_late(self, registrations):
+        pending, confirmed = registrations
+        # Written before the latest one but long enough ago to have committed
+        age_transitions(SNAPSHOT_OVERLAP_SECONDS + 1, participant_id=confirmed[0].participant_id)
+        version = StatusTransition.objects.latest("id").id
+
+        _, records = snapshot(pending.event_id, since=version)
+
+        # The others may have committed after the scanner read the version
+        assert [r.registration_id for r in records] == [confirmed[1].id, confirmed[2].id]
+
+    def test_delta_carries_admin_changes(self, registrations, admin_user):
+        pending, confirmed = registrations
+        version = StatusTransition.objects.latest("id").id
+
+        # What the registration admin does on save
+        RegistrationService.update_registration_status(pending, CONFIRMED, actor=admin_user)
+
+        _, records = snapshot(pending.event_id, since=version)
+        assert (pending.id, CONFIRMED) in {(r.registration_id, r.status) for r in records}
+
+    def test_other_events_are_left_out(self, registrations):
+        hackathon = EventFactory(event_type=EventTypes.HACKATHON.value)
+        EventRegistrationFactory(event=hackathon, participant_status=CONFIRMED)
+
+        _, records = snapshot(registrations[0].event_id)
+
+        assert len(records) == 3
+
+    def test_snapshot_is_compact(self):
+        EventRegistrationFactory.create_batch(500, participant_status=CONFIRMED)
+        event = EventFactory()
+
+        _, chunks = stream_snapshot(event.id)
+        data = b"".join(chunks)
+
+        assert len(read_snapshot(data)[1]) == 500
+        assert len(data) < 500 * 8
+
+
+class TestSnapshotAPI:
+    def test_download(self, admin_client, registrations):
+        response = admin_client.get(
+            reverse("api:participants_checkin_snapshot"), {"event_type": WORKSHOP},
+        )
+
+        assert response.status_code == 200
+        header, records = read_snapshot(b"".join(response.streaming_content))
+        assert response["X-Snapshot-Version"] == str(header["version"])
+        assert len(records) == 3
+
+    def test_delta_download(self, admin_client, registrations):
+        version = StatusTransition.objects.latest("id").id
+        age_transitions(SNAPSHOT_OVERLAP_SECONDS + 1, id__lt=version)
+
+        response = admin_client.get(
+            reverse("api:participants_checkin_snapshot"), {"event_type": WORKSHOP, "since": version},
+        )
+
+        header, records = read_snapshot(b"".join(response.streaming_content))
+        assert header["kind"] == DELTA
+        assert [r.registration_id for r in records] == [registrations[1][2].id]
+
+    def test_requires_staff(self, client, registrations):
+        response = client.get(reverse("api:participants_checkin_snapshot"), {"event_type": WORKSHOP})
+
+        assert response.status_code in (401, 403)
+
+    def test_bad_version(self, admin_client):
+        response = admin_client.get(
+            reverse("api:participants_checkin_snapshot"), {"event_type": WORKSHOP, "since": "x"},
+        )
+
+        assert response.status_code == 400
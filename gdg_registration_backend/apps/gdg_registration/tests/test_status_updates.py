@@ -0,0 +1,270 @@
+import pytest
+from django.db import connection
+from django.urls import reverse
+
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_jobs.enums import JobStatus
+from gdg_registration_backend.apps.gdg_jobs.models import Job
+from gdg_registration_backend.apps.gdg_jobs.runner import work
+from gdg_registration_backend.apps.gdg_participants.data_class_model import ShortlistDTO
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
+from gdg_registration_backend.apps.gdg_registration import service
+from gdg_registration_backend.apps.gdg_registration import tasks
+from gdg_registration_backend.apps.gdg_registration.models import EventRegistration
+from gdg_registration_backend.apps.gdg_registration.models import StatusTransition
+from gdg_registration_backend.apps.gdg_registration.service import RegistrationService
+
+from .factories import EventFactory
+from .factories import EventRegistrationFactory
+from .factories import ParticipantFactory
+
+pytestmark = pytest.mark.django_db
+
+
+class TestBulkStatusUpdates:
+    def test_status_participants_returns_updated_names(self):
+        registrations = EventRegistrationFactory.create_batch(3)
+        other_event = EventFactory(event_type=EventTypes.HACKATHON.value)
+        elsewhere = EventRegistrationFactory(event=other_event)
+        ids = [registration.participant_id for registration in registrations]
+
+        updated = RegistrationService.status_participants(
+            ShortlistDTO(participants=[*ids, elsewhere.participant_id]),
+            EventTypes.WORKSHOP.value,
+            ParticipantStatus.CONFIRMED.value,
+        )
+
+        assert sorted(updated) == sorted(r.participant.name for r in registrations)
+        assert set(
+            EventRegistration.objects.filter(participant_id__in=ids).values_list("participant_status", flat=True),
+        ) == {ParticipantStatus.CONFIRMED.value}
+        elsewhere.refresh_from_db()
+        assert elsewhere.participant_status == ParticipantStatus.PENDING.value
+
+    def test_status_is_per_event(self):
+        workshop = EventRegistrationFactory()
+        hackathon = EventRegistrationFactory(
+            participant=workshop.participant,
+            event=EventFactory(event_type=EventTypes.HACKATHON.value),
+        )
+
+        RegistrationService.status_participants(
+            ShortlistDTO(participants=[workshop.participant_id]),
+            EventTypes.HACKATHON.value,
+            ParticipantStatus.CONFIRMED.value,
+        )
+
+        workshop.refresh_from_db()
+        hackathon.refresh_from_db()
+        assert workshop.participant_status == ParticipantStatus.PENDING.value
+        assert hackathon.participant_status == ParticipantStatus.CONFIRMED.value
+
+    def test_query_count_does_not_grow_with_participants(self, django_assert_max_num_queries):
+        registrations = EventRegistrationFactory.create_batch(300)
+
+        # SQLite splits the audit and outbox INSERTs into batches by its
+        # parameter limit
+        with django_assert_max_num_queries(11):
+            RegistrationService.shortlist_participants(
+                ShortlistDTO(participants=[r.participant_id for r in registrations]),
+                EventTypes.WORKSHOP.value,
+            )
+
+        assert not EventRegistration.objects.exclude(
+            participant_status=ParticipantStatus.SHORTLISTED.value,
+        ).exists()
+
+    def test_large_id_lists_are_chunked(self, monkeypatch, django_assert_num_queries):
+        monkeypatch.setattr(service, "STATUS_UPDATE_CHUNK_SIZE", 10)
+        registrations = EventRegistrationFactory.create_batch(25)
+        ids = [registration.participant_id for registration in registrations]
+
+        # Savepoint and release around three chunks, each one UPDATE ... RETURNING
+        # on Postgres or a lookup plus an UPDATE elsewhere, one audit INSERT and
+        # one outbox INSERT
+        per_chunk = 3 if connection.vendor == "postgresql" else 4
+        with django_assert_num_queries(2 + 3 * per_chunk):
+            updated = RegistrationService._bulk_update_status(  # noqa: SLF001
+                registrations[0].event, ids + ids[:5], ParticipantStatus.REJECTED.value,
+            )
+
+        assert len(updated) == 25
+
+    def test_unknown_participants(self):
+        EventFactory()
+
+        with pytest.raises(ValueError, match="No valid participants found"):
+            RegistrationService.status_participants(
+                ShortlistDTO(participants=[0]),
+                EventTypes.WORKSHOP.value,
+                ParticipantStatus.CONFIRMED.value,
+            )
+
+    def test_string_ids_are_coerced(self):
+        registrations = EventRegistrationFactory.create_batch(2)
+
+        updated = RegistrationService.status_participants(
+            ShortlistDTO(participants=[str(registrations[0].participant_id), registrations[1].participant_id]),
+            EventTypes.WORKSHOP.value,
+            ParticipantStatus.CONFIRMED.value,
+        )
+
+        assert sorted(updated) == sorted(r.participant.name for r in registrations)
+
+    @pytest.mark.parametrize("participants", [["12", "x"], [1.5], [True], "12", [None]])
+    def test_api_rejects_ids_that_are_not_integers(self, client, participants):
+        EventRegistrationFactory()
+
+        response = client.post(
+            "/api/v1/registration/participants/status/update/",
+            {
+                "type": EventTypes.WORKSHOP.value,
+                "status": ParticipantStatus.CONFIRMED.value,
+                "participants": participants,
+            },
+            content_type="application/json",
+        )
+
+        assert response.status_code == 400
+        assert response.json()["error"] == "Participant ids must be a list of integers."
+
+
+class TestStatusTransitions:
+    def test_records_previous_status_and_actor(self, user):
+        pending = EventRegistrationFactory()
+        shortlisted = EventRegistrationFactory(
+            participant_status=ParticipantStatus.SHORTLISTED.value,
+        )
+
+        RegistrationService.status_participants(
+            ShortlistDTO(participants=[pending.participant_id, shortlisted.participant_id]),
+            EventTypes.WORKSHOP.value,
+            ParticipantStatus.CONFIRMED.value,
+            actor=user,
+        )
+
+        transitions = {
+            transition.participant_id: transition
+            for transition in StatusTransition.objects.all()
+        }
+        assert transitions[pending.participant_id].from_status == ParticipantStatus.PENDING.value
+        assert (
+            transitions[shortlisted.participant_id].from_status
+            == ParticipantStatus.SHORTLISTED.value
+        )
+        assert {t.to_status for t in transitions.values()} == {ParticipantStatus.CONFIRMED.value}
+        assert {t.actor for t in transitions.values()} == {user}
+        assert {t.event_id for t in transitions.values()} == {pending.event_id}
+
+    def test_unchanged_status_is_not_recorded(self):
+        registration = EventRegistrationFactory(
+            participant_status=ParticipantStatus.SHORTLISTED.value,
+        )
+
+        RegistrationService.shortlist_participants(
+            ShortlistDTO(participants=[registration.participant_id]),
+            EventTypes.WORKSHOP.value,
+        )
+
+        assert not StatusTransition.objects.exists()
+
+    def test_waitlist_promotions_are_recorded(self):
+        event = EventFactory(capacity=2)
+        EventRegistrationFactory.create_batch(2, event=event)
+
+        RegistrationService.promote_waitlist(event.event_type)
+
+        assert StatusTransition.objects.filter(
+            event=event,
+            from_status=ParticipantStatus.PENDING.value,
+            to_status=ParticipantStatus.SHORTLISTED.value,
+            actor=None,
+        ).count() == 2
+
+    def test_api_records_authenticated_actor(self, client, admin_user):
+        registration = EventRegistrationFactory(participant=ParticipantFactory())
+        client.force_login(admin_user)
+
+        response = client.post(
+            "/api/v1/registration/participants/status/update/",
+            {
+                "type": EventTypes.WORKSHOP.value,
+                "status": ParticipantStatus.REJECTED.value,
+                "participants": [registration.participant_id],
+            },
+            content_type="application/json",
+        )
+
+        assert response.status_code == 200
+        assert StatusTransition.objects.get().actor == admin_user
+
+    def test_admin_change_is_recorded(self, admin_client, admin_user):
+        registration = EventRegistrationFactory()
+
+        response = admin_client.post(
+            reverse("admin:gdg_registration_eventregistration_change", args=[registration.id]),
+            {
+                "participant": registration.participant_id,
+                "event": registration.event_id,
+                "workshop_participation": '["Flutter"]',
+                "team_name": "Null Pointers",
+                "team_members": '["Ada Lovelace"]',
+                "purpose_of_participation": "Learning",
+                "google_technologies": '["Firebase"]',
+                "previous_projects": "None yet",
+                "waitlist_score": 0,
+                "participant_status": ParticipantStatus.CONFIRMED.value,
+            },
+        )
+
+        assert response.status_code == 302
+        registration.refresh_from_db()
+        assert registration.participant_status == ParticipantStatus.CONFIRMED.value
+        assert registration.team_name == "Null Pointers"
+        transition = StatusTransition.objects.get()
+        assert (transition.from_status, transition.to_status, transition.actor) == (
+            ParticipantStatus.PENDING.value,
+            ParticipantStatus.CONFIRMED.value,
+            admin_user,
+        )
+
+
+class TestBackgroundStatusUpdates:
+    def test_status_update_runs_as_job(self, client, monkeypatch):
+        monkeypatch.setattr(tasks, "STATUS_UPDATE_CHUNK_SIZE", 2)
+        registrations = EventRegistrationFactory.create_batch(5)
+        ids = [registration.participant_id for registration in registrations]
+
+        response = client.post(
+            reverse("api:participants_status_update"),
+            {"type": EventTypes.WORKSHOP.value, "status": ParticipantStatus.CONFIRMED.value,
+             "participants": ids, "async": True},
+            content_type="application/json",
+        )
+
+        assert response.status_code == 202
+        # Nothing changes until a worker runs the job
+        assert not EventRegistration.objects.filter(
+            participant_status=ParticipantStatus.CONFIRMED.value,
+        ).exists()
+
+        work(once=True)
+
+        job = Job.objects.get(pk=response.json()["job_id"])
+        assert job.status == JobStatus.SUCCEEDED.value
+        assert job.result == {"updated": 5, "promoted": 0}
+        assert (job.progress_done, job.progress_total) == (5, 5)
+        assert EventRegistration.objects.filter(
+            participant_status=ParticipantStatus.CONFIRMED.value,
+        ).count() == 5
+        assert StatusTransition.objects.count() == 5
+
+    def test_invalid_status_is_rejected_before_queueing(self):
+
+        EventFactory()
+
+        with pytest.raises(ValueError, match="Invalid participant status"):
+            RegistrationService.enqueue_status_participants(
+                ShortlistDTO(participants=[1]), EventTypes.WORKSHOP.value, "UNKNOWN",
+            )
+        assert not Job.objects.exists()
@@ -0,0 +1,123 @@
+import io
+
+import pytest
+from django.core.files.storage import default_storage
+from django.urls import reverse
+from PIL import Image
+
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
+from gdg_registration_backend.apps.gdg_registration import tickets
+from gdg_registration_backend.apps.gdg_registration.tickets import generate_tickets
+from gdg_registration_backend.apps.gdg_registration.tickets import read_ticket_token
+from gdg_registration_backend.apps.gdg_registration.tickets import ticket_token
+
+from .factories import EventRegistrationFactory
+
+pytestmark = pytest.mark.django_db
+
+CONFIRMED = ParticipantStatus.CONFIRMED.value
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def confirmed():
+    EventRegistrationFactory()  # Pending, gets no ticket
+    return EventRegistrationFactory.create_batch(3, participant_status=CONFIRMED)
+
+
+class TestTokens:
+    def test_round_trip(self):
+        assert read_ticket_token(ticket_token(12, 34, 5)) == (12, 34, 5)
+
+    def test_tampered_token(self):
+        token = ticket_token(12, 34, 5)
+
+        with pytest.raises(ValueError, match="Invalid ticket"):
+            read_ticket_token(token.replace("12.34", "13.34", 1))
+
+
+class TestGenerateTickets:
+    def test_renders_confirmed_participants(self, confirmed):
+        result = generate_tickets(workers=1)
+
+        assert (result.rendered, result.unchanged) == (3, 0)
+        for registration in confirmed:
+            registration.refresh_from_db()
+            assert default_storage.exists(registration.ticket.name)
+            image = Image.open(io.BytesIO(default_storage.open(registration.ticket.name).read()))
+            assert image.format == "PNG"
+
+    def test_only_changed_tickets_are_rendered_again(self, confirmed):
+        generate_tickets(workers=1)
+        renamed = confirmed[0].participant
+        renamed.name = "Renamed Participant"
+        renamed.save()
+        confirmed[0].refresh_from_db()
+        old_ticket = confirmed[0].ticket.name
+
+        result = generate_tickets(workers=1)
+
+        assert (result.rendered, result.unchanged) == (1, 2)
+        confirmed[0].refresh_from_db()
+        assert confirmed[0].ticket.name != old_ticket
+        assert not default_storage.exists(old_ticket)
+
+    def test_missing_files_are_rendered_again(self, confirmed):
+        generate_tickets(workers=1)
+        confirmed[1].refresh_from_db()
+        default_storage.delete(confirmed[1].ticket.name)
+
+        result = generate_tickets(workers=1, batch_size=2)
+
+        assert (result.rendered, result.unchanged) == (1, 2)
+        assert default_storage.exists(confirmed[1].ticket.name)
+
+    def test_process_pool(self, confirmed):
+        result = generate_tickets(workers=2)
+
+        assert result.rendered == 3
+
+    def test_ticket_encodes_signed_token(self):
+        data = tickets.TicketData(1, 2, 3, ticket_token(1, 2, 3), "Ada", "DevFest", None)
+
+        image = Image.open(io.BytesIO(tickets.render_ticket(data)))
+
+        assert image.width == tickets.TICKET_WIDTH
+
+
+class TestTicketAPI:
+    def test_serves_pre_rendered_ticket(self, admin_client, confirmed):
+        generate_tickets(workers=1)
+        participant_id = confirmed[0].participant_id
+
+        response = admin_client.get(
+            reverse("api:participant_ticket", args=[participant_id]),
+            {"event_type": EventTypes.WORKSHOP.value},
+        )
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "image/png"
+        assert b"".join(response.streaming_content).startswith(b"\x89PNG")
+
+    def test_does_not_render_on_request(self, admin_client, confirmed):
+        response = admin_client.get(
+            reverse("api:participant_ticket", args=[confirmed[0].participant_id]),
+            {"event_type": EventTypes.WORKSHOP.value},
+        )
+
+        assert response.status_code == 404
+        assert response.json()["error"] == "Ticket not generated yet."
+
+    def test_requires_staff(self, client, confirmed):
+        response = client.get(
+            reverse("api:participant_ticket", args=[confirmed[0].participant_id]),
+            {"event_type": EventTypes.WORKSHOP.value},
+        )
+
+        assert response.status_code in (401, 403)
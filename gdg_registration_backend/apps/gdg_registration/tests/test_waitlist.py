@@ -0,0 +1,159 @@
+import threading
+
+import pytest
+from django.db import connection
+from django.db import transaction
+from django.urls import reverse
+
+from gdg_registration_backend.apps.gdg_participants.data_class_model import ShortlistDTO
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
+from gdg_registration_backend.apps.gdg_registration.models import EventRegistration
+from gdg_registration_backend.apps.gdg_registration.models import StatusTransition
+from gdg_registration_backend.apps.gdg_registration.service import RegistrationService
+
+from .factories import EventFactory
+from .factories import EventRegistrationFactory
+
+pytestmark = pytest.mark.django_db
+
+
+class TestPromoteWaitlist:
+    def test_fills_free_seats_in_waitlist_order(self):
+        event = EventFactory(capacity=3)
+        EventRegistrationFactory(
+            event=event,
+            participant_status=ParticipantStatus.CONFIRMED.value,
+        )
+        late = EventRegistrationFactory(event=event)
+        early = EventRegistrationFactory(event=event)
+        boosted = EventRegistrationFactory(event=event, waitlist_score=10)
+        # Make "early" register before "late"
+        early.registered_at = late.registered_at.replace(year=2000)
+        early.save()
+
+        promoted = RegistrationService.promote_waitlist(event.event_type)
+
+        assert promoted == [boosted.participant.name, early.participant.name]
+        statuses = dict(
+            EventRegistration.objects.values_list("participant_id", "participant_status"),
+        )
+        assert statuses[boosted.participant_id] == ParticipantStatus.SHORTLISTED.value
+        assert statuses[early.participant_id] == ParticipantStatus.SHORTLISTED.value
+        assert statuses[late.participant_id] == ParticipantStatus.PENDING.value
+
+    def test_promotes_in_constant_queries(self, django_assert_num_queries):
+        event = EventFactory(capacity=100)
+        EventRegistrationFactory.create_batch(80, event=event)
+
+        # Savepoint, event lock, seat count, waitlist slice, UPDATE, audit INSERT,
+        # outbox INSERT, release
+        with django_assert_num_queries(8):
+            promoted = RegistrationService.promote_waitlist(event.event_type)
+
+        assert len(promoted) == 80
+
+    def test_uncapped_event_has_no_waitlist(self):
+        event = EventFactory(capacity=None)
+        EventRegistrationFactory(event=event)
+
+        assert RegistrationService.promote_waitlist(event.event_type) == []
+
+    def test_full_event_promotes_nobody(self):
+        event = EventFactory(capacity=1)
+        EventRegistrationFactory(
+            event=event,
+            participant_status=ParticipantStatus.SHORTLISTED.value,
+        )
+        EventRegistrationFactory(event=event)
+
+        assert RegistrationService.promote_waitlist(event.event_type) == []
+
+    def test_rejection_promotes_replacement(self):
+        event = EventFactory(capacity=1)
+        confirmed = EventRegistrationFactory(
+            event=event,
+            participant_status=ParticipantStatus.CONFIRMED.value,
+        )
+        waiting = EventRegistrationFactory(event=event)
+
+        RegistrationService.status_participants(
+            ShortlistDTO(participants=[confirmed.participant_id]),
+            event.event_type,
+            ParticipantStatus.REJECTED.value,
+        )
+
+        waiting.refresh_from_db()
+        assert waiting.participant_status == ParticipantStatus.SHORTLISTED.value
+
+    def test_invalid_status(self):
+        event = EventFactory(capacity=1)
+
+        with pytest.raises(ValueError, match="Invalid participant status"):
+            RegistrationService.promote_waitlist(event.event_type, "UNKNOWN")
+
+    @pytest.mark.parametrize("target_status", [ParticipantStatus.PENDING.value, ParticipantStatus.REJECTED.value])
+    def test_status_without_a_seat(self, target_status):
+        event = EventFactory(capacity=1)
+        waiting = EventRegistrationFactory(event=event)
+
+        with pytest.raises(ValueError, match="Invalid participant status"):
+            RegistrationService.promote_waitlist(event.event_type, target_status)
+
+        waiting.refresh_from_db()
+        assert waiting.participant_status == ParticipantStatus.PENDING.value
+        assert not StatusTransition.objects.exists()
+
+    def test_api(self, client):
+        event = EventFactory(capacity=1)
+        waiting = EventRegistrationFactory(event=event)
+
+        response = client.post(
+            reverse("api:participants_waitlist_promote"),
+            {"type": event.event_type},
+            content_type="application/json",
+        )
+
+        assert response.status_code == 200
+        assert response.json()["promoted_participants"] == [waiting.participant.name]
+
+    def test_api_rejects_status_without_a_seat(self, client):
+        event = EventFactory(capacity=1)
+        EventRegistrationFactory(event=event)
+
+        response = client.post(
+            reverse("api:participants_waitlist_promote"),
+            {"type": event.event_type, "status": ParticipantStatus.REJECTED.value},
+            content_type="application/json",
+        )
+
+        assert response.status_code == 400
+
+
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="SQLite has no row locks")
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_status_change_is_not_promoted():
+    event = EventFactory(capacity=2)
+    rejected, waiting = EventRegistrationFactory.create_batch(2, event=event)
+    updated, commit = threading.Event(), threading.Event()
+
+    def reject():
+        try:
+            with transaction.atomic():
+                EventRegistration.objects.filter(pk=rejected.pk).update(
+                    participant_status=ParticipantStatus.REJECTED.value
+                )
+                updated.set()
+                commit.wait(5)
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=reject)
+    thread.start()
+    updated.wait(5)
+    # The promotion waits for the rejection to commit
+    threading.Timer(0.2, commit.set).start()
+    promoted = RegistrationService.promote_waitlist(event.event_type)
+    thread.join()
+
+    assert promoted == [waiting.participant.name]
+    assert list(StatusTransition.objects.values_list("participant_id", flat=True)) == [waiting.participant_id]
@@ -0,0 +1,184 @@
+"""
+Signed QR tickets for confirmed participants.
+
+A ticket's QR code holds a token signed with an HMAC of the secret key, so the
+check-in desk can verify it without a database read. Images are rendered
+ahead of time in a process pool and stored through the default storage under a
+name that includes a fingerprint of the printed data. A ticket is rendered again
+only when that fingerprint changes.
+"""
+
+import hashlib
+import io
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import qrcode
+from django.core import signing
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import F
+from PIL import Image
+from PIL import ImageDraw
+
+from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
+from gdg_registration_backend.apps.gdg_registration.models import EventRegistration
+
+TICKET_SALT = "gdg_registration.ticket"
+# Bump when the ticket layout changes to re-render every ticket
+TICKET_LAYOUT_VERSION = 1
+TICKET_BATCH_SIZE = 500
+TICKET_WIDTH = 480
+
+
+@dataclass(frozen=True)
+class TicketData:
+    registration_id: int
+    participant_id: int
+    event_id: int
+    token: str
+    name: str
+    event_name: str
+    team_name: str | None
+
+    @property
+    def fingerprint(self) -> str:
+        printed = "\x1f".join(
+            str(value)
+            for value in (TICKET_LAYOUT_VERSION, self.token, self.name, self.event_name, self.team_name)
+        )
+        return hashlib.sha256(printed.encode()).hexdigest()[:16]
+
+    @property
+    def file_name(self) -> str:
+        return f"tickets/{self.event_id}/{self.registration_id}-{self.fingerprint}.png"
+
+
+def ticket_token(registration_id: int, participant_id: int, event_id: int) -> str:
+    return signing.Signer(salt=TICKET_SALT).sign(f"{registration_id}.{participant_id}.{event_id}")
+
+
+def read_ticket_token(token: str) -> tuple[int, int, int]:
+    """
+    ``(registration_id, participant_id, event_id)`` of a ticket token, raises
+    ValueError when the signature does not match.
+    """
+    try:
+        value = signing.Signer(salt=TICKET_SALT).unsign(token)
+        registration_id, participant_id, event_id = (int(part) for part in value.split("."))
+    except (signing.BadSignature, ValueError) as e:
+        raise ValueError("Invalid ticket.") from e
+    return registration_id, participant_id, event_id
+
+
+def render_ticket(ticket: TicketData) -> bytes:
+    """PNG of the ticket. Runs in pool workers, so it must not touch the database."""
+    qr = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_M, box_size=8, border=2)
+    qr.add_data(ticket.token)
+    code = qr.make_image().get_image().convert("RGB")
+    code = code.resize((TICKET_WIDTH, TICKET_WIDTH), Image.NEAREST)
+
+    lines = [ticket.event_name, ticket.name]
+    if ticket.team_name:
+        lines.append(f"Team: {ticket.team_name}")
+    lines.append(f"Ticket #{ticket.registration_id}")
+
+    line_height = 22
+    image = Image.new("RGB", (TICKET_WIDTH, TICKET_WIDTH + line_height * len(lines) + 16), "white")
+    image.paste(code, (0, 0))
+    draw = ImageDraw.Draw(image)
+    for index, line in enumerate(lines):
+        draw.text((16, TICKET_WIDTH + 8 + index * line_height), line[:60], fill="black")
+
+    output = io.BytesIO()
+    image.save(output, format="PNG", optimize=True)
+    return output.getvalue()
+
+
+def ticket_registrations(event_id: int | None = None):
+    registrations = EventRegistration.objects.filter(
+        participant_status=ParticipantStatus.CONFIRMED.value,
+    )
+    if event_id:
+        registrations = registrations.filter(event_id=event_id)
+    return registrations
+
+
+def _ticket_batches(registrations, batch_size: int) -> Iterator[list[tuple[str | None, TicketData]]]:
+    """``(current file name, ticket data)`` pairs, streamed in batches."""
+    rows = (
+        registrations.order_by("id")
+        .values_list(
+            "id", "participant_id", "event_id", "participant__name", "event__name",
+            "team_name", "ticket",
+        )
+        .iterator(chunk_size=batch_size)
+    )
+    batch = []
+    for registration_id, participant_id, event_id, name, event_name, team_name, current in rows:
+        data = TicketData(
+            registration_id=registration_id,
+            participant_id=participant_id,
+            event_id=event_id,
+            token=ticket_token(registration_id, participant_id, event_id),
+            name=name,
+            event_name=event_name,
+            team_name=team_name,
+        )
+        batch.append((current or None, data))
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+@dataclass
+class TicketRunResult:
+    rendered: int = 0
+    unchanged: int = 0
+
+
+def generate_tickets(
+    event_id: int | None = None,
+    workers: int | None = None,
+    batch_size: int = TICKET_BATCH_SIZE,
+    force: bool = False,
+    on_progress=None,
+) -> TicketRunResult:
+    """
+    Render the tickets of every confirmed registration whose printed data
+    changed since its last render, ``workers`` processes at a time (inline
+    with ``workers=1``).
+    """
+    result = TicketRunResult()
+    executor = ProcessPoolExecutor(max_workers=workers) if workers != 1 else None
+    try:
+        for batch in _ticket_batches(ticket_registrations(event_id), batch_size):
+            stale = [
+                (current, data)
+                for current, data in batch
+                if force or current != data.file_name or not default_storage.exists(current)
+            ]
+            result.unchanged += len(batch) - len(stale)
+            tickets = [data for _, data in stale]
+            images = executor.map(render_ticket, tickets, chunksize=16) if executor else map(render_ticket, tickets)
+
+            updated = []
+            for (current, data), png in zip(stale, images, strict=True):
+                # Drop the outdated image and any leftover of an interrupted run,
+                # so the storage keeps the exact name
+                for name in {current, data.file_name}:
+                    if name and default_storage.exists(name):
+                        default_storage.delete(name)
+                name = default_storage.save(data.file_name, ContentFile(png))
+                updated.append(EventRegistration(id=data.registration_id, ticket=name, version=F("version") + 1))
+            EventRegistration.objects.bulk_update(updated, ["ticket", "version"])
+            result.rendered += len(updated)
+            if on_progress:
+                on_progress(result)
+    finally:
+        if executor:
+            executor.shutdown()
+    return result
@@ -1,9 +1,14 @@
 from django.urls import path
-from .views import GetEventListAPI, ShortlistParticipantsAPI, UpdateParticipantStatusAPI,EventRegistrationView
+from .views import GetEventListAPI, ShortlistParticipantsAPI, UpdateParticipantStatusAPI,EventRegistrationView,PromoteWaitlistAPI,ParticipantTicketAPI,CheckInAPI,BatchCheckInAPI,CheckInSnapshotAPI,ArchivedRegistrationListAPI
 
 urlpatterns = [ 
     path('events/list/', GetEventListAPI.as_view(), name='events_list'),
      path('participants/status/update/', UpdateParticipantStatusAPI.as_view(), name='participants_status_update'),
     path('events/register/', EventRegistrationView.as_view(), name='events_register'),
-]
-  #QR Route to be added
\ No newline at end of file
+    path('participants/waitlist/promote/', PromoteWaitlistAPI.as_view(), name='participants_waitlist_promote'),
+    path('participants/<int:participant_id>/ticket/', ParticipantTicketAPI.as_view(), name='participant_ticket'),
+    path('participants/checkin/', CheckInAPI.as_view(), name='participants_checkin'),
+    path('participants/checkin/batch/', BatchCheckInAPI.as_view(), name='participants_checkin_batch'),
+    path('participants/checkin/snapshot/', CheckInSnapshotAPI.as_view(), name='participants_checkin_snapshot'),
+    path('events/archive/', ArchivedRegistrationListAPI.as_view(), name='events_archive'),
+]
\ No newline at end of file
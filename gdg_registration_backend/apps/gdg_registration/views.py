@@ -1,23 +1,62 @@
+from django.core.files.storage import default_storage
+from django.http import FileResponse
+from django.http import StreamingHttpResponse
 from django.shortcuts import render
+from django.urls import reverse
 
 # Create your views here.
 from marshmallow import ValidationError
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.permissions import IsAdminUser
+
+from gdg_registration_backend.db.enums import TransactionPolicy
+from gdg_registration_backend.db.transactions import TransactionPolicyMixin
 
 from gdg_registration_backend.apps.gdg_participants.data_class_model import ShortlistDTO
-from .service import RegistrationService
+from gdg_registration_backend.apps.gdg_events.models import Event
+
+from .models import EventRegistration
+from .snapshots import stream_snapshot
+from .service import ALREADY_CHECKED_IN, CHECKED_IN, INVALID_TICKET, RegistrationService, coerce_participant_ids
 from gdg_registration_backend.apps.gdg_participants.enums import ParticipantStatus
 
-class GetEventListAPI(APIView):
+# Session and user lookups of an authenticated request, on top of a view's
+# service call in its query_budget
+AUTH_QUERIES = 2
+# Token and user lookup, one joined query, of a scanner's API token
+SCANNER_AUTH_QUERIES = 1
+
+
+def request_actor(request):
+    """The authenticated user behind a request, recorded on status transitions."""
+    return request.user if request.user.is_authenticated else None
+
+
+def job_accepted(job, message):
+    """202 response pointing the client at the status of a queued job."""
+    return Response(
+        {
+            "message": message,
+            "job_id": job.id,
+            "status_url": reverse("api:job_status", args=[job.id]),
+        },
+        status=status.HTTP_202_ACCEPTED,
+    )
+
+
+class GetEventListAPI(TransactionPolicyMixin, APIView):
+    transaction_policy = TransactionPolicy.READ_ONLY
+    query_budget = RegistrationService.get_event_list.query_budget + AUTH_QUERIES
 
     permission_classes = []
 
     def get(self, request):
         try:
-            page = request.query_params.get("page", 1)
-            per_page = request.query_params.get("perPage", 10)
+            page = int(request.query_params.get("page", 1))
+            per_page = int(request.query_params.get("perPage", 10))
             filter_by = request.query_params.get("filterBy", None)
             search = request.query_params.get("search", None)
 
@@ -42,7 +81,9 @@ class GetEventListAPI(APIView):
             )
 
 
-class ShortlistParticipantsAPI(APIView):
+class ShortlistParticipantsAPI(TransactionPolicyMixin, APIView):
+    transaction_policy = TransactionPolicy.SERVICE
+    query_budget = RegistrationService.shortlist_participants.query_budget + AUTH_QUERIES
     permission_classes = []
 
     def post(self, request):
@@ -55,9 +96,21 @@ class ShortlistParticipantsAPI(APIView):
                     {"error": "No participants provided"},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
+            try:
+                participants = coerce_participant_ids(participants)
+            except ValueError as e:
+                return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
             shortlist_dto = ShortlistDTO(participants=participants)
-            RegistrationService.shortlist_participants(shortlist_dto, event_type)
+            if request.data.get("async"):
+                job = RegistrationService.enqueue_shortlist_participants(
+                    shortlist_dto, event_type, actor=request_actor(request)
+                )
+                return job_accepted(job, "Shortlisting queued")
+
+            RegistrationService.shortlist_participants(
+                shortlist_dto, event_type, actor=request_actor(request)
+            )
             return Response(
                 {"message": "Participants shortlisted successfully"},
                 status=status.HTTP_200_OK,
@@ -73,7 +126,9 @@ class ShortlistParticipantsAPI(APIView):
 
 
 
-class UpdateParticipantStatusAPI(APIView):
+class UpdateParticipantStatusAPI(TransactionPolicyMixin, APIView):
+    transaction_policy = TransactionPolicy.SERVICE
+    query_budget = RegistrationService.status_participants.query_budget + AUTH_QUERIES
     permission_classes = []  # Adjust as needed
 
     def post(self, request):
@@ -97,12 +152,27 @@ class UpdateParticipantStatusAPI(APIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
+            # The ids go to a raw UPDATE as they are, "12" would not match a bigint
+            try:
+                participants = coerce_participant_ids(participants)
+            except ValueError as e:
+                return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
             # Create a DTO for participants
             shortlist_dto = ShortlistDTO(participants=participants)
 
+            # Large updates can run in the background, the client polls the job
+            if request.data.get("async"):
+                job = RegistrationService.enqueue_status_participants(
+                    shortlist_dto, event_type, participant_status,
+                    actor=request_actor(request),
+                )
+                return job_accepted(job, "Status update queued")
+
             # Call the service to update participants' status and get their names
             updated_participants = RegistrationService.status_participants(
-                shortlist_dto, event_type, participant_status
+                shortlist_dto, event_type, participant_status,
+                actor=request_actor(request),
             )
 
             # Return success response with updated participant names
@@ -127,7 +197,53 @@ class UpdateParticipantStatusAPI(APIView):
 
 
 
-class EventRegistrationView(APIView):
+class PromoteWaitlistAPI(TransactionPolicyMixin, APIView):
+    transaction_policy = TransactionPolicy.SERVICE
+    query_budget = RegistrationService.promote_waitlist.query_budget + AUTH_QUERIES
+    permission_classes = []  # Adjust as needed
+
+    def post(self, request):
+        try:
+            event_type = request.data.get("type")
+            target_status = request.data.get("status", ParticipantStatus.SHORTLISTED.value)
+
+            if target_status not in ParticipantStatus.seat_holding_statuses():
+                return Response(
+                    {"error": f"Invalid participant status for a promotion: {target_status}"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            if request.data.get("async"):
+                job = RegistrationService.enqueue_promote_waitlist(
+                    event_type, target_status, actor=request_actor(request)
+                )
+                return job_accepted(job, "Waitlist promotion queued")
+
+            # Fill every free seat of the event from the head of the waitlist
+            promoted_participants = RegistrationService.promote_waitlist(
+                event_type, target_status, actor=request_actor(request)
+            )
+
+            return Response(
+                {
+                    "message": "Waitlist promoted successfully",
+                    "promoted_participants": promoted_participants
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        except Exception as e:
+            return Response(
+                {"error": "Something went wrong"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
+class EventRegistrationView(TransactionPolicyMixin, APIView):
+    transaction_policy = TransactionPolicy.SERVICE
+    query_budget = RegistrationService.register_event.query_budget + AUTH_QUERIES
     permission_classes = []
 
     def post(self, request):
@@ -155,3 +271,138 @@ class EventRegistrationView(APIView):
                 {"error": "Internal server error"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+
+class ParticipantTicketAPI(TransactionPolicyMixin, APIView):
+    transaction_policy = TransactionPolicy.READ_ONLY
+    # A ticket admits its holder, only staff may download them
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, participant_id):
+        event_type = request.query_params.get("event_type")
+        if not event_type:
+            return Response(
+                {"error": "event_type query parameter is required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        ticket = (
+            EventRegistration.objects.filter(
+                participant_id=participant_id, event__event_type=event_type
+            )
+            .values_list("ticket", flat=True)
+            .first()
+        )
+        if ticket is None:
+            return Response({"error": "Registration not found."}, status=status.HTTP_404_NOT_FOUND)
+        # Tickets are rendered ahead of time by generate_tickets, never here
+        if not ticket or not default_storage.exists(ticket):
+            return Response({"error": "Ticket not generated yet."}, status=status.HTTP_404_NOT_FOUND)
+
+        return FileResponse(default_storage.open(ticket), content_type="image/png")
+
+
+# Batch check-ins accepted per request
+MAX_CHECK_IN_BATCH = 1000
+
+
+class CheckInAPI(TransactionPolicyMixin, APIView):
+    transaction_policy = TransactionPolicy.SERVICE
+    query_budget = RegistrationService.check_in.query_budget + SCANNER_AUTH_QUERIES
+    # Scanners are staff accounts sending their API token, no session lookup
+    # on the hot path. The scanning account is recorded on the transition
+    authentication_classes = [TokenAuthentication]
+    permission_classes = [IsAdminUser]
+
+    def post(self, request):
+        token = request.data.get("token")
+        if not token:
+            return Response({"error": "token is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        outcome = RegistrationService.check_in(token, actor=request_actor(request))
+        if outcome["result"] in (CHECKED_IN, ALREADY_CHECKED_IN):
+            return Response(outcome, status=status.HTTP_200_OK)
+        if outcome["result"] == INVALID_TICKET:
+            return Response(outcome, status=status.HTTP_400_BAD_REQUEST)
+        return Response(outcome, status=status.HTTP_409_CONFLICT)
+
+
+class BatchCheckInAPI(TransactionPolicyMixin, APIView):
+    transaction_policy = TransactionPolicy.SERVICE
+    query_budget = RegistrationService.check_in_batch.query_budget + SCANNER_AUTH_QUERIES
+    authentication_classes = [TokenAuthentication]
+    permission_classes = [IsAdminUser]
+
+    def post(self, request):
+        tokens = request.data.get("tokens")
+        if not tokens or not isinstance(tokens, list):
+            return Response({"error": "No tokens provided"}, status=status.HTTP_400_BAD_REQUEST)
+        if len(tokens) > MAX_CHECK_IN_BATCH:
+            return Response(
+                {"error": f"At most {MAX_CHECK_IN_BATCH} tokens per batch"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        results = RegistrationService.check_in_batch(
+            [str(token) for token in tokens], actor=request_actor(request)
+        )
+        counts = {}
+        for outcome in results:
+            counts[outcome["result"]] = counts.get(outcome["result"], 0) + 1
+        return Response({"results": results, "counts": counts}, status=status.HTTP_200_OK)
+
+
+class CheckInSnapshotAPI(TransactionPolicyMixin, APIView):
+    transaction_policy = TransactionPolicy.READ_ONLY
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        event_type = request.query_params.get("event_type")
+        if not event_type:
+            return Response(
+                {"error": "event_type query parameter is required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            since = request.query_params.get("since")
+            since = int(since) if since is not None else None
+        except ValueError:
+            return Response({"error": "since must be a snapshot version"}, status=status.HTTP_400_BAD_REQUEST)
+
+        event = Event.objects.filter(event_type=event_type).first()
+        if not event:
+            return Response({"error": "Event not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        version, chunks = stream_snapshot(event.id, since)
+        response = StreamingHttpResponse(chunks, content_type="application/octet-stream")
+        response["X-Snapshot-Version"] = str(version)
+        kind = "full" if since is None else f"delta-{since}"
+        response["Content-Disposition"] = f'attachment; filename="checkin-{event.event_type.lower()}-{kind}-{version}.gdgs"'
+        return response
+
+
+class ArchivedRegistrationListAPI(TransactionPolicyMixin, APIView):
+    transaction_policy = TransactionPolicy.READ_ONLY
+    query_budget = RegistrationService.get_archived_list.query_budget + AUTH_QUERIES
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        event_type = request.query_params.get("event_type")
+        if not event_type:
+            return Response(
+                {"error": "event_type query parameter is required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            page = int(request.query_params.get("page", 1))
+            per_page = int(request.query_params.get("perPage", 10))
+            season = request.query_params.get("season")
+            season = int(season) if season is not None else None
+        except ValueError:
+            return Response({"error": "page, perPage and season must be numbers"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            archive = RegistrationService.get_archived_list(event_type, season, page, per_page)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        return Response(archive, status=status.HTTP_200_OK)
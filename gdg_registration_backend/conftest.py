@@ -1,5 +1,8 @@
 import pytest
+from django.core.cache import cache
 
+from gdg_registration_backend.apps.gdg_registration.fragments import registration_fragments
+from gdg_registration_backend.db.queries import collect_query_stats
 from gdg_registration_backend.users.models import User
 from gdg_registration_backend.users.tests.factories import UserFactory
 
@@ -9,6 +12,29 @@ def _media_storage(settings, tmpdir) -> None:
     settings.MEDIA_ROOT = tmpdir.strpath
 
 
+@pytest.fixture(autouse=True)
+def _fragment_cache() -> None:
+    # Ids are handed out again after a test's rollback, so are cache keys
+    registration_fragments().clear()
+    cache.clear()
+
+
 @pytest.fixture
 def user(db) -> User:
     return UserFactory()
+
+
+@pytest.fixture
+def assert_query_budget():
+    """Call a service method and fail when it runs more queries than its @query_budget."""
+
+    def call(method, *args, **kwargs):
+        with collect_query_stats() as stats:
+            result = method(*args, **kwargs)
+        assert stats.count <= method.query_budget, (
+            f"{method.__qualname__} ran {stats.count} queries, budget {method.query_budget}. "
+            f"Slowest: {stats.slowest_sql}"
+        )
+        return result
+
+    return call
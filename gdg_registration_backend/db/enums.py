@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class TransactionPolicy(Enum):
+    # The whole request in one transaction, as ATOMIC_REQUESTS does
+    ATOMIC = "ATOMIC"
+    # Autocommit, the service opens short atomic blocks around its writes
+    SERVICE = "SERVICE"
+    # Autocommit, and any write fails
+    READ_ONLY = "READ_ONLY"
@@ -0,0 +1,22 @@
+from django.db import models
+
+
+class VersionedModel(models.Model):
+    """
+    Row with a ``version`` that goes up with every write, so anything cached
+    under it, e.g. list fragments, is never served stale. ``save()`` bumps it,
+    ``QuerySet.update()`` and ``bulk_update()`` callers set
+    ``version=F("version") + 1`` themselves.
+    """
+
+    version = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            self.version += 1
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "version"}
+        super().save(*args, **kwargs)
@@ -0,0 +1,112 @@
+"""
+PostgreSQL backend drawing its connections from a psycopg_pool pool.
+
+Django 5.0 opens one connection per thread and keeps it for ``CONN_MAX_AGE``.
+Every new or recycled worker then connects at once, and Postgres sees a storm
+on each redeploy. With this backend each worker process keeps one pool per
+database alias. A request borrows a connection and gives it back when Django
+closes it at the end of the request, so set ``CONN_MAX_AGE`` to 0.
+
+Configure the pool with ``OPTIONS["pool"]``, whose keys are passed to
+``psycopg_pool.ConnectionPool`` (``min_size``, ``max_size``, ``timeout``,
+``max_idle``, ``max_lifetime``...). ``CONN_HEALTH_CHECKS`` checks every
+connection before it is lent out.
+"""
+
+import os
+import threading
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.base.base import NO_DB_ALIAS
+from django.db.backends.postgresql import base as postgresql
+from psycopg_pool import ConnectionPool
+
+# (alias, process id) -> pool. Keyed by process so a worker forked from a
+# parent that already connected never reuses the parent's pool.
+_pools: dict[tuple[str, int], ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def pool_stats() -> dict[str, dict]:
+    """psycopg_pool statistics of this process's pools, by database alias."""
+    pid = os.getpid()
+    return {alias: pool.get_stats() for (alias, pool_pid), pool in list(_pools.items()) if pool_pid == pid}
+
+
+def close_pools(alias: str | None = None) -> None:
+    """Close this process's pools, or the one of ``alias``, e.g. in a worker's exit hook."""
+    pid = os.getpid()
+    with _pools_lock:
+        for key in [key for key in _pools if key[1] == pid and alias in (None, key[0])]:
+            _pools.pop(key).close()
+
+
+class DatabaseWrapper(postgresql.DatabaseWrapper):
+    # Pool the current connection was borrowed from
+    _connection_pool = None
+
+    @property
+    def pool(self) -> ConnectionPool | None:
+        pool_options = self.settings_dict["OPTIONS"].get("pool")
+        # Test database setup connects to the "postgres" database as NO_DB_ALIAS
+        if self.alias == NO_DB_ALIAS or not pool_options:
+            return None
+        if self.settings_dict["CONN_MAX_AGE"] != 0:
+            raise ImproperlyConfigured("Pooled connections need CONN_MAX_AGE = 0.")
+
+        key = (self.alias, os.getpid())
+        pool = _pools.get(key)
+        if pool is None:
+            with _pools_lock:
+                pool = _pools.get(key)
+                if pool is None:
+                    connect_kwargs = self.get_connection_params()
+                    # Django switches autocommit as needed once it has the connection
+                    connect_kwargs["autocommit"] = True
+                    pool = ConnectionPool(
+                        kwargs=connect_kwargs,
+                        check=ConnectionPool.check_connection if self.settings_dict["CONN_HEALTH_CHECKS"] else None,
+                        name=self.alias,
+                        open=True,
+                        **(pool_options if isinstance(pool_options, dict) else {}),
+                    )
+                    _pools[key] = pool
+        return pool
+
+    def get_new_connection(self, conn_params):
+        pool = self.pool
+        if pool is None:
+            return super().get_new_connection(conn_params)
+
+        connection = pool.getconn()
+        self._connection_pool = pool
+        options = self.settings_dict["OPTIONS"]
+        if "isolation_level" in options:
+            try:
+                self.isolation_level = postgresql.IsolationLevel(options["isolation_level"])
+            except ValueError:
+                raise ImproperlyConfigured(
+                    f"Invalid transaction isolation level {options['isolation_level']} "
+                    f"specified. Use one of the psycopg.IsolationLevel values."
+                )
+            connection.isolation_level = self.isolation_level
+        else:
+            self.isolation_level = postgresql.IsolationLevel.READ_COMMITTED
+        return connection
+
+    def get_connection_params(self):
+        params = super().get_connection_params()
+        # Pool options are ours, psycopg.connect() does not know them
+        params.pop("pool", None)
+        return params
+
+    def _close(self):
+        if self.connection is not None and self._connection_pool is not None:
+            with self.wrap_database_errors:
+                # Back to the pool it came from, which rolls back anything left
+                # open, or closed if that pool was closed since
+                self._connection_pool.putconn(self.connection)
+                self.connection = None
+                self._connection_pool = None
+            return None
+        return super()._close()
@@ -0,0 +1,104 @@
+"""
+Per-request SQL instrumentation.
+
+``QueryStatsMiddleware``, on when ``QUERY_STATS`` is set, counts the queries
+of each request, their total time and the slowest statement. It reports them
+in a ``Server-Timing`` header and logs a warning when the view ran more queries
+than its ``query_budget`` attribute allows. Service methods declare theirs
+with ``@query_budget(n)``, which the ``assert_query_budget`` fixture checks.
+
+Savepoints are not counted. ``atomic()`` only issues them inside an outer
+transaction, e.g. a test's, so a budget means the same everywhere. Neither are
+the ``EXPLAIN`` statements of the slow query log, which are not the view's.
+"""
+
+import logging
+import time
+from contextlib import ExitStack
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+UNCOUNTED_STATEMENTS = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT", "EXPLAIN")
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    seconds: float = 0.0
+    slowest_seconds: float = 0.0
+    slowest_sql: str = ""
+
+    def __call__(self, execute, sql, params, many, context):
+        if sql.lstrip().upper().startswith(UNCOUNTED_STATEMENTS):
+            return execute(sql, params, many, context)
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.count += 1
+            self.seconds += elapsed
+            if elapsed >= self.slowest_seconds:
+                self.slowest_seconds = elapsed
+                self.slowest_sql = sql
+
+    def server_timing(self) -> str:
+        return (
+            f'db;dur={self.seconds * 1000:.1f};desc="{self.count} queries", '
+            f"db-slowest;dur={self.slowest_seconds * 1000:.1f}"
+        )
+
+
+@contextmanager
+def collect_query_stats():
+    """Record the queries of the block on every database of this thread."""
+    stats = QueryStats()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(stats))
+        yield stats
+
+
+def query_budget(queries: int):
+    """Declare the most queries a service method may run, whatever the data size."""
+
+    def decorate(func):
+        func.query_budget = queries
+        return func
+
+    return decorate
+
+
+def view_query_budget(view) -> int | None:
+    return getattr(getattr(view, "view_class", view), "query_budget", None)
+
+
+class QueryStatsMiddleware:
+    def __init__(self, get_response):
+        if not settings.QUERY_STATS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with collect_query_stats() as stats:
+            response = self.get_response(request)
+
+        response["Server-Timing"] = stats.server_timing()
+        budget = view_query_budget(request.resolver_match.func) if request.resolver_match else None
+        if budget is not None and stats.count > budget:
+            logger.warning(
+                "%s %s ran %d queries, budget %d. Slowest took %.1f ms: %s",
+                request.method,
+                request.path,
+                stats.count,
+                budget,
+                stats.slowest_seconds * 1000,
+                stats.slowest_sql,
+            )
+        return response
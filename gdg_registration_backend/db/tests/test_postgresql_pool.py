@@ -0,0 +1,84 @@
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.db import OperationalError
+from django.db import connection
+from django.db import connections
+
+from gdg_registration_backend.db.postgresql_pool.base import DatabaseWrapper
+from gdg_registration_backend.db.postgresql_pool.base import close_pools
+from gdg_registration_backend.db.postgresql_pool.base import pool_stats
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(connection.vendor != "postgresql", reason="psycopg pools need Postgres"),
+]
+
+
+@pytest.fixture
+def pooled():
+    """Wrappers of one pooled alias pointing at the test database."""
+    default = connections["default"].settings_dict
+    settings_dict = {
+        **default,
+        "ENGINE": "gdg_registration_backend.db.postgresql_pool",
+        "CONN_MAX_AGE": 0,
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {**default["OPTIONS"], "pool": {"min_size": 1, "max_size": 2, "timeout": 0.5}},
+    }
+    wrappers = []
+
+    def make(**overrides):
+        wrapper = DatabaseWrapper({**settings_dict, **overrides}, alias="pooled")
+        wrappers.append(wrapper)
+        return wrapper
+
+    yield make
+    for wrapper in wrappers:
+        wrapper.close()
+    close_pools("pooled")
+
+
+def backend_pid(wrapper) -> int:
+    with wrapper.cursor() as cursor:
+        cursor.execute("SELECT pg_backend_pid()")
+        return cursor.fetchone()[0]
+
+
+class TestPooledConnections:
+    def test_closed_connections_are_reused(self, pooled):
+        wrapper = pooled()
+
+        pids = set()
+        for _ in range(10):
+            pids.add(backend_pid(wrapper))
+            wrapper.close()
+
+        # At most the pool's own min_size connection plus one opened on demand
+        assert len(pids) <= 2
+        stats = pool_stats()["pooled"]
+        assert (stats["pool_min"], stats["pool_max"]) == (1, 2)
+        assert stats["requests_num"] == 10
+
+    def test_requests_wait_for_a_free_connection(self, pooled):
+        busy = [pooled(), pooled()]
+        for wrapper in busy:
+            backend_pid(wrapper)
+
+        with pytest.raises(OperationalError):
+            backend_pid(pooled())
+
+        busy[0].close()
+        assert backend_pid(pooled()) > 0
+
+    def test_broken_connections_are_replaced(self, pooled):
+        wrapper = pooled()
+        broken = backend_pid(wrapper)
+        with connections["default"].cursor() as cursor:
+            cursor.execute("SELECT pg_terminate_backend(%s)", [broken])
+        wrapper.close()
+
+        assert backend_pid(wrapper) != broken
+
+    def test_needs_conn_max_age_zero(self, pooled):
+        with pytest.raises(ImproperlyConfigured, match="CONN_MAX_AGE"):
+            pooled(CONN_MAX_AGE=60).ensure_connection()
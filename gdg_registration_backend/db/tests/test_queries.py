@@ -0,0 +1,70 @@
+import logging
+
+import pytest
+from django.db import transaction
+from django.urls import reverse
+
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_events.models import Event
+from gdg_registration_backend.apps.gdg_registration.tests.factories import EventRegistrationFactory
+from gdg_registration_backend.apps.gdg_registration.views import GetEventListAPI
+from gdg_registration_backend.db.queries import collect_query_stats
+
+pytestmark = pytest.mark.django_db
+
+WORKSHOP = EventTypes.WORKSHOP.value
+
+
+@pytest.fixture
+def query_stats(settings):
+    # Read when the test client builds its middleware chain, on its first request
+    settings.QUERY_STATS = True
+
+
+class TestCollectQueryStats:
+    def test_counts_and_times_queries(self):
+        with collect_query_stats() as stats:
+            Event.objects.count()
+            list(Event.objects.all())
+
+        assert stats.count == 2
+        assert stats.seconds >= stats.slowest_seconds > 0
+        assert stats.slowest_sql.startswith("SELECT")
+
+    def test_savepoints_are_not_counted(self):
+        with collect_query_stats() as stats, transaction.atomic():
+            Event.objects.count()
+
+        assert stats.count == 1
+
+
+class TestQueryStatsMiddleware:
+    def test_off_by_default(self, client):
+        EventRegistrationFactory()
+
+        response = client.get(reverse("api:events_list"), {"event_type": WORKSHOP})
+
+        assert "Server-Timing" not in response
+
+    def test_server_timing(self, client, query_stats, caplog):
+        EventRegistrationFactory.create_batch(5)
+
+        with caplog.at_level(logging.WARNING, logger="gdg_registration_backend.db.queries"):
+            response = client.get(reverse("api:events_list"), {"event_type": WORKSHOP})
+
+        db, slowest = response["Server-Timing"].split(", ")
+        assert db.startswith("db;dur=")
+        # The event, the page and its entries, none of them cached yet
+        assert db.endswith(';desc="3 queries"')
+        assert slowest.startswith("db-slowest;dur=")
+        assert not caplog.records
+
+    def test_warns_over_budget(self, client, query_stats, caplog, monkeypatch):
+        EventRegistrationFactory()
+        monkeypatch.setattr(GetEventListAPI, "query_budget", 1)
+
+        with caplog.at_level(logging.WARNING, logger="gdg_registration_backend.db.queries"):
+            client.get(reverse("api:events_list"), {"event_type": WORKSHOP})
+
+        [record] = caplog.records
+        assert record.getMessage().startswith(f"GET {reverse('api:events_list')} ran 3 queries, budget 1.")
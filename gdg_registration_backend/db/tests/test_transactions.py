@@ -0,0 +1,157 @@
+import random
+
+import pytest
+from django.db import connection
+from django.db.transaction import TransactionManagementError
+from django.urls import get_resolver
+from django.urls import resolve
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from gdg_registration_backend.apps.gdg_events.enums import EventTypes
+from gdg_registration_backend.apps.gdg_registration.benchmarks.data import registration_payload
+from gdg_registration_backend.apps.gdg_registration.models import EventRegistration
+from gdg_registration_backend.apps.gdg_registration.service import CHECKED_IN
+from gdg_registration_backend.apps.gdg_registration.service import RegistrationService
+from gdg_registration_backend.apps.gdg_registration.tests.factories import EventFactory
+from gdg_registration_backend.apps.gdg_registration.tests.factories import EventRegistrationFactory
+from gdg_registration_backend.apps.gdg_registration.tickets import ticket_token
+from gdg_registration_backend.db.enums import TransactionPolicy
+from gdg_registration_backend.db.transactions import TransactionPolicyMixin
+
+READ_ONLY = TransactionPolicy.READ_ONLY
+SERVICE = TransactionPolicy.SERVICE
+
+# Every API endpoint, with its URL arguments, and the transaction it runs in
+API_POLICIES = {
+    ("events_list", ()): READ_ONLY,
+    ("events_archive", ()): READ_ONLY,
+    ("events_register", ()): SERVICE,
+    ("participants_status_update", ()): SERVICE,
+    ("participants_waitlist_promote", ()): SERVICE,
+    ("participant_ticket", (1,)): READ_ONLY,
+    ("participants_checkin", ()): SERVICE,
+    ("participants_checkin_batch", ()): SERVICE,
+    ("participants_checkin_snapshot", ()): READ_ONLY,
+    ("campaign_progress", (1,)): READ_ONLY,
+    ("job_status", (1,)): READ_ONLY,
+    ("job_cancel", (1,)): SERVICE,
+}
+
+WORKSHOP = EventTypes.WORKSHOP.value
+
+
+def api_url_names():
+    _, api = get_resolver().namespace_dict["api"]
+    return {name for name in api.reverse_dict if isinstance(name, str)}
+
+
+class TestPolicies:
+    def test_every_api_endpoint_declares_its_policy(self):
+        assert api_url_names() == {name for name, _ in API_POLICIES}
+
+    @pytest.mark.parametrize(("endpoint", "policy"), API_POLICIES.items())
+    def test_policy(self, endpoint, policy):
+        name, args = endpoint
+        view = resolve(reverse(f"api:{name}", args=args)).func
+
+        assert view.transaction_policy is policy
+        # ATOMIC_REQUESTS leaves the view alone, no transaction around it
+        assert "default" in view._non_atomic_requests
+
+
+@pytest.mark.django_db(transaction=True)
+class TestTransactions:
+    @pytest.fixture
+    def in_atomic_block(self, monkeypatch):
+        """Whether the named service method was called inside a transaction."""
+        seen = {}
+
+        def record(name):
+            method = getattr(RegistrationService, name)
+
+            def recorded(*args, **kwargs):
+                seen[name] = connection.in_atomic_block
+                return method(*args, **kwargs)
+
+            monkeypatch.setattr(RegistrationService, name, staticmethod(recorded))
+
+        for name in ("get_event_list", "register_event", "check_in"):
+            record(name)
+        return seen
+
+    def test_reads_run_outside_a_transaction(self, client, in_atomic_block):
+        EventRegistrationFactory()
+
+        assert client.get(reverse("api:events_list"), {"event_type": WORKSHOP}).status_code == 200
+        assert in_atomic_block == {"get_event_list": False}
+
+    def test_registration_commits_in_its_own_block(self, client, in_atomic_block, monkeypatch):
+        EventFactory()
+        blocks = []
+        create = EventRegistration.objects.create
+
+        def record_create(**kwargs):
+            blocks.append(connection.in_atomic_block)
+            return create(**kwargs)
+
+        monkeypatch.setattr(EventRegistration.objects, "create", record_create)
+
+        payload = registration_payload(WORKSHOP, 0, random.Random(0), "transactions")
+
+        response = client.post(
+            reverse("api:events_register"), {"event_type": WORKSHOP, **payload}, content_type="application/json",
+        )
+
+        assert response.status_code == 201, response.content
+        assert in_atomic_block == {"register_event": False}
+        assert blocks == [True]
+
+    def test_check_in_commits_in_its_own_block(self, client, admin_user, in_atomic_block, monkeypatch):
+        registration = EventRegistrationFactory(participant_status="CONFIRMED")
+        client.defaults["HTTP_AUTHORIZATION"] = f"Token {Token.objects.create(user=admin_user).key}"
+        blocks = []
+        record_check_ins = RegistrationService._record_check_ins
+
+        def recorded(*args, **kwargs):
+            blocks.append(connection.in_atomic_block)
+            return record_check_ins(*args, **kwargs)
+
+        monkeypatch.setattr(RegistrationService, "_record_check_ins", staticmethod(recorded))
+
+        response = client.post(
+            reverse("api:participants_checkin"),
+            {"token": ticket_token(registration.id, registration.participant_id, registration.event_id)},
+            content_type="application/json",
+        )
+
+        assert response.json()["result"] == CHECKED_IN
+        assert in_atomic_block == {"check_in": False}
+        assert blocks == [True]
+
+
+class WritingView(TransactionPolicyMixin, APIView):
+    transaction_policy = READ_ONLY
+    permission_classes = []
+
+    def get(self, request):
+        EventFactory()
+        return Response({})
+
+
+class ReadingView(WritingView):
+    def get(self, request):
+        return Response({"events": EventRegistration.objects.count()})
+
+
+@pytest.mark.django_db
+class TestReadOnly:
+    def test_rejects_writes(self):
+        with pytest.raises(TransactionManagementError):
+            WritingView.as_view()(APIRequestFactory().get("/"))
+
+    def test_allows_reads(self):
+        assert ReadingView.as_view()(APIRequestFactory().get("/")).data == {"events": 0}
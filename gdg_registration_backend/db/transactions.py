@@ -0,0 +1,61 @@
+"""
+Per-view transaction policy.
+
+``ATOMIC_REQUESTS`` wraps every request in a transaction, which holds a GET's
+snapshot and a bulk update's locks until the view returns. API views declare a
+``transaction_policy`` instead, see ``TransactionPolicy``. Views without one,
+e.g. the admin, keep ``ATOMIC_REQUESTS``.
+"""
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.db import connections
+from django.db import transaction
+from django.db.transaction import TransactionManagementError
+
+from gdg_registration_backend.db.enums import TransactionPolicy
+
+WRITE_STATEMENTS = ("INSERT", "UPDATE", "DELETE", "MERGE", "TRUNCATE")
+
+
+def reject_writes(execute, sql, params, many, context):
+    if sql.lstrip().upper().startswith(WRITE_STATEMENTS):
+        raise TransactionManagementError(f"Write in a read-only view: {sql[:80]}")
+    return execute(sql, params, many, context)
+
+
+class TransactionPolicyMixin:
+    """Mix into an APIView and set ``transaction_policy``."""
+
+    transaction_policy = TransactionPolicy.ATOMIC
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        if cls.transaction_policy is not TransactionPolicy.ATOMIC:
+            for alias in settings.DATABASES:
+                view = transaction.non_atomic_requests(using=alias)(view)
+        view.transaction_policy = cls.transaction_policy
+        return view
+
+    def get_exception_handler(self):
+        handler = super().get_exception_handler()
+        if self.transaction_policy is TransactionPolicy.ATOMIC:
+            return handler
+
+        def keep_callers_transaction(exc, context):
+            # DRF marks any open transaction for rollback on an error response.
+            # This view opened none, one open here belongs to the caller, e.g. a test.
+            needs_rollback = {db.alias: db.needs_rollback for db in connections.all(initialized_only=True)}
+            response = handler(exc, context)
+            for db in connections.all(initialized_only=True):
+                db.needs_rollback = needs_rollback.get(db.alias, db.needs_rollback)
+            return response
+
+        return keep_callers_transaction
+
+    def dispatch(self, request, *args, **kwargs):
+        if self.transaction_policy is TransactionPolicy.READ_ONLY:
+            with connections[DEFAULT_DB_ALIAS].execute_wrapper(reject_writes):
+                return super().dispatch(request, *args, **kwargs)
+        return super().dispatch(request, *args, **kwargs)
@@ -0,0 +1,164 @@
+"""
+Non-blocking, structured logging.
+
+Loggers write to a ``ListenerQueueHandler``, which only puts the record on an
+in-memory queue. A background thread hands it to the real handlers (console,
+file, mail), so a request never waits on stdout, a disk or an SMTP server. The
+queue is bounded and records that do not fit are dropped, counted in the
+``log_records_dropped`` metric.
+
+Filters on the queue handler run in ``Handler.handle()``, on the thread that
+logs, before the record is queued. That is how ``RequestContextFilter`` can
+stamp each record with the request id and view that ``RequestLogMiddleware``
+keeps in a context variable. ``SamplingFilter`` keeps a share of the DEBUG
+records, e.g. every SQL statement when ``DEBUG`` is on. ``JsonFormatter``
+renders one JSON object per line.
+
+The listener thread starts when logging is configured, i.e. in each worker
+process, unless gunicorn preloads the app.
+"""
+
+import copy
+import json
+import logging
+import queue
+import random
+import time
+import uuid
+from contextvars import ContextVar
+from datetime import datetime
+from datetime import timezone
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
+
+from gdg_registration_backend.metrics import LOG_RECORDS_DROPPED
+
+# request_id and view of the request being served, empty outside requests
+_request_context = ContextVar("log_request_context", default={})
+
+REQUEST_ID_HEADER = "HTTP_X_REQUEST_ID"
+# Extras copied into the JSON record when a log call passes them
+EXTRA_FIELDS = ("method", "path", "status", "duration_ms")
+
+request_logger = logging.getLogger("gdg_registration_backend.requests")
+
+
+class _Listener(QueueListener):
+    def enqueue_sentinel(self):
+        # Waits for room, on a full queue put_nowait() would fail the shutdown
+        self.queue.put(self._sentinel)
+
+
+class ListenerQueueHandler(QueueHandler):
+    """
+    Queue in front of ``handlers``, emptied by its own listener thread.
+    In a dictConfig, name the handlers as ``cfg://handlers.<name>``.
+    """
+
+    def __init__(self, handlers, maxsize: int = 10000):
+        super().__init__(queue.Queue(maxsize))
+        self.dropped = 0
+        # dictConfig resolves cfg:// references on item access, not on iteration
+        handlers = [handlers[index] for index in range(len(handlers))]
+        self.listener = _Listener(self.queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+        self.listening = True
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            LOG_RECORDS_DROPPED.inc()
+
+    def close(self):
+        # logging.shutdown() closes handlers at exit, deliver what is still queued
+        if self.listening:
+            self.listening = False
+            self.listener.stop()
+        super().close()
+
+    def prepare(self, record):
+        # The record stays in this process, so it keeps its traceback and
+        # request for the handlers. The message is rendered now, before its
+        # arguments change.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class RequestContextFilter(logging.Filter):
+    def filter(self, record):
+        context = _request_context.get()
+        record.request_id = context.get("request_id", "")
+        record.view = context.get("view", "")
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keep every record above DEBUG and ``rate`` of the DEBUG ones."""
+
+    def __init__(self, rate: float = 1.0):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        return record.levelno > logging.DEBUG or self.rate >= 1 or random.random() < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        data = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", ""),
+            "view": getattr(record, "view", ""),
+            "process": record.process,
+        }
+        for field in EXTRA_FIELDS:
+            if hasattr(record, field):
+                data[field] = getattr(record, field)
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exception"] = record.exc_text
+        return json.dumps(data, default=str)
+
+
+class RequestLogMiddleware:
+    """
+    Give each request an id, from ``X-Request-ID`` when the proxy sets one,
+    for its log records and response, and log one line when it finishes.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request_id = request.META.get(REQUEST_ID_HEADER, "")[:64] or uuid.uuid4().hex
+        token = _request_context.set({"request_id": request_id, "view": ""})
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+            request_logger.info(
+                "%s %s %s",
+                request.method,
+                request.path,
+                response.status_code,
+                extra={
+                    "method": request.method,
+                    "path": request.path,
+                    "status": response.status_code,
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+                },
+            )
+        finally:
+            _request_context.reset(token)
+        response["X-Request-ID"] = request_id
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        _request_context.get()["view"] = request.resolver_match.view_name
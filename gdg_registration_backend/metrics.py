@@ -0,0 +1,145 @@
+"""
+Prometheus metrics, served in the text exposition format at ``/metrics``.
+
+``MetricsMiddleware`` records the latency and status code of every request
+under its URL name, e.g. ``api:events_list``, and the database pool gauges of
+the worker that served it. Registration counts are read from the database
+when Prometheus scrapes.
+
+Under gunicorn, every worker writes its samples to ``PROMETHEUS_MULTIPROC_DIR``
+and a scrape adds them up, whichever worker answers it. The directory has to
+be emptied when the server starts, see ``compose/production/django/start``.
+Without the variable, e.g. under runserver, the metrics are the process's own.
+
+The endpoint is off unless ``METRICS_TOKEN`` is set, which Prometheus then
+sends as a bearer token, or ``DEBUG`` is on.
+"""
+
+import os
+import sys
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count
+from django.http import Http404
+from django.http import HttpResponse
+from django.utils.crypto import constant_time_compare
+from prometheus_client import CONTENT_TYPE_LATEST
+from prometheus_client import REGISTRY
+from prometheus_client import CollectorRegistry
+from prometheus_client import Counter
+from prometheus_client import Gauge
+from prometheus_client import Histogram
+from prometheus_client import generate_latest
+from prometheus_client import multiprocess
+from prometheus_client.core import GaugeMetricFamily
+
+# Loaded only when a database uses the pooled backend
+POOL_BACKEND_MODULE = "gdg_registration_backend.db.postgresql_pool.base"
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time to build the response, by URL name.",
+    ["view", "method"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+RESPONSES = Counter(
+    "http_responses",
+    "Responses by URL name and status code.",
+    ["view", "method", "status"],
+)
+CACHE_LOOKUPS = Counter(
+    "cache_lookups",
+    "Cache lookups by cache and result, hit or miss.",
+    ["cache", "result"],
+)
+LOG_RECORDS_DROPPED = Counter(
+    "log_records_dropped",
+    "Log records dropped because the logging queue was full.",
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Connections of the worker pools by state, total or available.",
+    ["database", "state"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAITING = Gauge(
+    "db_pool_requests_waiting",
+    "Requests waiting for a pooled connection.",
+    ["database"],
+    multiprocess_mode="livesum",
+)
+
+
+def record_cache_lookup(cache: str, hit: bool, count: int = 1) -> None:
+    if count:
+        CACHE_LOOKUPS.labels(cache, "hit" if hit else "miss").inc(count)
+
+
+def update_pool_gauges() -> None:
+    pool_backend = sys.modules.get(POOL_BACKEND_MODULE)
+    if pool_backend is None:
+        return
+    for alias, stats in pool_backend.pool_stats().items():
+        DB_POOL_CONNECTIONS.labels(alias, "total").set(stats.get("pool_size", 0))
+        DB_POOL_CONNECTIONS.labels(alias, "available").set(stats.get("pool_available", 0))
+        DB_POOL_WAITING.labels(alias).set(stats.get("requests_waiting", 0))
+
+
+class RegistrationCollector:
+    """Registrations by event type and participant status, counted at scrape time."""
+
+    def collect(self):
+        # Imported here, models are not ready when this module loads
+        from gdg_registration_backend.apps.gdg_registration.models import EventRegistration
+
+        registrations = GaugeMetricFamily(
+            "registrations", "Live registrations by event type and participant status.",
+            labels=["event_type", "participant_status"],
+        )
+        rows = (
+            EventRegistration.objects.values_list("event__event_type", "participant_status")
+            .annotate(count=Count("id"))
+            .order_by()
+        )
+        for event_type, participant_status, count in rows:
+            registrations.add_metric([event_type, participant_status], count)
+        yield registrations
+
+
+def scrape_registry() -> CollectorRegistry:
+    registry = CollectorRegistry()
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry.register(REGISTRY)
+    registry.register(RegistrationCollector())
+    return registry
+
+
+@transaction.non_atomic_requests
+def metrics_view(request):
+    token = settings.METRICS_TOKEN
+    if not token and not settings.DEBUG:
+        raise Http404
+    if token and not constant_time_compare(request.headers.get("Authorization", ""), f"Bearer {token}"):
+        return HttpResponse(status=401)
+    return HttpResponse(generate_latest(scrape_registry()), content_type=CONTENT_TYPE_LATEST)
+
+
+class MetricsMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        response = self.get_response(request)
+        elapsed = time.perf_counter() - start
+
+        # Unresolved paths share one label so scanners cannot blow up the series
+        view = request.resolver_match.view_name if request.resolver_match else "unresolved"
+        REQUEST_LATENCY.labels(view, request.method).observe(elapsed)
+        RESPONSES.labels(view, request.method, response.status_code).inc()
+        update_pool_gauges()
+        return response
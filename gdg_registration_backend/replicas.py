@@ -0,0 +1,105 @@
+"""
+Routing of organizer reads to the optional read replica.
+
+Set ``DATABASE_REPLICA_URL`` to add a ``replica`` database. Reads go to it only
+inside ``replica_reads()`` blocks, which wrap the heavy organizer traffic that
+tolerates a little replication lag: event lists, the archive and check-in
+exports. Everything else stays on the primary, writes always.
+
+A client that just wrote is pinned to the primary so it reads its own writes:
+for the rest of the request once a write is routed, and for
+``REPLICA_PIN_SECONDS`` after that through a cookie set by
+``PrimaryPinMiddleware``.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+REPLICA_DB_ALIAS = "replica"
+PIN_COOKIE = "primary_pin"
+
+_replica_reads = ContextVar("replica_reads", default=False)
+_pinned = ContextVar("pinned_to_primary", default=False)
+_wrote = ContextVar("wrote_to_primary", default=False)
+
+
+def replica_configured() -> bool:
+    return REPLICA_DB_ALIAS in settings.DATABASES
+
+
+def read_database() -> str:
+    """Database the reads of the current block go to."""
+    if _replica_reads.get() and not _pinned.get() and replica_configured():
+        return REPLICA_DB_ALIAS
+    return DEFAULT_DB_ALIAS
+
+
+@contextmanager
+def replica_reads():
+    """Send the reads of the block, or of the decorated function, to the replica."""
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def pin_to_primary() -> None:
+    _pinned.set(True)
+    _wrote.set(True)
+
+
+@contextmanager
+def pin_scope(pinned: bool = False):
+    """
+    Track the writes of one unit of work, e.g. a request, starting pinned or
+    not. Yields a callable telling whether the block wrote.
+    """
+    tokens = (_pinned.set(pinned), _wrote.set(False))
+    try:
+        yield _wrote.get
+    finally:
+        _pinned.reset(tokens[0])
+        _wrote.reset(tokens[1])
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        return read_database()
+
+    def db_for_write(self, model, **hints):
+        # select_for_update() and get_or_create() come through here as well
+        pin_to_primary()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica follows the primary's schema through replication
+        return db == DEFAULT_DB_ALIAS
+
+
+class PrimaryPinMiddleware:
+    """
+    Keep a client on the primary for ``REPLICA_PIN_SECONDS`` after a request
+    that wrote, so the list it loads next shows its change.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with pin_scope(PIN_COOKIE in request.COOKIES) as wrote:
+            response = self.get_response(request)
+            pin = wrote()
+
+        if pin and replica_configured():
+            response.set_cookie(
+                PIN_COOKIE, "1", max_age=settings.REPLICA_PIN_SECONDS, httponly=True, samesite="Lax",
+            )
+        return response